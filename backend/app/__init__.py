@@ -1,8 +1,10 @@
 from flask import Flask
 from app.config import Config
-from app.extensions import db, migrate, jwt, cors
+from app.extensions import db, migrate, jwt, cors, summary_cache, membership_cache
 from app.utils.responses import error_response
 from app.utils.errors import AppError
+from app.commands import register_commands
+from app.services.request_cache_service import clear_request_cache
 
 # Controllers
 from app.controllers.auth_controller import auth_bp
@@ -12,6 +14,7 @@ from app.controllers.category_controller import category_bp
 from app.controllers.budget_controller import budget_bp
 from app.controllers.health_controller import health_bp
 from app.controllers.ai_controller import ai_bp
+from app.controllers.balance_controller import me_bp
 
 
 
@@ -32,6 +35,13 @@ def create_app():
         supports_credentials=True,
     )
 
+    summary_cache.configure(maxsize=app.config["SUMMARY_CACHE_SIZE"])
+    membership_cache.configure(maxsize=app.config["MEMBERSHIP_CACHE_SIZE"])
+
+    # Request-scoped lookups must not outlive the request, even when an
+    # app context is shared across requests (tests, CLI)
+    app.teardown_request(clear_request_cache)
+
     # -----------------------------
     # Register blueprints
     # -----------------------------
@@ -42,7 +52,12 @@ def create_app():
     app.register_blueprint(budget_bp)
     app.register_blueprint(health_bp)
     app.register_blueprint(ai_bp)
-    
+    app.register_blueprint(me_bp)
+
+    # -----------------------------
+    # CLI commands
+    # -----------------------------
+    register_commands(app)
 
     # -----------------------------
     # Global error handling
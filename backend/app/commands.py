@@ -0,0 +1,87 @@
+import click
+from flask.cli import AppGroup
+
+from app.services.ledger_service import rebuild_ledger, check_ledger
+from app.services.checkpoint_service import build_checkpoints
+from app.services.rollup_service import rebuild_rollups, verify_rollups
+from app.services.search_service import rebuild_search_index
+
+ledger_cli = AppGroup("ledger", help="Maintain the group balance ledger.")
+checkpoints_cli = AppGroup("checkpoints", help="Maintain month-end balance checkpoints.")
+rollups_cli = AppGroup("rollups", help="Maintain monthly spend rollups.")
+search_cli = AppGroup("search", help="Maintain the expense search index.")
+
+
+@ledger_cli.command("rebuild")
+@click.option("--group-id", type=int, default=None, help="Only rebuild this group.")
+def ledger_rebuild(group_id):
+    """Rebuild ledger rows from the full expense history."""
+    count = rebuild_ledger(group_id)
+    click.echo(f"Rebuilt ledger for {count} group(s).")
+
+
+@ledger_cli.command("check")
+@click.option("--group-id", type=int, default=None, help="Only check this group.")
+def ledger_check(group_id):
+    """Compare the ledger against a full recomputation."""
+    mismatches = check_ledger(group_id)
+
+    for m in mismatches:
+        click.echo(
+            f"group={m['group_id']} user={m['user_id']} "
+            f"ledger={m['ledger']} expected={m['expected']}"
+        )
+
+    if mismatches:
+        raise click.ClickException(f"{len(mismatches)} ledger row(s) out of sync")
+
+    click.echo("Ledger is consistent.")
+
+
+@checkpoints_cli.command("build")
+@click.option("--group-id", type=int, default=None, help="Only build this group.")
+def checkpoints_build(group_id):
+    """Snapshot balances for every complete month not yet checkpointed."""
+    count = build_checkpoints(group_id)
+    click.echo(f"Wrote {count} checkpoint month(s).")
+
+
+@rollups_cli.command("rebuild")
+@click.option("--user-id", type=int, default=None, help="Only rebuild this user.")
+def rollups_rebuild(user_id):
+    """Rebuild rollup rows from the full expense history."""
+    count = rebuild_rollups(user_id)
+    click.echo(f"Wrote {count} rollup row(s).")
+
+
+@rollups_cli.command("verify")
+@click.option("--user-id", type=int, default=None, help="Only verify this user.")
+def rollups_verify(user_id):
+    """Compare rollups against a full recomputation."""
+    mismatches = verify_rollups(user_id)
+
+    for m in mismatches:
+        click.echo(
+            f"user={m['user_id']} category={m['category_id']} month={m['month']} "
+            f"rollup={m['rollup']} ({m['rollup_count']}) "
+            f"expected={m['expected']} ({m['expected_count']})"
+        )
+
+    if mismatches:
+        raise click.ClickException(f"{len(mismatches)} rollup row(s) out of sync")
+
+    click.echo("Rollups are consistent.")
+
+
+@search_cli.command("rebuild")
+def search_rebuild():
+    """Recreate the full-text index from the expenses table."""
+    count = rebuild_search_index()
+    click.echo(f"Indexed {count} expense(s).")
+
+
+def register_commands(app):
+    app.cli.add_command(ledger_cli)
+    app.cli.add_command(checkpoints_cli)
+    app.cli.add_command(rollups_cli)
+    app.cli.add_command(search_cli)
@@ -22,6 +22,84 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # -----------------------------
+    # Pagination
+    # -----------------------------
+    DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "50"))
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "200"))
+
+    # Newest expenses included in GET /groups/<id>/dashboard
+    DASHBOARD_EXPENSES = int(os.getenv("DASHBOARD_EXPENSES", "10"))
+
+    # -----------------------------
+    # Balances
+    # -----------------------------
+    # "ledger" reads maintained group_balances rows,
+    # "aggregate" sums expense history in the database
+    BALANCE_SOURCE = os.getenv("BALANCE_SOURCE", "ledger")
+
+    # "greedy" or "optimal" (minimum transfers, falls back to greedy
+    # when the search exceeds its budget)
+    SETTLEMENT_STRATEGY = os.getenv("SETTLEMENT_STRATEGY", "greedy")
+    SETTLEMENT_TIME_BUDGET_MS = int(os.getenv("SETTLEMENT_TIME_BUDGET_MS", "200"))
+    SETTLEMENT_MAX_ITERATIONS = int(os.getenv("SETTLEMENT_MAX_ITERATIONS", "2000000"))
+
+    # -----------------------------
+    # Group members
+    # -----------------------------
+    MEMBER_BULK_MAX_EMAILS = int(os.getenv("MEMBER_BULK_MAX_EMAILS", "1000"))
+
+    # -----------------------------
+    # Expense import
+    # -----------------------------
+    IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "500"))
+    IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "1000"))
+
+    # -----------------------------
+    # Caching
+    # -----------------------------
+    # Max cached /budgets/summary responses per process (0 disables)
+    SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "1024"))
+
+    # Groups whose known member ids are kept per process (0 disables)
+    MEMBERSHIP_CACHE_SIZE = int(os.getenv("MEMBERSHIP_CACHE_SIZE", "4096"))
+
+    # Stored LLM insight responses, keyed by a hash of the request
+    AI_INSIGHT_CACHE_TTL_SECONDS = int(os.getenv("AI_INSIGHT_CACHE_TTL_SECONDS", "86400"))
+    AI_INSIGHT_CACHE_MAX_ENTRIES = int(os.getenv("AI_INSIGHT_CACHE_MAX_ENTRIES", "10000"))
+
+    # -----------------------------
+    # LLM provider
+    # -----------------------------
+    # "openai" or "fake" (deterministic local responses, no network)
+    LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
+    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")  # None = api.openai.com
+    LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    LLM_RETRY_BASE_MS = int(os.getenv("LLM_RETRY_BASE_MS", "250"))
+    LLM_FAKE_LATENCY_MS = int(os.getenv("LLM_FAKE_LATENCY_MS", "0"))
+
+    # -----------------------------
+    # AI prompts
+    # -----------------------------
+    # "llm" (model writes everything), "hybrid" (alerts, good news and
+    # suggestions computed locally, model writes the summary) or "local"
+    # (no model call)
+    AI_INSIGHTS_MODE = os.getenv("AI_INSIGHTS_MODE", "llm")
+
+    # Estimated-token cap for the financial context sent to the model
+    AI_PROMPT_TOKEN_BUDGET = int(os.getenv("AI_PROMPT_TOKEN_BUDGET", "1200"))
+
+    # -----------------------------
+    # AI insight jobs (?async=true)
+    # -----------------------------
+    AI_JOB_WORKERS = int(os.getenv("AI_JOB_WORKERS", "4"))
+    # Jobs a process accepts before answering 503
+    AI_JOB_MAX_PENDING = int(os.getenv("AI_JOB_MAX_PENDING", "64"))
+    # An in-flight job untouched this long is assumed lost and re-run
+    AI_JOB_STALE_SECONDS = int(os.getenv("AI_JOB_STALE_SECONDS", "600"))
+
     # -----------------------------
     # JWT
     # -----------------------------
@@ -1,22 +1,82 @@
-from flask import Blueprint, request
+from flask import Blueprint, Response, request, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
-from app.services.ai_service import generate_ai_insights
+from app.services.ai_service import generate_ai_insights, stream_ai_insights
+from app.services.ai_job_service import submit_insight_job, get_insight_job
+from app.utils.dates import month_bounds
+from app.utils.responses import sse_event
 from app.utils.validators import require_json
 
 ai_bp = Blueprint("ai", __name__, url_prefix="/ai")
 
 
+def _month(body: dict) -> str:
+    month = body["month"]
+    month_bounds(month)  # validates the format
+    return month
+
+
 @ai_bp.post("/insights")
 @jwt_required()
 def insights():
     user_id = int(get_jwt_identity())
     body = request.get_json(silent=True)
     require_json(body, ["month"])
+    month = _month(body)
+    refresh = request.args.get("refresh", "").lower() == "true"
+
+    # Job mode: answer immediately, the client polls GET /ai/insights/<job_id>
+    if request.args.get("async", "").lower() == "true":
+        job = submit_insight_job(
+            user_id=user_id,
+            month=month,
+            refresh=refresh,
+        )
+        return {"data": {"job": job.to_dict()}}, 202
 
     result = generate_ai_insights(
         user_id=user_id,
-        month=body["month"]
+        month=month,
+        refresh=refresh,
     )
 
     return {"data": result}, 200
+
+
+@ai_bp.post("/insights/stream")
+@jwt_required()
+def insights_stream():
+    user_id = int(get_jwt_identity())
+    body = request.get_json(silent=True)
+    require_json(body, ["month"])
+    month = _month(body)
+
+    events = stream_ai_insights(
+        user_id=user_id,
+        month=month,
+        refresh=request.args.get("refresh", "").lower() == "true",
+    )
+
+    def generate():
+        for event, data in events:
+            yield sse_event(event, data)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop nginx from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@ai_bp.get("/insights/<job_id>")
+@jwt_required()
+def insight_job(job_id: str):
+    user_id = int(get_jwt_identity())
+
+    job = get_insight_job(user_id=user_id, job_id=job_id)
+
+    return {"data": {"job": job.to_dict()}}, 200
@@ -0,0 +1,24 @@
+from flask import Blueprint, request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.services.balance_service import compute_user_balances
+from app.utils.responses import success_response
+
+me_bp = Blueprint("me", __name__, url_prefix="/me")
+
+
+@me_bp.get("/balances")
+@jwt_required()
+def balances():
+    user_id = int(get_jwt_identity())
+
+    data = compute_user_balances(
+        user_id=user_id,
+        net_across_groups=request.args.get("net", "").lower() == "true",
+        strategy=request.args.get("strategy"),  # optional greedy|optimal
+    )
+
+    return success_response(
+        data,
+        status=200,
+    )
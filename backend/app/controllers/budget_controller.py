@@ -4,6 +4,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services.budget_service import (
     upsert_monthly_budget,
     monthly_summary,
+    budget_trend,
 )
 from app.utils.validators import require_json
 from app.utils.responses import success_response
@@ -54,3 +55,20 @@ def summary():
         data,
         status=200,
     )
+
+
+@budget_bp.get("/trend")
+@jwt_required()
+def trend():
+    user_id = int(get_jwt_identity())
+
+    data = budget_trend(
+        user_id=user_id,
+        from_month=request.args.get("from"),  # optional YYYY-MM
+        to_month=request.args.get("to"),  # optional YYYY-MM
+    )
+
+    return success_response(
+        data,
+        status=200,
+    )
@@ -1,42 +1,87 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
-from app.models.user import User
-from app.models.category import Category
-from app.models.expense import Expense
 from app.services.expense_service import (
     create_expense_equal_split,
     create_expense_custom_split,
+    list_group_expenses,
+)
+from app.services.expense_import_service import (
+    import_expenses,
+    iter_csv_rows,
+    iter_ndjson_rows,
 )
 from app.services.balance_service import compute_group_settlements
-from app.utils.validators import require_json
+from app.services.search_service import search_group_expenses
+from app.utils.validators import require_json, optional_int
+from app.utils.errors import AppError
+from app.utils.pagination import page_limit
+from app.utils.dates import start_of_day, end_of_day
 from app.utils.responses import success_response
 
 expense_bp = Blueprint("expenses", __name__, url_prefix="/groups/<int:group_id>")
 
 
-def _expense_to_dict(expense: Expense):
-    paid_by = User.query.get(expense.paid_by_user_id)
-    category = Category.query.get(expense.category_id) if expense.category_id else None
-
-    return {
-        "id": expense.id,
-        "group_id": expense.group_id,
-        "amount": float(expense.amount),
-        "description": expense.description,
-        "paid_by": {
-            "id": paid_by.id,
-            "email": paid_by.email,
-        } if paid_by else None,
-        "category": (
-            {
-                "id": category.id,
-                "name": category.name,
-            }
-            if category else None
-        ),
-        "created_at": expense.created_at.isoformat(),
-    }
+@expense_bp.get("/expenses")
+@jwt_required()
+def list_expenses(group_id: int):
+    user_id = int(get_jwt_identity())
+    args = request.args
+
+    rows, next_cursor = list_group_expenses(
+        group_id=group_id,
+        requester_user_id=user_id,
+        limit=page_limit(args.get("limit")),
+        cursor=args.get("cursor"),
+        category_id=optional_int(args.get("category_id"), "category_id"),
+        paid_by_user_id=optional_int(args.get("paid_by_user_id"), "paid_by_user_id"),
+        created_from=start_of_day(args["from"], "from") if args.get("from") else None,
+        created_to=end_of_day(args["to"], "to") if args.get("to") else None,
+    )
+
+    return success_response(
+        {
+            "expenses": [
+                expense.to_public_dict(paid_by, category)
+                for expense, paid_by, category in rows
+            ],
+            "next_cursor": next_cursor,
+        },
+        status=200,
+    )
+
+
+@expense_bp.get("/expenses/search")
+@jwt_required()
+def search_expenses(group_id: int):
+    user_id = int(get_jwt_identity())
+    query = request.args.get("q", "").strip()
+    if not query:
+        raise AppError(
+            "Missing required fields",
+            400,
+            code="VALIDATION_ERROR",
+            details={"missing": ["q"]},
+        )
+
+    rows, next_cursor = search_group_expenses(
+        group_id=group_id,
+        requester_user_id=user_id,
+        query=query,
+        limit=page_limit(request.args.get("limit")),
+        cursor=request.args.get("cursor"),
+    )
+
+    return success_response(
+        {
+            "expenses": [
+                expense.to_public_dict(paid_by, category)
+                for expense, paid_by, category in rows
+            ],
+            "next_cursor": next_cursor,
+        },
+        status=200,
+    )
 
 
 @expense_bp.post("/expenses")
@@ -56,7 +101,7 @@ def create_expense(group_id: int):
     )
 
     return success_response(
-        {"expense": _expense_to_dict(expense)},
+        {"expense": expense.to_public_dict()},
         status=201,
     )
 
@@ -79,11 +124,44 @@ def create_expense_custom(group_id: int):
     )
 
     return success_response(
-        {"expense": _expense_to_dict(expense)},
+        {"expense": expense.to_public_dict()},
         status=201,
     )
 
 
+@expense_bp.post("/expenses/import")
+@jwt_required()
+def import_expense_rows(group_id: int):
+    """
+    Streams CSV (text/csv, with header) or NDJSON (application/x-ndjson).
+    Fields: paid_by_email, amount, description, category_id, date;
+    NDJSON rows may also carry custom `splits`.
+    """
+    user_id = int(get_jwt_identity())
+
+    if request.mimetype == "text/csv":
+        rows = iter_csv_rows(request.stream)
+    elif request.mimetype in ("application/x-ndjson", "application/ndjson"):
+        rows = iter_ndjson_rows(request.stream)
+    else:
+        raise AppError(
+            "Content-Type must be text/csv or application/x-ndjson",
+            415,
+            code="UNSUPPORTED_MEDIA_TYPE",
+        )
+
+    result = import_expenses(
+        group_id=group_id,
+        requester_user_id=user_id,
+        rows=rows,
+    )
+
+    return success_response(
+        result,
+        status=200,
+    )
+
+
 @expense_bp.get("/balances")
 @jwt_required()
 def balances(group_id: int):
@@ -92,6 +170,8 @@ def balances(group_id: int):
     settlements = compute_group_settlements(
         group_id=group_id,
         requester_user_id=user_id,
+        strategy=request.args.get("strategy"),  # optional greedy|optimal
+        as_of=request.args.get("as_of"),  # optional YYYY-MM-DD
     )
 
     return success_response(
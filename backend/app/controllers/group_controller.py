@@ -1,13 +1,17 @@
-from flask import Blueprint, request
+from flask import Blueprint, current_app, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.services.group_service import (
     create_group,
     list_groups_for_user,
     add_member_by_email,
+    add_members_by_email,
 )
+from app.services.dashboard_service import group_dashboard
 from app.models.group import Group
-from app.utils.validators import require_json
+from app.utils.validators import require_json, optional_int
+from app.utils.pagination import page_limit
+from app.utils.errors import AppError
 from app.utils.responses import success_response
 
 group_bp = Blueprint("groups", __name__, url_prefix="/groups")
@@ -19,38 +23,32 @@ def _group_to_dict(group: Group):
         "name": group.name,
         "created_by_user_id": group.created_by_user_id,
         "created_at": group.created_at.isoformat(),
+        "member_count": group.member_count,
+        "expense_count": group.expense_count,
+        "expense_total": float(group.expense_total),
     }
 
 
 @group_bp.get("")
 @jwt_required()
 def list_groups():
-    print("🔥 HIT /groups controller")
     user_id = int(get_jwt_identity())
 
-    rows = list_groups_for_user(user_id)
-    print("ROWS =", rows)
+    groups, next_cursor = list_groups_for_user(
+        user_id,
+        limit=page_limit(request.args.get("limit")),
+        cursor=request.args.get("cursor"),
+    )
 
     return success_response(
         {
-            "groups": [
-                {
-                    "id": row["group"].id,
-                    "name": row["group"].name,
-                    "created_by_user_id": row["group"].created_by_user_id,
-                    "created_at": row["group"].created_at.isoformat(),
-                    "member_count": row["member_count"],
-                }
-                for row in rows
-            ]
+            "groups": [_group_to_dict(group) for group in groups],
+            "next_cursor": next_cursor,
         },
         status=200,
     )
 
 
-
-
-
 @group_bp.post("")
 @jwt_required()
 def create():
@@ -94,3 +92,70 @@ def add_member(group_id: int):
         },
         status=201,
     )
+
+
+@group_bp.post("/<int:group_id>/members/bulk")
+@jwt_required()
+def add_members_bulk(group_id: int):
+    user_id = int(get_jwt_identity())
+    body = request.get_json(silent=True)
+    require_json(body, ["emails"])
+
+    results = add_members_by_email(
+        group_id=group_id,
+        requester_user_id=user_id,
+        emails=body["emails"],
+    )
+
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+
+    return success_response(
+        {
+            "results": results,
+            "added": counts.get("added", 0),
+            "already_member": counts.get("already_member", 0),
+            "not_found": counts.get("not_found", 0),
+            "invalid": counts.get("invalid", 0),
+        },
+        status=200,
+    )
+
+
+@group_bp.get("/<int:group_id>/dashboard")
+@jwt_required()
+def dashboard(group_id: int):
+    """
+    Group page in one request: group, members with balances,
+    settlements and the newest expenses (?expenses=N, default
+    DASHBOARD_EXPENSES, at most MAX_PAGE_SIZE).
+    """
+    user_id = int(get_jwt_identity())
+
+    expense_limit = optional_int(request.args.get("expenses"), "expenses")
+    if expense_limit is None:
+        expense_limit = current_app.config["DASHBOARD_EXPENSES"]
+    if expense_limit < 1:
+        raise AppError("expenses must be >= 1", 400)
+    expense_limit = min(expense_limit, current_app.config["MAX_PAGE_SIZE"])
+
+    result = group_dashboard(
+        group_id=group_id,
+        requester_user_id=user_id,
+        expense_limit=expense_limit,
+    )
+
+    return success_response(
+        {
+            "group": _group_to_dict(result["group"]),
+            "members": result["members"],
+            "settlements": result["settlements"],
+            "expenses": [
+                expense.to_public_dict(paid_by, category)
+                for expense, paid_by, category in result["expenses"]
+            ],
+            "next_cursor": result["next_cursor"],
+        },
+        status=200,
+    )
@@ -1,5 +1,7 @@
 from flask import Blueprint, current_app
 
+from app.extensions import summary_cache
+from app.services.membership_cache_service import membership_cache_stats
 from app.utils.responses import success_response
 
 health_bp = Blueprint("health", __name__, url_prefix="/health")
@@ -11,6 +13,10 @@ def health():
         {
             "status": "ok",
             "app": current_app.config.get("APP_NAME", "BudgetGPT"),
+            "caches": {
+                "budget_summary": summary_cache.stats(),
+                "membership": membership_cache_stats(),
+            },
         },
         status=200,
     )
@@ -3,7 +3,15 @@ from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 
+from app.utils.cache import LRUCache
+
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
 cors = CORS()
+
+# Monthly budget summaries keyed by (user_id, month, data_version)
+summary_cache = LRUCache()
+
+# Known member user ids by group_id (members are only ever added)
+membership_cache = LRUCache()
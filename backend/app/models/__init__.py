@@ -5,3 +5,8 @@ from .expense import Expense  # noqa: F401
 from .expense_split import ExpenseSplit  # noqa: F401
 from .category import Category  # noqa: F401
 from .monthly_budget import MonthlyBudget  # noqa: F401
+from .group_balance import GroupBalance  # noqa: F401
+from .group_balance_checkpoint import GroupBalanceCheckpoint  # noqa: F401
+from .monthly_spend_rollup import MonthlySpendRollup  # noqa: F401
+from .ai_insight_cache import AiInsightCache  # noqa: F401
+from .ai_insight_job import AiInsightJob  # noqa: F401
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+from app.extensions import db
+
+
+class AiInsightCache(db.Model):
+    """
+    Parsed LLM insight responses keyed by a hash of the exact request
+    (model, system prompt and canonical context), so identical data never
+    pays for a second completion.
+    """
+    __tablename__ = "ai_insight_cache"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # sha256 hex digest of the canonical request
+    context_hash = db.Column(db.String(64), nullable=False, unique=True, index=True)
+
+    # Insight JSON as returned to the client
+    payload = db.Column(db.Text, nullable=False)
+
+    created_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    last_used_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True,
+    )
@@ -0,0 +1,77 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from app.extensions import db
+
+
+class AiInsightJob(db.Model):
+    """
+    One background /ai/insights request. Persisted so clients can poll
+    it from any worker and so unfinished jobs can be picked up again
+    after a restart.
+    """
+    __tablename__ = "ai_insight_jobs"
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+
+    id = db.Column(
+        db.String(32),
+        primary_key=True,
+        default=lambda: uuid.uuid4().hex,
+    )
+
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    month = db.Column(db.String(7), nullable=False)
+    refresh = db.Column(db.Boolean, nullable=False, default=False)
+
+    status = db.Column(db.String(16), nullable=False, default=STATUS_QUEUED)
+
+    # Insight JSON on success, error message on failure
+    result = db.Column(db.Text)
+    error = db.Column(db.String(255))
+
+    created_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    # Last time a worker claimed or finished the job
+    updated_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Finding an in-flight job for the same user and month
+        db.Index("ix_ai_insight_jobs_user_month_status", "user_id", "month", "status"),
+        # At most one queued or running job per user, month and refresh
+        # flag, across every process
+        db.Index(
+            "uq_ai_insight_jobs_in_flight",
+            "user_id",
+            "month",
+            "refresh",
+            unique=True,
+            sqlite_where=db.text("status IN ('queued', 'running')"),
+            postgresql_where=db.text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "month": self.month,
+            "status": self.status,
+            "result": json.loads(self.result) if self.result else None,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
@@ -1,5 +1,13 @@
 from datetime import datetime, timezone
 from app.extensions import db
+from app.models.user import User
+from app.models.category import Category
+from app.utils.dates import month_of
+
+
+def _month_bucket_default(context):
+    created_at = context.get_current_parameters().get("created_at")
+    return month_of(created_at or datetime.now(timezone.utc))
 
 
 class Expense(db.Model):
@@ -34,6 +42,31 @@ class Expense(db.Model):
         nullable=False,
     )
 
+    # "YYYY-MM" of created_at, stored so month filters are plain
+    # equality on an indexed column
+    month_bucket = db.Column(
+        db.String(7),
+        default=_month_bucket_default,
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Keyset pagination of a group's expenses, newest first
+        db.Index(
+            "ix_expenses_group_created_id",
+            "group_id",
+            "created_at",
+            "id",
+        ),
+        # Per-user monthly spend, optionally by category
+        db.Index(
+            "ix_expenses_payer_month_category",
+            "paid_by_user_id",
+            "month_bucket",
+            "category_id",
+        ),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -44,3 +77,36 @@ class Expense(db.Model):
             "category_id": self.category_id,
             "created_at": self.created_at.isoformat(),
         }
+
+    def to_public_dict(
+        self,
+        paid_by: User | None = None,
+        category: Category | None = None,
+    ):
+        """
+        API shape with the payer and category inlined. Listings pass
+        joined rows; otherwise they are looked up.
+        """
+        if paid_by is None:
+            paid_by = db.session.get(User, self.paid_by_user_id)
+        if category is None and self.category_id:
+            category = db.session.get(Category, self.category_id)
+
+        return {
+            "id": self.id,
+            "group_id": self.group_id,
+            "amount": float(self.amount),
+            "description": self.description,
+            "paid_by": {
+                "id": paid_by.id,
+                "email": paid_by.email,
+            } if paid_by else None,
+            "category": (
+                {
+                    "id": category.id,
+                    "name": category.name,
+                }
+                if category else None
+            ),
+            "created_at": self.created_at.isoformat(),
+        }
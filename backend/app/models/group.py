@@ -22,10 +22,18 @@ class Group(db.Model):
         nullable=False,
     )
 
+    # Maintained by the group, expense and import services
+    member_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    expense_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    expense_total = db.Column(db.Numeric(12, 2), nullable=False, default=0, server_default="0")
+
     def to_dict(self):
         return {
             "id": self.id,
             "name": self.name,
             "created_by_user_id": self.created_by_user_id,
             "created_at": self.created_at.isoformat(),
+            "member_count": self.member_count,
+            "expense_count": self.expense_count,
+            "expense_total": float(self.expense_total),
         }
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from app.extensions import db
+
+
+class GroupBalance(db.Model):
+    """
+    Running "paid - owed" ledger per group member.
+
+    Maintained by the expense services in the same transaction as the
+    expense itself, so balances can be read without replaying history.
+    """
+    __tablename__ = "group_balances"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    group_id = db.Column(
+        db.Integer,
+        db.ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    net_amount = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+
+    updated_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "group_id",
+            "user_id",
+            name="uq_group_balances_group_user",
+        ),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "group_id": self.group_id,
+            "user_id": self.user_id,
+            "net_amount": float(self.net_amount),
+        }
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+from app.extensions import db
+
+
+class GroupBalanceCheckpoint(db.Model):
+    """
+    Snapshot of a member's net balance (paid - owed) at the end of a month.
+
+    Lets "balance as of date" queries and history-based recomputation
+    start from the nearest month boundary instead of the first expense.
+    """
+    __tablename__ = "group_balance_checkpoints"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    group_id = db.Column(
+        db.Integer,
+        db.ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # "YYYY-MM": balance including every expense created before the
+    # first day of the following month
+    month = db.Column(db.String(7), nullable=False)
+
+    net_amount = db.Column(db.Numeric(12, 2), nullable=False)
+
+    created_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "group_id",
+            "month",
+            "user_id",
+            name="uq_group_balance_checkpoints_group_month_user",
+        ),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "group_id": self.group_id,
+            "user_id": self.user_id,
+            "month": self.month,
+            "net_amount": float(self.net_amount),
+        }
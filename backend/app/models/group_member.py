@@ -25,6 +25,8 @@ class GroupMember(db.Model):
             "user_id",
             name="uq_group_members_group_user",
         ),
+        # A user's groups, newest first, as one range scan (group listing)
+        db.Index("ix_group_members_user_group", "user_id", "group_id"),
     )
 
     def to_dict(self):
@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+from app.extensions import db
+
+
+class MonthlySpendRollup(db.Model):
+    """
+    Running total of what a user paid per category and month.
+
+    Kept in step with expenses by the expense services so the monthly
+    summary reads one row per category instead of every expense.
+    category_id is NULL for uncategorized spend.
+    """
+    __tablename__ = "monthly_spend_rollups"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    category_id = db.Column(
+        db.Integer,
+        db.ForeignKey("categories.id", ondelete="SET NULL"),
+    )
+
+    # "YYYY-MM" of the expense's created_at
+    month = db.Column(db.String(7), nullable=False)
+
+    total_amount = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    expense_count = db.Column(db.Integer, nullable=False, default=0)
+
+    updated_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "category_id": self.category_id,
+            "month": self.month,
+            "total_amount": float(self.total_amount),
+            "expense_count": self.expense_count,
+        }
+
+
+# One row per (user, month, category). NULLs never compare equal in a
+# plain unique constraint, so uncategorized spend is keyed as category 0.
+ROLLUP_KEY = (
+    MonthlySpendRollup.user_id,
+    MonthlySpendRollup.month,
+    db.func.coalesce(MonthlySpendRollup.category_id, db.literal_column("0")),
+)
+
+db.Index("uq_monthly_spend_rollups_user_month_category", *ROLLUP_KEY, unique=True)
@@ -24,6 +24,15 @@ class User(db.Model):
     provider = db.Column(db.String(40))          # e.g. "google"
     provider_user_id = db.Column(db.String(255))
 
+    # Bumped whenever the user's expenses, budgets or categories change;
+    # part of every cache key for data derived from them
+    data_version = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
     created_at = db.Column(
         db.DateTime,
         default=lambda: datetime.now(timezone.utc),
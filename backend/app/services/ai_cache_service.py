@@ -0,0 +1,94 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from sqlalchemy import func
+
+from app.extensions import db
+from app.models.ai_insight_cache import AiInsightCache
+from app.utils.upsert import dialect_insert
+
+
+def context_hash(*parts) -> str:
+    """
+    sha256 of the canonical JSON encoding of `parts`: keys sorted and no
+    insignificant whitespace, so equal data always hashes the same.
+    """
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _now() -> datetime:
+    # SQLite returns naive datetimes; compare in naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def get_cached_insights(key: str) -> dict | None:
+    """Return the cached insights for `key` unless missing or expired."""
+    ttl = current_app.config["AI_INSIGHT_CACHE_TTL_SECONDS"]
+
+    entry = AiInsightCache.query.filter_by(context_hash=key).first()
+    if entry is None:
+        return None
+
+    now = _now()
+    if entry.created_at < now - timedelta(seconds=ttl):
+        return None
+
+    entry.last_used_at = now
+    db.session.commit()
+    return json.loads(entry.payload)
+
+
+def store_insights(key: str, insights: dict) -> None:
+    """
+    Save insights under `key` (one upsert, replacing any expired entry).
+    Once the table is over the size cap, expired entries and then the
+    least recently used ones are evicted.
+    """
+    now = _now()
+
+    stmt = dialect_insert(AiInsightCache)
+    db.session.execute(
+        stmt.values(
+            context_hash=key,
+            payload=json.dumps(insights),
+            created_at=now,
+            last_used_at=now,
+        ).on_conflict_do_update(
+            index_elements=[AiInsightCache.context_hash],
+            set_={
+                "payload": stmt.excluded.payload,
+                "created_at": stmt.excluded.created_at,
+                "last_used_at": stmt.excluded.last_used_at,
+            },
+        )
+    )
+
+    _evict(now)
+    db.session.commit()
+
+
+def _evict(now: datetime) -> None:
+    max_entries = current_app.config["AI_INSIGHT_CACHE_MAX_ENTRIES"]
+
+    excess = db.session.query(func.count(AiInsightCache.id)).scalar() - max_entries
+    if excess <= 0:
+        return
+
+    ttl = current_app.config["AI_INSIGHT_CACHE_TTL_SECONDS"]
+    excess -= AiInsightCache.query.filter(
+        AiInsightCache.created_at < now - timedelta(seconds=ttl)
+    ).delete(synchronize_session=False)
+    if excess <= 0:
+        return
+
+    oldest = (
+        db.session.query(AiInsightCache.id)
+        .order_by(AiInsightCache.last_used_at, AiInsightCache.id)
+        .limit(excess)
+    )
+    AiInsightCache.query.filter(AiInsightCache.id.in_(oldest.scalar_subquery())).delete(
+        synchronize_session=False
+    )
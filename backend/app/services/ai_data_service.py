@@ -1,12 +1,12 @@
-from decimal import Decimal
-from datetime import datetime
+from sqlalchemy import func
 
 from app.extensions import db
 from app.models.expense import Expense
 from app.models.monthly_budget import MonthlyBudget
 from app.models.category import Category
-from app.services.balance_service import compute_group_settlements
-from app.services.group_service import list_groups_for_user
+from app.services.balance_service import compute_user_balances
+from app.services.ledger_service import cents_column
+from app.utils.money import cents_to_float
 
 
 def get_monthly_ai_context(user_id: int, month: str):
@@ -34,36 +34,37 @@ def get_monthly_ai_context(user_id: int, month: str):
     }
 
     # ---------- Expenses ----------
-    expenses = (
-        Expense.query
+    spend_by_category = (
+        db.session.query(
+            Expense.category_id,
+            func.sum(cents_column(Expense.amount)),
+        )
         .filter(Expense.paid_by_user_id == user_id)
-        .filter(Expense.created_at.like(f"{month}%"))
+        .filter(Expense.month_bucket == month)
+        .group_by(Expense.category_id)
         .all()
     )
 
-    total_spent = Decimal("0.00")
+    total_cents = 0
 
-    for e in expenses:
-        amt = Decimal(str(e.amount))
-        total_spent += amt
+    for category_id, cents in spend_by_category:
+        total_cents += int(cents)
 
-        if e.category_id in budget_map:
-            budget_map[e.category_id]["spent"] += float(amt)
+        if category_id in budget_map:
+            budget_map[category_id]["spent"] = cents_to_float(int(cents))
 
     categories = list(budget_map.values())
 
     # ---------- Group Balances ----------
-    groups = list_groups_for_user(user_id)
+    balances = compute_user_balances(user_id)
     settlements = []
 
-    for g in groups:
-        group = g["group"]
-        balances = compute_group_settlements(group.id, user_id)
-        settlements.extend(balances)
+    for g in balances["groups"]:
+        settlements.extend(g["settlements"])
 
     return {
         "month": month,
-        "total_spent": float(total_spent),
+        "total_spent": cents_to_float(total_cents),
         "categories": categories,
         "group_balances": settlements,
     }
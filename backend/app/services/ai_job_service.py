@@ -0,0 +1,203 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models.ai_insight_job import AiInsightJob
+from app.services.ai_service import generate_ai_insights
+from app.utils.dates import month_bounds
+from app.utils.errors import AppError
+
+_IN_FLIGHT = (AiInsightJob.STATUS_QUEUED, AiInsightJob.STATUS_RUNNING)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# Coalescing check + insert, and the count of jobs handed to the executor
+_submit_lock = threading.Lock()
+_pending = 0
+
+
+def _now() -> datetime:
+    # SQLite returns naive datetimes; compare in naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=current_app.config["AI_JOB_WORKERS"],
+                thread_name_prefix="ai-insights",
+            )
+        return _executor
+
+
+# =========================
+# Worker
+# =========================
+
+def _finish(job: AiInsightJob, status: str, result=None, error: str | None = None) -> None:
+    job.status = status
+    job.result = json.dumps(result) if result is not None else None
+    job.error = error
+    job.updated_at = _now()
+    db.session.commit()
+
+
+def _run_job(app, job_id: str) -> None:
+    global _pending
+
+    try:
+        with app.app_context():
+            job = db.session.get(AiInsightJob, job_id)
+            if job is None or job.status not in _IN_FLIGHT:
+                return
+
+            job.status = AiInsightJob.STATUS_RUNNING
+            job.updated_at = _now()
+            db.session.commit()
+
+            try:
+                insights = generate_ai_insights(job.user_id, job.month, refresh=job.refresh)
+            except AppError as err:
+                db.session.rollback()
+                _finish(job, AiInsightJob.STATUS_FAILED, error=err.message)
+            except Exception:
+                db.session.rollback()
+                app.logger.exception("AI insight job %s failed", job_id)
+                _finish(job, AiInsightJob.STATUS_FAILED, error="AI insights failed")
+            else:
+                _finish(job, AiInsightJob.STATUS_SUCCEEDED, result=insights)
+            finally:
+                db.session.remove()
+    finally:
+        with _submit_lock:
+            _pending -= 1
+
+
+def _enqueue(job_id: str) -> None:
+    """Hand a job to this process's executor. Caller holds _submit_lock."""
+    global _pending
+
+    if _pending >= current_app.config["AI_JOB_MAX_PENDING"]:
+        raise AppError(
+            "Too many AI insight jobs in progress, try again shortly",
+            503,
+            code="SERVICE_UNAVAILABLE",
+        )
+
+    _pending += 1
+    _get_executor().submit(_run_job, current_app._get_current_object(), job_id)
+
+
+# =========================
+# API
+# =========================
+
+def submit_insight_job(user_id: int, month: str, refresh: bool = False) -> AiInsightJob:
+    """
+    Queue insights for (user, month) and return the job.
+
+    A job already queued or running for the same user and month is
+    returned instead of starting a second one. A `refresh` request only
+    joins a job that will not read the cache: a refresh job, or a queued
+    one it upgrades to a refresh; behind a running plain job it gets a
+    refresh job of its own. The uq_ai_insight_jobs_in_flight index keeps
+    this true across processes, not just within this one.
+    """
+    month_bounds(month)  # validates the format
+
+    with _submit_lock:
+        while True:
+            try:
+                job = _join_in_flight(user_id, month, refresh)
+                if job is not None:
+                    return job
+
+                job = AiInsightJob(user_id=user_id, month=month, refresh=refresh)
+                db.session.add(job)
+                db.session.commit()
+            except IntegrityError:
+                # Another process queued or upgraded a job first; join it
+                db.session.rollback()
+                continue
+
+            try:
+                _enqueue(job.id)
+            except AppError as err:
+                _finish(job, AiInsightJob.STATUS_FAILED, error=err.message)
+                raise
+            return job
+
+
+def _join_in_flight(user_id: int, month: str, refresh: bool) -> AiInsightJob | None:
+    """An in-flight job that satisfies the request. Caller holds _submit_lock."""
+    jobs = (
+        AiInsightJob.query
+        .filter_by(user_id=user_id, month=month)
+        .filter(AiInsightJob.status.in_(_IN_FLIGHT))
+        .all()
+    )
+
+    # A refresh job answers plain requests too, so try it first
+    for job in sorted(jobs, key=lambda j: not j.refresh):
+        if _is_stale(job):
+            _requeue(job)
+        if refresh and not job.refresh and not _upgrade_to_refresh(job):
+            continue
+        return job
+
+    return None
+
+
+def _upgrade_to_refresh(job: AiInsightJob) -> bool:
+    """
+    Make a queued job skip the cache. False once a worker has started it,
+    since it may already have read the cached response.
+    """
+    updated = (
+        AiInsightJob.query
+        .filter_by(id=job.id, status=AiInsightJob.STATUS_QUEUED)
+        .update({"refresh": True}, synchronize_session=False)
+    )
+    db.session.commit()
+    return updated == 1
+
+
+def _is_stale(job: AiInsightJob) -> bool:
+    """
+    An in-flight job nobody has touched for AI_JOB_STALE_SECONDS was lost,
+    e.g. its worker process restarted.
+    """
+    stale_after = timedelta(seconds=current_app.config["AI_JOB_STALE_SECONDS"])
+    return job.status in _IN_FLIGHT and job.updated_at < _now() - stale_after
+
+
+def _requeue(job: AiInsightJob) -> None:
+    """Claim a stale job for this process. Caller holds _submit_lock."""
+    job.status = AiInsightJob.STATUS_QUEUED
+    job.updated_at = _now()
+    db.session.commit()
+    _enqueue(job.id)
+
+
+def get_insight_job(user_id: int, job_id: str) -> AiInsightJob:
+    """
+    Return the caller's job. A stale in-flight job is queued again in this
+    process so polling clients always make progress.
+    """
+    job = db.session.get(AiInsightJob, job_id)
+    if job is None or job.user_id != user_id:
+        raise AppError("Job not found", 404, code="NOT_FOUND")
+
+    if _is_stale(job):
+        with _submit_lock:
+            _requeue(job)
+
+    return job
@@ -0,0 +1,123 @@
+import json
+import math
+
+# Legend sent with every encoded context so the model can read the short keys
+CONTEXT_LEGEND = (
+    "m=month, spent=total you paid, "
+    "cats=[category, limit, spent] (budgeted categories, most over budget first), "
+    "bal=[counterparty, amount] (positive: they owe you, negative: you owe them; "
+    "largest first), "
+    "more=entries left out to fit the prompt"
+)
+
+# Rough size of English/JSON text for OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _amount(value: float) -> float | int:
+    """Whole units from 100 up, cents below; enough for advice, fewer tokens."""
+    if abs(value) >= 100:
+        return int(round(value))
+    rounded = round(value, 2)
+    return int(rounded) if rounded == int(rounded) else rounded
+
+
+def order_categories(categories: list[dict]) -> list[dict]:
+    """
+    Most over budget first, then biggest spend; name breaks ties. The
+    prompt and the rule-based insights list categories in this order.
+    """
+    return sorted(
+        categories,
+        key=lambda c: (-(c["spent"] - c["limit"]), -c["spent"], c["category"]),
+    )
+
+
+def _category_rows(categories: list[dict]) -> list[list]:
+    return [
+        [c["category"], _amount(c["limit"]), _amount(c["spent"])]
+        for c in order_categories(categories)
+    ]
+
+
+def net_counterparty_amounts(settlements: list[dict], user_id: int) -> dict[str, float]:
+    """
+    Net what each counterparty owes the user across all groups (negative:
+    the user owes them). Transfers between other members are not the
+    user's to act on and are dropped.
+    """
+    net: dict[str, float] = {}
+
+    for s in settlements:
+        if s["to_user_id"] == user_id:
+            other, amount = s.get("from_email") or f"user {s['from_user_id']}", s["amount"]
+        elif s["from_user_id"] == user_id:
+            other, amount = s.get("to_email") or f"user {s['to_user_id']}", -s["amount"]
+        else:
+            continue
+        net[other] = net.get(other, 0.0) + amount
+
+    return {other: amount for other, amount in net.items() if round(amount, 2)}
+
+
+def _counterparty_rows(settlements: list[dict], user_id: int) -> list[list]:
+    net = net_counterparty_amounts(settlements, user_id)
+    rows = [[other, _amount(amount)] for other, amount in net.items()]
+    rows.sort(key=lambda r: (-abs(r[1]), r[0]))
+    return rows
+
+
+def _encode(payload: dict) -> str:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def encode_ai_context(data: dict, user_id: int, token_budget: int) -> tuple[str, dict]:
+    """
+    Compact, deterministic encoding of get_monthly_ai_context output.
+
+    Short keys, no whitespace, rounded amounts, and settlements reduced to
+    one net amount per counterparty. If the result is still over
+    `token_budget` (estimated), the lowest-priority entries are dropped:
+    smallest counterparties first, then the least pressing categories.
+    The counts of dropped entries are kept under "more".
+
+    Returns (encoded text, stats for logging).
+    """
+    cats = _category_rows(data["categories"])
+    bal = _counterparty_rows(data["group_balances"], user_id)
+    total_cats, total_bal = len(cats), len(bal)
+
+    def build() -> str:
+        payload = {"m": data["month"], "spent": _amount(data["total_spent"]), "cats": cats}
+        if bal:
+            payload["bal"] = bal
+        more = {}
+        if len(cats) < total_cats:
+            more["cats"] = total_cats - len(cats)
+        if len(bal) < total_bal:
+            more["bal"] = total_bal - len(bal)
+        if more:
+            payload["more"] = more
+        return _encode(payload)
+
+    text = build()
+    while estimate_tokens(text) > token_budget and (bal or len(cats) > 1):
+        if bal:
+            bal.pop()
+        else:
+            cats.pop()
+        text = build()
+
+    stats = {
+        "tokens": estimate_tokens(text),
+        "chars": len(text),
+        "categories": len(cats),
+        "categories_dropped": total_cats - len(cats),
+        "counterparties": len(bal),
+        "counterparties_dropped": total_bal - len(bal),
+    }
+    return text, stats
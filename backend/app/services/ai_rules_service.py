@@ -0,0 +1,116 @@
+"""
+Rule-based insights computed straight from get_monthly_ai_context output.
+
+Alerts, good news and suggestions are plain arithmetic on budgets, spend
+and balances, so they are produced here in milliseconds; the LLM is only
+needed (in "hybrid" mode) for the one-sentence summary.
+"""
+from app.services.ai_prompt_service import net_counterparty_amounts, order_categories
+
+# Share of a budget at which a category is flagged before it is exceeded
+NEAR_LIMIT_RATIO = 0.9
+
+# Counterparties named in suggestions, largest amounts first
+MAX_BALANCE_SUGGESTIONS = 3
+
+
+def _money(value: float) -> str:
+    return f"{value:,.2f}"
+
+
+def _alerts(categories: list[dict]) -> list[str]:
+    alerts = []
+
+    for c in categories:
+        limit, spent = c["limit"], c["spent"]
+        if spent > limit:
+            alerts.append(
+                f"{c['category']} is over budget: spent {_money(spent)} of "
+                f"{_money(limit)} ({_money(spent - limit)} over)"
+            )
+        elif limit > 0 and spent >= limit * NEAR_LIMIT_RATIO:
+            alerts.append(
+                f"{c['category']} is at {spent / limit:.0%} of its budget: "
+                f"{_money(limit - spent)} left of {_money(limit)}"
+            )
+
+    return alerts
+
+
+def _good_news(categories: list[dict]) -> list[str]:
+    news = []
+
+    for c in categories:
+        limit, spent = c["limit"], c["spent"]
+        if limit > 0 and spent < limit * NEAR_LIMIT_RATIO:
+            news.append(
+                f"{c['category']} is within budget: spent {_money(spent)} of "
+                f"{_money(limit)} ({_money(limit - spent)} left)"
+            )
+
+    total_limit = sum(c["limit"] for c in categories)
+    budgeted_spent = sum(c["spent"] for c in categories)
+    if categories and total_limit > 0 and budgeted_spent <= total_limit:
+        news.append(
+            f"Budgeted spending of {_money(budgeted_spent)} is within the "
+            f"combined budget of {_money(total_limit)}"
+        )
+
+    return news
+
+
+def _suggestions(data: dict, categories: list[dict], user_id: int) -> list[str]:
+    suggestions = []
+
+    for c in categories:
+        over = c["spent"] - c["limit"]
+        if over > 0:
+            suggestions.append(
+                f"Cut {c['category']} by {_money(over)} next month, or raise its "
+                f"budget from {_money(c['limit'])} to {_money(c['spent'])}"
+            )
+
+    unbudgeted = round(data["total_spent"] - sum(c["spent"] for c in categories), 2)
+    if unbudgeted > 0:
+        suggestions.append(
+            f"{_money(unbudgeted)} of spending is in categories without a "
+            f"budget this month; add budgets for them"
+        )
+
+    net = net_counterparty_amounts(data["group_balances"], user_id)
+    largest = sorted(net.items(), key=lambda kv: (-abs(kv[1]), kv[0]))
+    for other, amount in largest[:MAX_BALANCE_SUGGESTIONS]:
+        if amount < 0:
+            suggestions.append(f"Settle the {_money(-amount)} you owe {other}")
+        else:
+            suggestions.append(f"Ask {other} to settle the {_money(amount)} they owe you")
+
+    return suggestions
+
+
+def local_insights(data: dict, user_id: int) -> dict:
+    """
+    Alerts, good news and suggestions for `data` (get_monthly_ai_context
+    output), without a summary. Deterministic: the same data always gives
+    the same lists in the same order.
+    """
+    categories = order_categories(data["categories"])
+
+    return {
+        "alerts": _alerts(categories),
+        "good_news": _good_news(categories),
+        "suggestions": _suggestions(data, categories, user_id),
+    }
+
+
+def local_summary(data: dict) -> str:
+    """Template one-sentence summary, for fully offline mode."""
+    over = [c for c in data["categories"] if c["spent"] > c["limit"]]
+    total = len(data["categories"])
+
+    if not over:
+        status = "no budgeted category is over budget"
+    else:
+        status = f"{len(over)} of {total} budgeted categories are over budget"
+
+    return f"You spent {_money(data['total_spent'])} in {data['month']}, and {status}."
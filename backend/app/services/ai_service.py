@@ -1,10 +1,28 @@
 import json
-import os
-from openai import OpenAI
+from typing import Iterator
+
+from flask import current_app
 
 from app.services.ai_data_service import get_monthly_ai_context
+from app.services.ai_prompt_service import CONTEXT_LEGEND, encode_ai_context
+from app.services.ai_cache_service import context_hash, get_cached_insights, store_insights
+from app.services.ai_rules_service import local_insights, local_summary
+from app.services.llm_service import get_provider
 from app.utils.errors import AppError
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from app.utils.json_stream import JsonObjectStream
+
+MODEL = "gpt-4o-mini"
+TEMPERATURE = 0.4
+
+# AI_INSIGHTS_MODE values:
+# - "llm": the model writes everything
+# - "hybrid": alerts, good news and suggestions are computed locally,
+#   the model writes only the summary
+# - "local": everything computed locally, no model call
+INSIGHT_MODES = ("llm", "hybrid", "local")
+
+# Keys of a full ("llm" mode) response besides the summary
+INSIGHT_LISTS = ("alerts", "good_news", "suggestions")
 
 
 SYSTEM_PROMPT = """
@@ -22,11 +40,11 @@ Return strictly valid JSON.
 
 
 
-def build_prompt(data: dict) -> str:
+def build_prompt(context: str) -> str:
     return f"""
-User monthly financial data (JSON):
+User monthly financial data (compact JSON; {CONTEXT_LEGEND}):
 
-{json.dumps(data, indent=2)}
+{context}
 
 Tasks:
 1. Identify overspending categories
@@ -42,32 +60,244 @@ Return JSON with exactly these keys:
 """
 
 
-def generate_ai_insights(user_id: int, month: str):  
-    if not os.getenv("OPENAI_API_KEY"):
+def build_summary_prompt(context: str) -> str:
+    return f"""
+User monthly financial data (compact JSON; {CONTEXT_LEGEND}):
+
+{context}
+
+Task: summarize the month in ONE sentence.
+
+Return JSON with exactly this key:
+- summary (string)
+"""
+
+
+def _empty_month_insights() -> dict:
+    return {
+        "alerts": [],
+        "good_news": ["No spending recorded for this month"],
+        "suggestions": [],
+        "summary": "No financial activity recorded for this period."
+    }
+
+
+def _insights_mode() -> str:
+    mode = current_app.config["AI_INSIGHTS_MODE"]
+    if mode not in INSIGHT_MODES:
+        raise AppError(
+            f"AI_INSIGHTS_MODE must be one of: {', '.join(INSIGHT_MODES)}",
+            500,
+            code="SERVER_ERROR",
+        )
+    return mode
+
+
+def _month_data(user_id: int, month: str, mode: str) -> dict | None:
+    """
+    get_monthly_ai_context for the user's month, or None when there is no
+    activity worth reporting on.
+    """
+    if mode != "local" and not get_provider().enabled():
         raise AppError("AI insights are disabled", 503)
-    
+
     data = get_monthly_ai_context(user_id, month)
 
     if not data["categories"] or data["total_spent"] == 0:
-        return {
-            "alerts": [],
-            "good_news": ["No spending recorded for this month"],
-            "suggestions": [],
-            "summary": "No financial activity recorded for this period."
-        }
-
-
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": build_prompt(data)},
-        ],
-        temperature=0.4,
+        return None
+    return data
+
+
+def _insight_request(data: dict, user_id: int, prompt) -> tuple[list[dict], str]:
+    """Chat messages for `data` built with `prompt`, and their cache key."""
+    context, stats = encode_ai_context(
+        data,
+        user_id,
+        current_app.config["AI_PROMPT_TOKEN_BUDGET"],
     )
+    current_app.logger.info(
+        "AI prompt for user %s %s: ~%d tokens (%d chars), "
+        "%d categories (%d dropped), %d counterparties (%d dropped)",
+        user_id,
+        data["month"],
+        stats["tokens"],
+        stats["chars"],
+        stats["categories"],
+        stats["categories_dropped"],
+        stats["counterparties"],
+        stats["counterparties_dropped"],
+    )
+
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt(context)},
+    ]
+    return messages, context_hash(get_provider().name, MODEL, TEMPERATURE, messages)
+
+
+def _validated(response, mode: str) -> dict:
+    """
+    `response` if it is a usable model reply for `mode`, else ValueError:
+    a dict with a string summary and, in "llm" mode, string lists for
+    alerts, good_news and suggestions.
+    """
+    if not isinstance(response, dict) or not isinstance(response.get("summary"), str):
+        raise ValueError("AI response has no summary")
+
+    if mode == "llm":
+        for key in INSIGHT_LISTS:
+            value = response.get(key)
+            if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                raise ValueError(f"AI response has no {key} list")
+
+    return response
+
+
+def _cached_response(key: str, mode: str) -> dict | None:
+    """The cached reply for `key`, or None if missing, expired or unusable."""
+    try:
+        return _validated(get_cached_insights(key), mode)
+    except ValueError:
+        return None
+
+
+def _with_summary(insights: dict, response) -> dict:
+    return {**insights, "summary": _validated(response, "hybrid")["summary"]}
+
+
+def generate_ai_insights(user_id: int, month: str, refresh: bool = False):
+    """
+    Insights for the user's month, produced according to AI_INSIGHTS_MODE.
+
+    Model responses are cached by a hash of everything sent to the model,
+    so unchanged data is answered from the cache; `refresh` forces a new
+    completion (and re-caches it).
+    """
+    mode = _insights_mode()
+    data = _month_data(user_id, month, mode)
+    if data is None:
+        return _empty_month_insights()
+
+    if mode == "llm":
+        messages, key = _insight_request(data, user_id, build_prompt)
+    else:
+        insights = local_insights(data, user_id)
+        if mode == "local":
+            return {**insights, "summary": local_summary(data)}
+        messages, key = _insight_request(data, user_id, build_summary_prompt)
+
+    response = None if refresh else _cached_response(key, mode)
+
+    if response is None:
+        content = get_provider().complete(messages, MODEL, TEMPERATURE)
+
+        # Only usable replies are cached, so a bad one is retried next time
+        try:
+            response = _validated(json.loads(content), mode)
+        except Exception:
+            raise AppError("AI response parsing failed", 500)
+
+        store_insights(key, response)
+
+    if mode == "llm":
+        return response
+    return _with_summary(insights, response)
+
+
+# =========================
+# Streaming
+# =========================
+
+def _insight_items(insights: dict) -> Iterator[tuple[str, object]]:
+    for key, value in insights.items():
+        if isinstance(value, list):
+            for item in value:
+                yield key, item
+        else:
+            yield key, value
+
+
+def _replay(insights: dict) -> Iterator[tuple[str, dict]]:
+    for key, value in _insight_items(insights):
+        yield "item", {"key": key, "value": value}
+    yield "done", {"insights": insights}
+
+
+def stream_ai_insights(
+    user_id: int,
+    month: str,
+    refresh: bool = False,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Streaming variant of generate_ai_insights. Returns an iterator of
+    (event, data) pairs:
+
+    - ("token", {"text"}) for every fragment the model sends
+    - ("item", {"key", "value"}) as soon as an alert, good_news or
+      suggestion entry, or the summary, is complete
+    - ("done", {"insights"}) with the full parsed response, last
+    - ("error", {"message", "code"}) instead of "done" if parsing fails
+
+    In "hybrid" mode the locally computed items come first, before any
+    model output; in "local" mode there are no tokens at all.
+
+    Validation and the request to the model happen before this returns,
+    so those failures still surface as regular error responses.
+    """
+    mode = _insights_mode()
+    data = _month_data(user_id, month, mode)
+    if data is None:
+        return _replay(_empty_month_insights())
+
+    local = None
+    if mode == "llm":
+        messages, key = _insight_request(data, user_id, build_prompt)
+    else:
+        local = local_insights(data, user_id)
+        if mode == "local":
+            return _replay({**local, "summary": local_summary(data)})
+        messages, key = _insight_request(data, user_id, build_summary_prompt)
+
+    # An unusable entry is a miss: ask the model again
+    cached = None if refresh else _cached_response(key, mode)
+    if cached is not None:
+        return _replay(cached if local is None else _with_summary(local, cached))
+
+    fragments = get_provider().stream(messages, MODEL, TEMPERATURE)
+    return _stream_completion(fragments, key, mode, local)
+
+
+def _stream_completion(
+    fragments: Iterator[str],
+    key: str,
+    mode: str,
+    local: dict | None = None,
+) -> Iterator[tuple[str, dict]]:
+    if local is not None:
+        for item_key, value in _insight_items(local):
+            yield "item", {"key": item_key, "value": value}
+
+    parser = JsonObjectStream()
 
     try:
-        content = response.choices[0].message.content
-        return json.loads(content)
+        for text in fragments:
+            yield "token", {"text": text}
+            for item_key, value in parser.feed(text):
+                # Hybrid: only the summary comes from the model
+                if local is None or item_key == "summary":
+                    yield "item", {"key": item_key, "value": value}
     except Exception:
-        raise AppError("AI response parsing failed", 500)
+        # Headers are already sent; report in-band
+        current_app.logger.exception("AI insight stream failed")
+        yield "error", {"message": "AI provider stream failed", "code": "SERVER_ERROR"}
+        return
+
+    try:
+        response = _validated(parser.result(), mode)
+        insights = response if local is None else _with_summary(local, response)
+    except ValueError:
+        yield "error", {"message": "AI response parsing failed", "code": "SERVER_ERROR"}
+        return
+
+    store_insights(key, response)
+    yield "done", {"insights": insights}
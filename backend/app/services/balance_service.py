@@ -1,97 +1,245 @@
-from decimal import Decimal
+from datetime import datetime
+
+from flask import current_app
 
 from app.extensions import db
 from app.models.user import User
+from app.models.group import Group
 from app.models.group_member import GroupMember
-from app.models.expense import Expense
-from app.models.expense_split import ExpenseSplit
+from app.models.group_balance import GroupBalance
 from app.services.group_service import require_membership
+from app.services.checkpoint_service import checkpointed_net_balances
+from app.services.request_cache_service import cached_group_members, remember_group_members
+from app.services.settlement_service import compute_settlements
+from app.utils.errors import AppError
+from app.utils.dates import end_of_day
+from app.utils.money import to_cents, cents_to_float
+
+BALANCE_SOURCES = ("ledger", "aggregate")
+
+
+# =========================
+# Helpers
+# =========================
+
+def _resolve_options(source: str | None, strategy: str | None) -> tuple[str, str]:
+    source = source or current_app.config["BALANCE_SOURCE"]
+    strategy = strategy or current_app.config["SETTLEMENT_STRATEGY"]
+    if source not in BALANCE_SOURCES:
+        raise AppError(f"source must be one of: {', '.join(BALANCE_SOURCES)}", 400)
+    return source, strategy
+
+
+def _member_balances(
+    group_ids: list[int],
+    source: str,
+    until: datetime | None = None,
+) -> tuple[dict[int, dict[int, int]], dict[int, str]]:
+    """
+    Net balance (paid - owed, in cents) of every current member of the
+    given groups, plus their emails.
+
+    "ledger" reads the maintained group_balances rows; "aggregate" sums
+    history in the database starting from the latest month-end checkpoint.
+    Either way one row per member comes back, independent of how much
+    history the groups have. Passing `until` always takes the checkpoint
+    path, giving balances as of that (exclusive) cutoff.
+
+    Returns ({group_id: {user_id: cents}}, {user_id: email}); members keep
+    their join order within each group.
+    """
+    query = (
+        db.session.query(GroupMember.group_id, GroupMember.user_id, User.email)
+        .join(User, User.id == GroupMember.user_id)
+        .filter(GroupMember.group_id.in_(group_ids))
+        .order_by(GroupMember.id)
+    )
+
+    if source == "aggregate" or until is not None:
+        cached = {gid: cached_group_members(gid) for gid in group_ids}
+        if all(members is not None for members in cached.values()):
+            # Member lists already loaded by require_membership
+            rows = [
+                (gid, uid, email, None)
+                for gid in group_ids
+                for uid, email in cached[gid]
+            ]
+        else:
+            rows = [(gid, uid, email, None) for gid, uid, email in query.all()]
+        totals = checkpointed_net_balances(group_ids, until)
+    else:
+        rows = (
+            query
+            .outerjoin(
+                GroupBalance,
+                (GroupBalance.group_id == GroupMember.group_id)
+                & (GroupBalance.user_id == GroupMember.user_id),
+            )
+            .add_columns(GroupBalance.net_amount)
+            .all()
+        )
+        totals = None
 
-ZERO = Decimal("0.00")
-
-
-def compute_group_settlements(group_id: int, requester_user_id: int):
-    # Ensure requester belongs to the group
-    require_membership(group_id, requester_user_id)
-
-    members = GroupMember.query.filter_by(group_id=group_id).all()
-    member_ids = [m.user_id for m in members]
-
-    if not member_ids:
-        return []
+    net: dict[int, dict[int, int]] = {gid: {} for gid in group_ids}
+    emails: dict[int, str] = {}
 
-    # Net balance per user: paid - owed
-    net = {uid: ZERO for uid in member_ids}
+    for gid, uid, email, amount in rows:
+        if totals is not None:
+            net[gid][uid] = totals[gid].get(uid, 0)
+        else:
+            net[gid][uid] = to_cents(amount) if amount is not None else 0
+        emails[uid] = email
 
-    expenses = Expense.query.filter_by(group_id=group_id).all()
-    if not expenses:
-        return []
+    for gid in group_ids:
+        remember_group_members(gid, [(uid, emails[uid]) for uid in net[gid]])
 
-    expense_ids = [e.id for e in expenses]
+    return net, emails
 
-    # Sum amounts paid
-    for e in expenses:
-        net[e.paid_by_user_id] += Decimal(str(e.amount))
 
-    # Sum amounts owed
-    splits = (
-    ExpenseSplit.query
-    .filter(ExpenseSplit.expense_id.in_(expense_ids))
-    .filter(ExpenseSplit.user_id.in_(member_ids))
-    .all()
-)
+def _settle(net: dict[int, int], emails: dict[int, str], strategy: str) -> list[dict]:
+    settlements = compute_settlements(net, strategy)
 
+    # Attach emails for frontend / AI convenience
+    for s in settlements:
+        s["from_email"] = emails.get(s["from_user_id"])
+        s["to_email"] = emails.get(s["to_user_id"])
 
-    for s in splits:
-        if s.user_id not in net:
-            # Ignore splits for users no longer in group
-            continue
-        net[s.user_id] -= Decimal(str(s.amount_owed))
+    return settlements
 
 
-    # Separate creditors (positive) and debtors (negative)
-    creditors = [(uid, amt) for uid, amt in net.items() if amt > ZERO]
-    debtors = [(uid, -amt) for uid, amt in net.items() if amt < ZERO]  # store positive debt
+# =========================
+# Core services
+# =========================
 
-    creditors.sort(key=lambda x: x[1], reverse=True)
-    debtors.sort(key=lambda x: x[1], reverse=True)
+def compute_group_settlements(
+    group_id: int,
+    requester_user_id: int,
+    source: str | None = None,
+    strategy: str | None = None,
+    as_of: str | None = None,
+):
+    # Ensure requester belongs to the group
+    require_membership(group_id, requester_user_id)
 
-    settlements = []
-    i = j = 0
+    source, strategy = _resolve_options(source, strategy)
 
-    # Greedy settlement
-    while i < len(debtors) and j < len(creditors):
-        debtor_id, debt_amt = debtors[i]
-        creditor_id, credit_amt = creditors[j]
+    # Optional YYYY-MM-DD: balances at the end of that day
+    until = end_of_day(as_of, "as_of") if as_of else None
 
-        pay = min(debt_amt, credit_amt)
+    net, emails = _member_balances([group_id], source, until)
+    if not net[group_id]:
+        return []
 
-        if pay > ZERO:
-            settlements.append(
-                {
-                    "from_user_id": debtor_id,
-                    "to_user_id": creditor_id,
-                    "amount": float(pay),
-                }
+    return _settle(net[group_id], emails, strategy)
+
+
+def group_member_balances(
+    group_id: int,
+    source: str | None = None,
+    strategy: str | None = None,
+) -> tuple[list[dict], list[dict]]:
+    """
+    Every member of the group with their net balance, plus the transfers
+    that settle the group. Does not check membership; callers authorize.
+
+    Returns ([{"user_id", "email", "net"}], settlements); members are in
+    join order.
+    """
+    source, strategy = _resolve_options(source, strategy)
+
+    net, emails = _member_balances([group_id], source)
+    members = [
+        {"user_id": uid, "email": emails[uid], "net": cents_to_float(cents)}
+        for uid, cents in net[group_id].items()
+    ]
+    settlements = _settle(net[group_id], emails, strategy) if net[group_id] else []
+
+    return members, settlements
+
+
+def compute_user_balances(
+    user_id: int,
+    net_across_groups: bool = False,
+    source: str | None = None,
+    strategy: str | None = None,
+):
+    """
+    The user's position in every group they belong to, with a constant
+    number of queries regardless of how many groups that is.
+
+    Returns:
+        {
+          "groups": [
+            {"group_id", "group_name", "net", "settlements": [...]}
+          ],
+          "total_net": float,
+          "counterparties": [{"user_id", "email", "net"}]   # if net_across_groups
+        }
+
+    `net` is positive when the user is owed money. Counterparties net the
+    user's transfers with each person across all groups.
+    """
+    source, strategy = _resolve_options(source, strategy)
+
+    groups = (
+        db.session.query(Group)
+        .join(GroupMember, GroupMember.group_id == Group.id)
+        .filter(GroupMember.user_id == user_id)
+        .order_by(Group.created_at.desc())
+        .all()
+    )
+    if not groups:
+        result = {"groups": [], "total_net": 0.0}
+        if net_across_groups:
+            result["counterparties"] = []
+        return result
+
+    net, emails = _member_balances([g.id for g in groups], source)
+
+    rows = []
+    total = 0
+    counterparties: dict[int, int] = {}
+
+    for group in groups:
+        settlements = _settle(net[group.id], emails, strategy)
+        user_net = net[group.id].get(user_id, 0)
+        total += user_net
+
+        for s in settlements:
+            amount = to_cents(s["amount"])
+            if s["from_user_id"] == user_id:
+                other = s["to_user_id"]
+                counterparties[other] = counterparties.get(other, 0) - amount
+            elif s["to_user_id"] == user_id:
+                other = s["from_user_id"]
+                counterparties[other] = counterparties.get(other, 0) + amount
+
+        rows.append(
+            {
+                "group_id": group.id,
+                "group_name": group.name,
+                "net": cents_to_float(user_net),
+                "settlements": settlements,
+            }
+        )
+
+    result = {
+        "groups": rows,
+        "total_net": cents_to_float(total),
+    }
+
+    if net_across_groups:
+        result["counterparties"] = [
+            {
+                "user_id": uid,
+                "email": emails.get(uid),
+                "net": cents_to_float(cents),
+            }
+            for uid, cents in sorted(
+                counterparties.items(),
+                key=lambda item: (-abs(item[1]), item[0]),
             )
+            if cents
+        ]
 
-        debt_amt -= pay
-        credit_amt -= pay
-
-        debtors[i] = (debtor_id, debt_amt)
-        creditors[j] = (creditor_id, credit_amt)
-
-        if debtors[i][1] == ZERO:
-            i += 1
-        if creditors[j][1] == ZERO:
-            j += 1
-
-    # Attach emails for frontend / AI convenience
-    users = User.query.filter(User.id.in_(member_ids)).all()
-    id_to_email = {u.id: u.email for u in users}
-
-    for s in settlements:
-        s["from_email"] = id_to_email.get(s["from_user_id"])
-        s["to_email"] = id_to_email.get(s["to_user_id"])
-
-    return settlements
+    return result
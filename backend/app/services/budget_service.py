@@ -1,16 +1,24 @@
+import copy
 from decimal import Decimal, ROUND_HALF_UP
-from datetime import datetime, timezone
 
-from app.extensions import db
+from sqlalchemy import func, literal, null, union_all
+
+from app.extensions import db, summary_cache
 from app.models.monthly_budget import MonthlyBudget
-from app.models.expense import Expense
 from app.models.category import Category
+from app.models.monthly_spend_rollup import MonthlySpendRollup
 from app.services.category_service import require_category_owned_by_user
+from app.services.data_version_service import bump_data_version, get_data_version
+from app.services.rollup_service import monthly_spend
 from app.utils.errors import AppError
+from app.utils.dates import default_month, month_bounds, month_range, shift_month
 
 TWOPLACES = Decimal("0.01")
 ZERO = Decimal("0.00")
 
+TREND_DEFAULT_MONTHS = 12
+TREND_MAX_MONTHS = 36
+
 
 # --------------------
 # Helpers
@@ -22,30 +30,59 @@ def _to_decimal_amount(value) -> Decimal:
         raise AppError("Invalid amount", 400)
 
 
-def _default_month() -> str:
-    now = datetime.now(timezone.utc)
-    return f"{now.year:04d}-{now.month:02d}"
+def _summary_rows(
+    categories: list[Category],
+    spend_by_category: dict[int | None, Decimal],
+    limits: dict[int, Decimal | None],
+) -> list[dict]:
+    rows = []
 
+    for c in categories:
+        spent = spend_by_category.get(c.id, ZERO)
+        limit = limits.get(c.id)
+        limit_amt = Decimal(str(limit)).quantize(TWOPLACES) if limit is not None else None
 
-def _month_bounds(month: str):
-    """
-    month format: YYYY-MM
-    returns [start, end)
-    """
-    try:
-        year, mon = int(month[:4]), int(month[5:7])
-        if month[4] != "-" or mon < 1 or mon > 12:
-            raise ValueError()
-    except Exception:
-        raise AppError("month must be in YYYY-MM format", 400)
+        remaining = None
+        overspent = None
+
+        if limit_amt is not None:
+            remaining = (limit_amt - spent).quantize(TWOPLACES)
+            overspent = spent > limit_amt
 
-    start = datetime(year, mon, 1, tzinfo=timezone.utc)
-    if mon == 12:
-        end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
-    else:
-        end = datetime(year, mon + 1, 1, tzinfo=timezone.utc)
+        rows.append(
+            {
+                "category_id": c.id,
+                "category_name": c.name,
+                "spent": float(spent),
+                "limit": float(limit_amt) if limit_amt is not None else None,
+                "remaining": float(remaining) if remaining is not None else None,
+                "overspent": overspent,
+            }
+        )
+
+    # Uncategorized
+    uncategorized_spent = spend_by_category.get(None, ZERO)
+    if uncategorized_spent > ZERO:
+        rows.append(
+            {
+                "category_id": None,
+                "category_name": "Uncategorized",
+                "spent": float(uncategorized_spent),
+                "limit": None,
+                "remaining": None,
+                "overspent": None,
+            }
+        )
 
-    return start, end
+    # Prioritize overspent categories
+    rows.sort(
+        key=lambda r: (
+            r["overspent"] is True,
+            r["spent"],
+        ),
+        reverse=True,
+    )
+    return rows
 
 
 # --------------------
@@ -57,7 +94,7 @@ def upsert_monthly_budget(
     month: str | None,
     limit_amount,
 ):
-    month = month or _default_month()
+    month = month or default_month()
 
     require_category_owned_by_user(user_id, category_id)
 
@@ -73,6 +110,7 @@ def upsert_monthly_budget(
 
     if budget:
         budget.limit_amount = limit_dec
+        bump_data_version([user_id])
         db.session.commit()
         return budget
 
@@ -83,6 +121,7 @@ def upsert_monthly_budget(
         limit_amount=limit_dec,
     )
     db.session.add(budget)
+    bump_data_version([user_id])
     db.session.commit()
     return budget
 
@@ -91,85 +130,139 @@ def upsert_monthly_budget(
 # Monthly Summary
 # --------------------
 def monthly_summary(user_id: int, month: str | None):
-    month = month or _default_month()
-    start, end = _month_bounds(month)
+    """
+    Spend against budget per category for one month.
 
-    # MVP definition: "your spending" = expenses you paid
-    expenses = (
-        Expense.query
-        .filter(Expense.paid_by_user_id == user_id)
-        .filter(Expense.created_at >= start)
-        .filter(Expense.created_at < end)
-        .all()
-    )
+    Cached per process under (user_id, month, data_version); any write to
+    the user's expenses, budgets or categories bumps the version, so a
+    cached summary is never served after a change.
+    """
+    month = month or default_month()
+    month_bounds(month)  # validates the format
 
-    spend_by_category: dict[int | None, Decimal] = {}
-    total_spent = ZERO
+    key = (user_id, month, get_data_version(user_id))
+    summary = summary_cache.get(key)
+    if summary is None:
+        summary = _compute_monthly_summary(user_id, month)
+        summary_cache.set(key, summary)
 
-    for e in expenses:
-        amt = Decimal(str(e.amount)).quantize(TWOPLACES)
-        total_spent += amt
-        spend_by_category[e.category_id] = (
-            spend_by_category.get(e.category_id, ZERO) + amt
-        )
+    return copy.deepcopy(summary)
 
-    categories = Category.query.filter_by(user_id=user_id).all()
-    budgets = MonthlyBudget.query.filter_by(user_id=user_id, month=month).all()
 
-    budget_map = {
-        b.category_id: Decimal(str(b.limit_amount)).quantize(TWOPLACES)
-        for b in budgets
+def _compute_monthly_summary(user_id: int, month: str):
+    # MVP definition: "your spending" = expenses you paid
+    spend_by_category = {
+        category_id: amount.quantize(TWOPLACES)
+        for category_id, amount in monthly_spend(user_id, month).items()
     }
+    total_spent = sum(spend_by_category.values(), ZERO)
+
+    # Categories with this month's budget (if any) in one query
+    categories = (
+        db.session.query(Category, MonthlyBudget.limit_amount)
+        .outerjoin(
+            MonthlyBudget,
+            (MonthlyBudget.category_id == Category.id)
+            & (MonthlyBudget.user_id == user_id)
+            & (MonthlyBudget.month == month),
+        )
+        .filter(Category.user_id == user_id)
+        .order_by(Category.id)
+        .all()
+    )
 
-    rows = []
+    limits = {c.id: limit for c, limit in categories}
+    rows = _summary_rows(
+        [c for c, _ in categories],
+        spend_by_category,
+        limits,
+    )
 
-    for c in categories:
-        spent = spend_by_category.get(c.id, ZERO)
-        limit_amt = budget_map.get(c.id)
+    return {
+        "month": month,
+        "total_spent": float(total_spent.quantize(TWOPLACES)),
+        "by_category": rows,
+    }
 
-        remaining = None
-        overspent = None
 
-        if limit_amt is not None:
-            remaining = (limit_amt - spent).quantize(TWOPLACES)
-            overspent = spent > limit_amt
+# --------------------
+# Trend
+# --------------------
+def budget_trend(user_id: int, from_month: str | None, to_month: str | None):
+    """
+    Monthly summaries for every month in [from_month, to_month].
 
-        rows.append(
-            {
-                "category_id": c.id,
-                "category_name": c.name,
-                "spent": float(spent),
-                "limit": float(limit_amt) if limit_amt is not None else None,
-                "remaining": float(remaining) if remaining is not None else None,
-                "overspent": overspent,
-            }
+    Spend (from the rollups) and limits (from monthly_budgets) are merged
+    by one GROUP BY over (month, category), so the cost depends on
+    months x categories rather than on the number of expenses.
+    """
+    to_month = to_month or default_month()
+    from_month = from_month or shift_month(to_month, 1 - TREND_DEFAULT_MONTHS)
+    months = month_range(from_month, to_month)
+
+    if not months:
+        raise AppError("from must not be after to", 400)
+    if len(months) > TREND_MAX_MONTHS:
+        raise AppError(f"A trend can cover at most {TREND_MAX_MONTHS} months", 400)
+
+    first, last = months[0], months[-1]
+
+    spend = (
+        db.session.query(
+            MonthlySpendRollup.month.label("month"),
+            MonthlySpendRollup.category_id.label("category_id"),
+            MonthlySpendRollup.total_amount.label("spent"),
+            null().label("limit_amount"),
         )
-
-    # Uncategorized
-    uncategorized_spent = spend_by_category.get(None, ZERO)
-    if uncategorized_spent > ZERO:
-        rows.append(
-            {
-                "category_id": None,
-                "category_name": "Uncategorized",
-                "spent": float(uncategorized_spent),
-                "limit": None,
-                "remaining": None,
-                "overspent": None,
-            }
+        .filter(MonthlySpendRollup.user_id == user_id)
+        .filter(MonthlySpendRollup.month.between(first, last))
+    )
+    budgets = (
+        db.session.query(
+            MonthlyBudget.month.label("month"),
+            MonthlyBudget.category_id.label("category_id"),
+            null().label("spent"),
+            MonthlyBudget.limit_amount.label("limit_amount"),
         )
-
-    # Prioritize overspent categories
-    rows.sort(
-        key=lambda r: (
-            r["overspent"] is True,
-            r["spent"],
-        ),
-        reverse=True,
+        .filter(MonthlyBudget.user_id == user_id)
+        .filter(MonthlyBudget.month.between(first, last))
     )
+    merged = union_all(spend, budgets).subquery()
+
+    grouped = db.session.query(
+        merged.c.month,
+        merged.c.category_id,
+        func.coalesce(func.sum(merged.c.spent), literal(0)),
+        func.max(merged.c.limit_amount),
+    ).group_by(merged.c.month, merged.c.category_id)
+
+    spend_by_month: dict[str, dict[int | None, Decimal]] = {m: {} for m in months}
+    limits_by_month: dict[str, dict[int, Decimal]] = {m: {} for m in months}
+
+    for month, category_id, spent, limit in grouped:
+        spent = Decimal(str(spent)).quantize(TWOPLACES)
+        if spent:
+            spend_by_month[month][category_id] = spent
+        if limit is not None:
+            limits_by_month[month][category_id] = limit
+
+    categories = Category.query.filter_by(user_id=user_id).order_by(Category.id).all()
 
     return {
-        "month": month,
-        "total_spent": float(total_spent.quantize(TWOPLACES)),
-        "by_category": rows,
+        "from": first,
+        "to": last,
+        "months": [
+            {
+                "month": month,
+                "total_spent": float(
+                    sum(spend_by_month[month].values(), ZERO).quantize(TWOPLACES)
+                ),
+                "by_category": _summary_rows(
+                    categories,
+                    spend_by_month[month],
+                    limits_by_month[month],
+                ),
+            }
+            for month in months
+        ],
     }
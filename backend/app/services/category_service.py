@@ -1,5 +1,11 @@
 from app.extensions import db
 from app.models.category import Category
+from app.services.data_version_service import bump_data_version
+from app.services.request_cache_service import (
+    category_by_id,
+    category_by_name,
+    remember_category,
+)
 from app.utils.errors import AppError
 
 
@@ -12,11 +18,7 @@ def create_category(user_id: int, name: str) -> Category:
     if not name_norm:
         raise AppError("Category name is required", 400)
 
-    existing = Category.query.filter_by(
-        user_id=user_id,
-        name=name_norm,
-    ).first()
-
+    existing = category_by_name(user_id, name_norm)
     if existing:
         return existing
 
@@ -25,7 +27,9 @@ def create_category(user_id: int, name: str) -> Category:
         name=name_norm,
     )
     db.session.add(category)
+    bump_data_version([user_id])
     db.session.commit()
+    remember_category(category)
     return category
 
 
@@ -39,11 +43,7 @@ def list_categories(user_id: int):
 
 
 def require_category_owned_by_user(user_id: int, category_id: int) -> Category:
-    category = Category.query.filter_by(
-        id=category_id,
-        user_id=user_id,
-    ).first()
-
+    category = category_by_id(user_id, category_id)
     if not category:
         raise AppError("Category not found", 404)
 
@@ -0,0 +1,138 @@
+from datetime import datetime
+
+from sqlalchemy import func
+
+from app.extensions import db
+from app.models.group import Group
+from app.models.expense import Expense
+from app.models.group_balance_checkpoint import GroupBalanceCheckpoint
+from app.services.ledger_service import aggregate_group_net_balances
+from app.utils.dates import default_month, month_of, month_bounds, next_month
+from app.utils.money import to_cents, cents_to_decimal
+
+
+def checkpointed_net_balances(
+    group_ids: list[int],
+    until: datetime | None = None,
+) -> dict[int, dict[int, int]]:
+    """
+    Net balance per group and user (paid - owed, in cents) as of `until`
+    (exclusive), or as of now when until is None.
+
+    Starts from each group's latest checkpoint that ends at or before the
+    cutoff and replays only the expenses after it, so the work is bounded
+    by one month of history plus whatever is newer than the last build.
+    """
+    latest = (
+        db.session.query(
+            GroupBalanceCheckpoint.group_id.label("group_id"),
+            func.max(GroupBalanceCheckpoint.month).label("month"),
+        )
+        .filter(GroupBalanceCheckpoint.group_id.in_(group_ids))
+    )
+    if until is not None:
+        # A checkpoint for month M covers everything before M + 1
+        latest = latest.filter(GroupBalanceCheckpoint.month < month_of(until))
+    latest = latest.group_by(GroupBalanceCheckpoint.group_id).subquery()
+
+    rows = (
+        db.session.query(
+            GroupBalanceCheckpoint.group_id,
+            GroupBalanceCheckpoint.user_id,
+            GroupBalanceCheckpoint.month,
+            GroupBalanceCheckpoint.net_amount,
+        )
+        .join(
+            latest,
+            (latest.c.group_id == GroupBalanceCheckpoint.group_id)
+            & (latest.c.month == GroupBalanceCheckpoint.month),
+        )
+        .all()
+    )
+
+    net: dict[int, dict[int, int]] = {gid: {} for gid in group_ids}
+    since: dict[int, datetime] = {}
+
+    for gid, uid, month, amount in rows:
+        net[gid][uid] = to_cents(amount)
+        since[gid] = month_bounds(month)[1]
+
+    deltas = aggregate_group_net_balances(group_ids, since=since, until=until)
+    for gid, users in deltas.items():
+        for uid, cents in users.items():
+            net[gid][uid] = net[gid].get(uid, 0) + cents
+
+    return net
+
+
+def build_checkpoints(group_id: int | None = None) -> int:
+    """
+    Write month-end checkpoints for every complete month that does not
+    have one yet, continuing from each group's latest checkpoint.
+    Returns the number of checkpoint months written.
+    """
+    if group_id is not None:
+        group_ids = [group_id]
+    else:
+        group_ids = [gid for (gid,) in db.session.query(Group.id).order_by(Group.id)]
+
+    current = default_month()
+    written = 0
+
+    for gid in group_ids:
+        last = (
+            db.session.query(func.max(GroupBalanceCheckpoint.month))
+            .filter(GroupBalanceCheckpoint.group_id == gid)
+            .scalar()
+        )
+
+        if last:
+            net = {
+                r.user_id: to_cents(r.net_amount)
+                for r in GroupBalanceCheckpoint.query.filter_by(group_id=gid, month=last)
+            }
+            month = next_month(last)
+        else:
+            first = (
+                db.session.query(func.min(Expense.created_at))
+                .filter(Expense.group_id == gid)
+                .scalar()
+            )
+            if first is None:
+                continue
+            net = {}
+            month = month_of(first)
+
+        while month < current:
+            start, end = month_bounds(month)
+            delta = aggregate_group_net_balances([gid], since={gid: start}, until=end)[gid]
+            for uid, cents in delta.items():
+                net[uid] = net.get(uid, 0) + cents
+
+            db.session.add_all(
+                GroupBalanceCheckpoint(
+                    group_id=gid,
+                    user_id=uid,
+                    month=month,
+                    net_amount=cents_to_decimal(cents),
+                )
+                for uid, cents in net.items()
+            )
+            written += 1
+            month = next_month(month)
+
+        db.session.commit()
+
+    return written
+
+
+def invalidate_checkpoints(group_id: int, from_month: str) -> None:
+    """
+    Drop checkpoints that no longer reflect history after a backdated
+    write. Runs inside the caller's transaction (no commit); the next
+    build recreates them.
+    """
+    GroupBalanceCheckpoint.query.filter(
+        GroupBalanceCheckpoint.group_id == group_id,
+        GroupBalanceCheckpoint.month >= from_month,
+    ).delete(synchronize_session=False)
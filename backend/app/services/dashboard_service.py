@@ -0,0 +1,34 @@
+from app.extensions import db
+from app.models.group import Group
+from app.services.balance_service import group_member_balances
+from app.services.expense_service import group_expense_page
+from app.services.group_service import require_membership
+
+
+def group_dashboard(group_id: int, requester_user_id: int, expense_limit: int):
+    """
+    Everything the group page shows, behind one membership check: the
+    group row (with its maintained counters), members with balances, the
+    settlements, and the newest `expense_limit` expenses.
+
+    A fixed number of queries regardless of group size: group by primary
+    key, members joined to their ledger rows, one expense page (plus the
+    membership lookup when it is not cached).
+
+    Returns:
+        {"group", "members", "settlements", "expenses", "next_cursor"}
+        with expenses as (Expense, User, Category | None) rows
+    """
+    require_membership(group_id, requester_user_id)
+
+    group = db.session.get(Group, group_id)
+    members, settlements = group_member_balances(group_id)
+    expenses, next_cursor = group_expense_page(group_id, expense_limit)
+
+    return {
+        "group": group,
+        "members": members,
+        "settlements": settlements,
+        "expenses": expenses,
+        "next_cursor": next_cursor,
+    }
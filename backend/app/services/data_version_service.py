@@ -0,0 +1,23 @@
+from app.extensions import db
+from app.models.user import User
+
+
+def bump_data_version(user_ids) -> None:
+    """
+    Mark the users' data as changed so version-keyed cache entries are
+    no longer read. Runs inside the caller's transaction (no commit), so
+    the bump becomes visible together with the write it describes.
+    """
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return
+
+    User.query.filter(User.id.in_(user_ids)).update(
+        {User.data_version: User.data_version + 1},
+        synchronize_session=False,
+    )
+
+
+def get_data_version(user_id: int) -> int:
+    version = db.session.query(User.data_version).filter(User.id == user_id).scalar()
+    return version or 0
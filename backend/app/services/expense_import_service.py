@@ -0,0 +1,386 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+from flask import current_app
+from sqlalchemy import insert
+
+from app.extensions import db
+from app.models.user import User
+from app.models.group_member import GroupMember
+from app.models.category import Category
+from app.models.expense import Expense
+from app.models.expense_split import ExpenseSplit
+from app.services.group_service import apply_group_stats, require_membership
+from app.services.data_version_service import bump_data_version
+from app.services.ledger_service import apply_ledger_deltas
+from app.services.checkpoint_service import invalidate_checkpoints
+from app.services.rollup_service import apply_spend_deltas
+from app.services.search_service import index_expenses
+from app.utils.errors import AppError
+from app.utils.dates import default_month, month_of
+from app.utils.money import to_cents, cents_to_decimal, split_equal
+
+
+class _RowError(Exception):
+    pass
+
+
+# =========================
+# Readers
+# =========================
+
+NOT_UTF8 = "Row is not valid UTF-8"
+
+
+def _text(stream, **kwargs) -> io.TextIOWrapper:
+    # Undecodable bytes become lone surrogates instead of failing the
+    # whole read, so they can be reported for the row that has them
+    return io.TextIOWrapper(stream, encoding="utf-8", errors="surrogateescape", **kwargs)
+
+
+def _is_utf8(*values) -> bool:
+    try:
+        for value in values:
+            if value is not None:
+                value.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def iter_csv_rows(stream) -> Iterator[tuple[int, dict | None, str | None]]:
+    """
+    Yield (row_number, row, error) from a CSV byte stream with a header.
+    Columns: paid_by_email, amount, description, category_id, date
+    """
+    reader = csv.DictReader(_text(stream, newline=""))
+
+    idx = 0
+    while True:
+        idx += 1
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as err:
+            # e.g. a NUL byte or an over-long field; the reader resumes
+            # at the next line
+            yield idx, None, f"Invalid CSV: {err}"
+            continue
+
+        row = {k: v for k, v in row.items() if k is not None}
+        if not _is_utf8(*row.keys(), *row.values()):
+            yield idx, None, NOT_UTF8
+            continue
+        yield idx, row, None
+
+
+def iter_ndjson_rows(stream) -> Iterator[tuple[int, dict | None, str | None]]:
+    """
+    Yield (row_number, row, error) from a newline-delimited JSON byte stream.
+    Objects use the same fields as CSV and may add `splits`
+    ([{"email", "amount"}]) for a custom split.
+    """
+    for idx, line in enumerate(_text(stream), start=1):
+        if not line.strip():
+            continue
+        if not _is_utf8(line):
+            yield idx, None, NOT_UTF8
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield idx, None, "Invalid JSON"
+            continue
+        if not isinstance(row, dict):
+            yield idx, None, "Row must be a JSON object"
+            continue
+        yield idx, row, None
+
+
+# =========================
+# Row validation
+# =========================
+
+def _normalize_email(email) -> str:
+    return (email or "").strip().lower() if isinstance(email, str) else ""
+
+
+def _parse_created_at(value) -> datetime | None:
+    if value in (None, ""):
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        raise _RowError("date must be an ISO 8601 date or datetime")
+    # Naive values are taken as UTC; offsets are converted, so month
+    # buckets and ordering are the same as for expenses created live
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _amount_cents(value, field: str) -> int:
+    try:
+        return to_cents(value)
+    except AppError:
+        raise _RowError(f"{field} is invalid")
+
+
+class _GroupContext:
+    """
+    Everything row validation needs, loaded once per import.
+    """
+
+    def __init__(self, group_id: int, requester_user_id: int):
+        members = (
+            db.session.query(GroupMember.user_id, User.email)
+            .join(User, User.id == GroupMember.user_id)
+            .filter(GroupMember.group_id == group_id)
+            .order_by(GroupMember.id)
+            .all()
+        )
+        if len(members) < 2:
+            raise AppError("Group must have at least 2 members to split expenses", 400)
+
+        self.member_ids = [uid for uid, _ in members]
+        self.member_by_email = {email: uid for uid, email in members}
+        self.category_ids = {
+            cid
+            for (cid,) in db.session.query(Category.id).filter(
+                Category.user_id == requester_user_id
+            )
+        }
+
+    def validate(self, row: dict) -> tuple[dict, list[tuple[int, int]]]:
+        email = _normalize_email(row.get("paid_by_email"))
+        if not email:
+            raise _RowError("paid_by_email is required")
+
+        paid_by = self.member_by_email.get(email)
+        if paid_by is None:
+            raise _RowError("paid_by_email is not a member of this group")
+
+        amount_cents = _amount_cents(row.get("amount"), "amount")
+        if amount_cents <= 0:
+            raise _RowError("Amount must be > 0")
+
+        category_id = row.get("category_id")
+        if category_id in (None, ""):
+            category_id = None
+        else:
+            try:
+                category_id = int(category_id)
+            except (TypeError, ValueError):
+                raise _RowError("category_id must be an integer")
+            if category_id not in self.category_ids:
+                raise _RowError("Category not found")
+
+        splits = row.get("splits")
+        if splits in (None, "", []):
+            split_rows = list(
+                zip(self.member_ids, split_equal(amount_cents, len(self.member_ids)))
+            )
+        else:
+            split_rows = self._validate_splits(splits, amount_cents)
+
+        description = row.get("description")
+        expense = {
+            "paid_by_user_id": paid_by,
+            "amount_cents": amount_cents,
+            "description": (str(description).strip() if description else "") or None,
+            "category_id": category_id,
+            "created_at": _parse_created_at(row.get("date")),
+        }
+        return expense, split_rows
+
+    def _validate_splits(self, splits, amount_cents: int) -> list[tuple[int, int]]:
+        if not isinstance(splits, list):
+            raise _RowError("splits must be a non-empty list")
+
+        seen = set()
+        split_rows = []
+        total = 0
+
+        for idx, split in enumerate(splits):
+            if not isinstance(split, dict):
+                raise _RowError(f"splits[{idx}] must be an object")
+
+            email = _normalize_email(split.get("email"))
+            if not email:
+                raise _RowError(f"splits[{idx}].email is required")
+            if email in seen:
+                raise _RowError(f"Duplicate split user: {email}")
+            seen.add(email)
+
+            owed = _amount_cents(split.get("amount"), f"splits[{idx}].amount")
+            if owed < 0:
+                raise _RowError(f"splits[{idx}].amount must be >= 0")
+
+            uid = self.member_by_email.get(email)
+            if uid is None:
+                raise _RowError(f"Split user is not a member of this group: {email}")
+
+            split_rows.append((uid, owed))
+            total += owed
+
+        if total != amount_cents:
+            raise _RowError(
+                f"Sum of splits ({cents_to_decimal(total)}) must equal amount "
+                f"({cents_to_decimal(amount_cents)})"
+            )
+
+        return split_rows
+
+
+# =========================
+# Import
+# =========================
+
+def _flush_chunk(group_id: int, chunk: list[tuple[int, dict, list[tuple[int, int]]]]) -> None:
+    """
+    Insert one chunk of validated rows in a single transaction:
+    one executemany for expenses, one for splits, then the ledger,
+    rollup and search index updates.
+    """
+    now = datetime.now(timezone.utc)
+
+    expense_ids = db.session.scalars(
+        insert(Expense).returning(Expense.id, sort_by_parameter_order=True),
+        [
+            {
+                "group_id": group_id,
+                "paid_by_user_id": expense["paid_by_user_id"],
+                "amount": cents_to_decimal(expense["amount_cents"]),
+                "description": expense["description"],
+                "category_id": expense["category_id"],
+                "created_at": expense["created_at"] or now,
+                "month_bucket": month_of(expense["created_at"] or now),
+            }
+            for _, expense, _ in chunk
+        ],
+    ).all()
+
+    split_params = []
+    deltas: dict[int, int] = {}
+    spend = {}
+    earliest_month = None
+
+    for expense_id, (_, expense, split_rows) in zip(expense_ids, chunk):
+        payer = expense["paid_by_user_id"]
+        deltas[payer] = deltas.get(payer, 0) + expense["amount_cents"]
+
+        key = (payer, expense["category_id"], month_of(expense["created_at"] or now))
+        cents, count = spend.get(key, (0, 0))
+        spend[key] = (cents + expense["amount_cents"], count + 1)
+
+        for uid, owed in split_rows:
+            split_params.append(
+                {
+                    "expense_id": expense_id,
+                    "user_id": uid,
+                    "amount_owed": cents_to_decimal(owed),
+                }
+            )
+            deltas[uid] = deltas.get(uid, 0) - owed
+
+        if expense["created_at"] is not None:
+            month = month_of(expense["created_at"])
+            if earliest_month is None or month < earliest_month:
+                earliest_month = month
+
+    db.session.execute(insert(ExpenseSplit), split_params)
+    apply_ledger_deltas(group_id, deltas)
+    apply_spend_deltas(spend)
+    apply_group_stats(
+        group_id,
+        expenses=len(chunk),
+        amount_cents=sum(expense["amount_cents"] for _, expense, _ in chunk),
+    )
+    bump_data_version(deltas)
+    index_expenses(
+        [
+            (expense_id, group_id, expense["description"], expense["category_id"])
+            for expense_id, (_, expense, _) in zip(expense_ids, chunk)
+        ]
+    )
+
+    # Backdated rows change months that may already be checkpointed
+    if earliest_month is not None and earliest_month < default_month():
+        invalidate_checkpoints(group_id, earliest_month)
+
+    db.session.commit()
+
+
+def import_expenses(
+    group_id: int,
+    requester_user_id: int,
+    rows: Iterable[tuple[int, dict | None, str | None]],
+    chunk_size: int | None = None,
+):
+    """
+    Create many expenses from parsed rows.
+
+    Emails, members and categories are resolved once up front; valid rows
+    are inserted in chunked transactions. Invalid rows are reported with
+    their row number and do not stop the import.
+
+    Returns:
+        {"imported": int, "failed": int, "errors": [{"row", "message"}]}
+    """
+    require_membership(group_id, requester_user_id)
+
+    chunk_size = chunk_size or current_app.config["IMPORT_CHUNK_SIZE"]
+    max_errors = current_app.config["IMPORT_MAX_ERRORS"]
+
+    context = _GroupContext(group_id, requester_user_id)
+
+    imported = 0
+    failed = 0
+    errors = []
+    chunk = []
+
+    def record_error(row_number: int, message: str):
+        nonlocal failed
+        failed += 1
+        if len(errors) < max_errors:
+            errors.append({"row": row_number, "message": message})
+
+    def flush():
+        nonlocal imported
+        try:
+            _flush_chunk(group_id, chunk)
+            imported += len(chunk)
+        except Exception:
+            db.session.rollback()
+            current_app.logger.exception("Expense import chunk failed")
+            for row_number, _, _ in chunk:
+                record_error(row_number, "Could not save row")
+        chunk.clear()
+
+    for row_number, row, error in rows:
+        if error:
+            record_error(row_number, error)
+            continue
+
+        try:
+            expense, split_rows = context.validate(row)
+        except _RowError as err:
+            record_error(row_number, str(err))
+            continue
+
+        chunk.append((row_number, expense, split_rows))
+        if len(chunk) >= chunk_size:
+            flush()
+
+    if chunk:
+        flush()
+
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+    }
@@ -1,43 +1,50 @@
-from decimal import Decimal, ROUND_HALF_UP
+from datetime import datetime
+
+from sqlalchemy import tuple_
 
 from app.extensions import db
 from app.models.user import User
-from app.models.group_member import GroupMember
+from app.models.category import Category
 from app.models.expense import Expense
 from app.models.expense_split import ExpenseSplit
-from app.services.group_service import require_membership
+from app.services.group_service import (
+    apply_group_stats,
+    require_membership,
+    resolve_member_emails,
+)
 from app.services.category_service import require_category_owned_by_user
+from app.services.data_version_service import bump_data_version
+from app.services.ledger_service import apply_expense_to_ledger
+from app.services.rollup_service import apply_expense_to_rollups
+from app.services.request_cache_service import group_members
+from app.services.search_service import index_expense
 from app.utils.errors import AppError
-
-TWOPLACES = Decimal("0.01")
-
-
-def _to_decimal_amount(value) -> Decimal:
-    try:
-        return Decimal(str(value)).quantize(TWOPLACES, rounding=ROUND_HALF_UP)
-    except Exception:
-        raise AppError("Invalid amount", 400)
+from app.utils.money import to_cents, cents_to_decimal, split_equal
+from app.utils.pagination import encode_cursor, decode_cursor
 
 
 def _normalize_email(email: str) -> str:
     return (email or "").strip().lower()
 
 
-def _require_user_by_email(email: str) -> User:
-    user = User.query.filter_by(email=email).first()
-    if not user:
+def _require_paying_member(resolved: dict[str, tuple[int, bool]], email: str) -> int:
+    if email not in resolved:
         raise AppError(
             "paid_by_email must belong to an existing user (add them to the group first)",
             400,
         )
-    return user
+
+    user_id, is_member = resolved[email]
+    if not is_member:
+        raise AppError("paid_by_email is not a member of this group", 400)
+    return user_id
 
 
-def _require_group_members(group_id: int):
-    members = GroupMember.query.filter_by(group_id=group_id).all()
-    if len(members) < 2:
+def _require_group_members(group_id: int) -> list[int]:
+    member_ids = [uid for uid, _ in group_members(group_id)]
+    if len(member_ids) < 2:
         raise AppError("Group must have at least 2 members to split expenses", 400)
-    return members
+    return member_ids
 
 
 # =========================
@@ -64,49 +71,45 @@ def create_expense_equal_split(
     if not email:
         raise AppError("paid_by_email is required", 400)
 
-    amount_dec = _to_decimal_amount(amount)
-    if amount_dec <= 0:
+    amount_cents = to_cents(amount)
+    if amount_cents <= 0:
         raise AppError("Amount must be > 0", 400)
 
-    paid_by_user = _require_user_by_email(email)
-
-    if not GroupMember.query.filter_by(
-        group_id=group_id,
-        user_id=paid_by_user.id,
-    ).first():
-        raise AppError("paid_by_email is not a member of this group", 400)
-
-    members = _require_group_members(group_id)
-    member_ids = [m.user_id for m in members]
+    paid_by_user_id = _require_paying_member(
+        resolve_member_emails(group_id, [email]),
+        email,
+    )
 
-    # Equal split math
-    n = Decimal(len(member_ids))
-    base = (amount_dec / n).quantize(TWOPLACES, rounding=ROUND_HALF_UP)
+    member_ids = _require_group_members(group_id)
 
-    total_base = base * n
-    remainder = (amount_dec - total_base).quantize(TWOPLACES)
-    pennies = int((remainder / TWOPLACES)) if remainder > 0 else 0
+    # Equal split math (integer cents)
+    split_rows = list(zip(member_ids, split_equal(amount_cents, len(member_ids))))
 
     expense = Expense(
         group_id=group_id,
-        paid_by_user_id=paid_by_user.id,
-        amount=amount_dec,
+        paid_by_user_id=paid_by_user_id,
+        amount=cents_to_decimal(amount_cents),
         description=(description or "").strip() or None,
         category_id=cat_id,
     )
     db.session.add(expense)
     db.session.flush()
 
-    for idx, uid in enumerate(member_ids):
-        owed = base + (TWOPLACES if idx < pennies else Decimal("0.00"))
+    for uid, owed in split_rows:
         db.session.add(
             ExpenseSplit(
                 expense_id=expense.id,
                 user_id=uid,
-                amount_owed=owed,
+                amount_owed=cents_to_decimal(owed),
             )
         )
 
+    apply_expense_to_ledger(group_id, paid_by_user_id, amount_cents, split_rows)
+    apply_expense_to_rollups(expense, amount_cents)
+    apply_group_stats(group_id, expenses=1, amount_cents=amount_cents)
+    index_expense(expense)
+    bump_data_version([paid_by_user_id] + [uid for uid, _ in split_rows])
+
     db.session.commit()
     return expense
 
@@ -130,28 +133,33 @@ def create_expense_custom_split(
     if not email:
         raise AppError("paid_by_email is required", 400)
 
-    amount_dec = _to_decimal_amount(amount)
-    if amount_dec <= 0:
+    amount_cents = to_cents(amount)
+    if amount_cents <= 0:
         raise AppError("Amount must be > 0", 400)
 
     if not isinstance(splits, list) or not splits:
         raise AppError("splits must be a non-empty list", 400)
 
-    paid_by_user = _require_user_by_email(email)
+    # Resolve the payer and every split email up front (members from the
+    # group's member list, anyone else in one query); validation below
+    # still reports errors in the original order.
+    resolved = resolve_member_emails(
+        group_id,
+        [email] + [
+            _normalize_email(split["email"])
+            for split in splits
+            if isinstance(split, dict) and isinstance(split.get("email"), str)
+        ],
+    )
 
-    if not GroupMember.query.filter_by(
-        group_id=group_id,
-        user_id=paid_by_user.id,
-    ).first():
-        raise AppError("paid_by_email is not a member of this group", 400)
+    paid_by_user_id = _require_paying_member(resolved, email)
 
-    members = _require_group_members(group_id)
-    member_ids = {m.user_id for m in members}
+    _require_group_members(group_id)
 
     # Validate splits
     seen_emails = set()
-    split_rows: list[tuple[int, Decimal]] = []
-    total = Decimal("0.00")
+    split_rows: list[tuple[int, int]] = []
+    total = 0
 
     for idx, split in enumerate(splits):
         if not isinstance(split, dict):
@@ -165,30 +173,31 @@ def create_expense_custom_split(
             raise AppError(f"Duplicate split user: {email}", 400)
         seen_emails.add(email)
 
-        split_amt = _to_decimal_amount(split.get("amount"))
+        split_amt = to_cents(split.get("amount"))
         if split_amt < 0:
             raise AppError(f"splits[{idx}].amount must be >= 0", 400)
 
-        user = User.query.filter_by(email=email).first()
-        if not user:
+        if email not in resolved:
             raise AppError(f"Split user does not exist: {email}", 400)
-        if user.id not in member_ids:
+        user_id, is_member = resolved[email]
+        if not is_member:
             raise AppError(f"Split user is not a member of this group: {email}", 400)
 
-        split_rows.append((user.id, split_amt))
-        total = (total + split_amt).quantize(TWOPLACES)
+        split_rows.append((user_id, split_amt))
+        total += split_amt
 
-    if total != amount_dec:
+    if total != amount_cents:
         raise AppError(
-            f"Sum of splits ({total}) must equal amount ({amount_dec})",
+            f"Sum of splits ({cents_to_decimal(total)}) must equal amount "
+            f"({cents_to_decimal(amount_cents)})",
             400,
         )
 
     # Create expense
     expense = Expense(
         group_id=group_id,
-        paid_by_user_id=paid_by_user.id,
-        amount=amount_dec,
+        paid_by_user_id=paid_by_user_id,
+        amount=cents_to_decimal(amount_cents),
         description=(description or "").strip() or None,
         category_id=category_id,
     )
@@ -200,9 +209,109 @@ def create_expense_custom_split(
             ExpenseSplit(
                 expense_id=expense.id,
                 user_id=uid,
-                amount_owed=owed,
+                amount_owed=cents_to_decimal(owed),
             )
         )
 
+    apply_expense_to_ledger(group_id, paid_by_user_id, amount_cents, split_rows)
+    apply_expense_to_rollups(expense, amount_cents)
+    apply_group_stats(group_id, expenses=1, amount_cents=amount_cents)
+    index_expense(expense)
+    bump_data_version([paid_by_user_id] + [uid for uid, _ in split_rows])
+
     db.session.commit()
     return expense
+
+
+# =========================
+# Listing
+# =========================
+
+def list_group_expenses(
+    group_id: int,
+    requester_user_id: int,
+    limit: int,
+    cursor: str | None = None,
+    category_id: int | None = None,
+    paid_by_user_id: int | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+):
+    """
+    Newest-first page of a group's expenses with payer and category
+    joined in the same query.
+
+    Keyset pagination over (created_at, id): every page is a range scan on
+    ix_expenses_group_created_id, so deep pages cost the same as the first.
+    `created_to` is exclusive.
+
+    Returns:
+        ([(Expense, User, Category | None)], next_cursor | None)
+    """
+    require_membership(group_id, requester_user_id)
+
+    return group_expense_page(
+        group_id,
+        limit,
+        cursor,
+        category_id=category_id,
+        paid_by_user_id=paid_by_user_id,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
+def group_expense_page(
+    group_id: int,
+    limit: int,
+    cursor: str | None = None,
+    category_id: int | None = None,
+    paid_by_user_id: int | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+):
+    """list_group_expenses without the membership check; callers authorize."""
+    query = (
+        db.session.query(Expense, User, Category)
+        .join(User, User.id == Expense.paid_by_user_id)
+        .outerjoin(Category, Category.id == Expense.category_id)
+        .filter(Expense.group_id == group_id)
+    )
+
+    if category_id is not None:
+        query = query.filter(Expense.category_id == category_id)
+    if paid_by_user_id is not None:
+        query = query.filter(Expense.paid_by_user_id == paid_by_user_id)
+    if created_from is not None:
+        query = query.filter(Expense.created_at >= created_from)
+    if created_to is not None:
+        query = query.filter(Expense.created_at < created_to)
+
+    after = decode_cursor(cursor, 2)
+    if after:
+        try:
+            after_created_at = datetime.fromisoformat(after[0])
+            after_id = int(after[1])
+        except (TypeError, ValueError):
+            raise AppError("Invalid cursor", 400)
+
+        # Row-value comparison, so the planner seeks on
+        # ix_expenses_group_created_id instead of scanning the group
+        query = query.filter(
+            tuple_(Expense.created_at, Expense.id) < (after_created_at, after_id)
+        )
+
+    rows = (
+        query
+        .order_by(Expense.created_at.desc(), Expense.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1][0]
+        next_cursor = encode_cursor([last.created_at.isoformat(), last.id])
+
+    return rows, next_cursor
@@ -1,10 +1,23 @@
-from sqlalchemy import func
+from typing import Iterable
+
+from flask import current_app
 
 from app.extensions import db
 from app.models.group import Group
 from app.models.group_member import GroupMember
 from app.models.user import User
+from app.services.membership_cache_service import is_group_member
+from app.services.request_cache_service import (
+    forget_group_members,
+    group_members,
+    is_member,
+    user_by_email,
+    users_by_email,
+)
 from app.utils.errors import AppError
+from app.utils.money import cents_to_decimal
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.upsert import dialect_insert
 
 
 # =========================
@@ -12,14 +25,53 @@ from app.utils.errors import AppError
 # =========================
 
 def require_membership(group_id: int, user_id: int) -> None:
-    member = GroupMember.query.filter_by(
-        group_id=group_id,
-        user_id=user_id,
-    ).first()
-    if not member:
+    if not is_group_member(group_id, user_id):
         raise AppError("You are not a member of this group", 403)
 
 
+def resolve_member_emails(
+    group_id: int,
+    emails: Iterable[str],
+) -> dict[str, tuple[int, bool]]:
+    """
+    Resolve normalized emails to users and their membership in the group.
+
+    Members come from the group's member list; only emails outside it are
+    looked up, in one IN query (per 500 emails).
+    Returns {email: (user_id, is_member)}; unknown emails are absent.
+    """
+    unique = list(dict.fromkeys(e for e in emails if e))
+    members = {email: uid for uid, email in group_members(group_id)}
+
+    resolved = {e: (members[e], True) for e in unique if e in members}
+    others = users_by_email(e for e in unique if e not in members)
+    for email, user in others.items():
+        resolved[email] = (user.id, False)
+
+    return resolved
+
+
+def apply_group_stats(
+    group_id: int,
+    members: int = 0,
+    expenses: int = 0,
+    amount_cents: int = 0,
+) -> None:
+    """
+    Adjust the denormalized counters on the group row. Runs inside the
+    caller's transaction (no commit) and increments in SQL, so concurrent
+    writers never overwrite each other's contribution.
+    """
+    Group.query.filter(Group.id == group_id).update(
+        {
+            Group.member_count: Group.member_count + members,
+            Group.expense_count: Group.expense_count + expenses,
+            Group.expense_total: Group.expense_total + cents_to_decimal(amount_cents),
+        },
+        synchronize_session=False,
+    )
+
+
 # =========================
 # Core services
 # =========================
@@ -35,6 +87,7 @@ def create_group(owner_user_id: int, name: str) -> Group:
     group = Group(
         name=name,
         created_by_user_id=owner_user_id,
+        member_count=1,
     )
     db.session.add(group)
     db.session.flush()  # ensures group.id is available
@@ -50,42 +103,44 @@ def create_group(owner_user_id: int, name: str) -> Group:
     return group
 
 
-def list_groups_for_user(user_id: int):
+def list_groups_for_user(user_id: int, limit: int, cursor: str | None = None):
     """
-    List all groups the user belongs to, with member count.
+    Newest-first page of the groups the user belongs to.
+
+    Counts come from the maintained columns on the group row, and keyset
+    pagination over group id makes every page one range scan on
+    ix_group_members_user_group plus primary-key lookups.
 
     Returns:
-        List[dict]: [
-          {
-            "group": Group,
-            "member_count": int
-          }
-        ]
+        ([Group], next_cursor | None)
     """
-    rows = (
-        db.session.query(
-            Group,
-            func.count(GroupMember.user_id).label("member_count"),
-        )
+    query = (
+        db.session.query(Group)
         .join(GroupMember, GroupMember.group_id == Group.id)
-        .filter(
-            GroupMember.group_id.in_(
-                db.session.query(GroupMember.group_id)
-                .filter(GroupMember.user_id == user_id)
-            )
-        )
-        .group_by(Group.id)
-        .order_by(Group.created_at.desc())
+        .filter(GroupMember.user_id == user_id)
+    )
+
+    after = decode_cursor(cursor, 1)
+    if after:
+        try:
+            after_id = int(after[0])
+        except (TypeError, ValueError):
+            raise AppError("Invalid cursor", 400)
+        query = query.filter(GroupMember.group_id < after_id)
+
+    groups = (
+        query
+        .order_by(GroupMember.group_id.desc())
+        .limit(limit + 1)
         .all()
     )
 
-    return [
-        {
-            "group": group,
-            "member_count": member_count,
-        }
-        for group, member_count in rows
-    ]
+    next_cursor = None
+    if len(groups) > limit:
+        groups = groups[:limit]
+        next_cursor = encode_cursor([groups[-1].id])
+
+    return groups, next_cursor
 
 
 def add_member_by_email(
@@ -103,22 +158,105 @@ def add_member_by_email(
     if not email:
         raise AppError("Email is required", 400)
 
-    user = User.query.filter_by(email=email).first()
+    user = user_by_email(email)
     if not user:
         raise AppError("User not found", 404)
 
-    existing = GroupMember.query.filter_by(
-        group_id=group_id,
-        user_id=user.id,
-    ).first()
-    if existing:
+    if is_member(group_id, user.id):
         return user  # idempotent add
 
-    db.session.add(
-        GroupMember(
-            group_id=group_id,
-            user_id=user.id,
+    # A concurrent add of the same user inserts nothing here
+    _insert_members(group_id, [user.id])
+    return user
+
+
+def add_members_by_email(
+    group_id: int,
+    requester_user_id: int,
+    emails: list,
+) -> list[dict]:
+    """
+    Add many users to a group by email.
+
+    Users and existing memberships are resolved with set-based queries,
+    new members are inserted with one statement, and everything commits
+    once. Like add_member_by_email, adding someone who is already a
+    member is not an error.
+
+    Returns one outcome per distinct email (and per invalid entry), in
+    request order:
+        [{"email", "status", "user_id"}]
+    where status is "added", "already_member", "not_found" or "invalid"
+    (user_id is None unless the user exists).
+    """
+    require_membership(group_id, requester_user_id)
+
+    if not isinstance(emails, list):
+        raise AppError("emails must be a list", 400)
+
+    max_emails = current_app.config["MEMBER_BULK_MAX_EMAILS"]
+    if len(emails) > max_emails:
+        raise AppError(f"At most {max_emails} emails per request", 400)
+
+    valid = [e.strip().lower() for e in emails if isinstance(e, str) and e.strip()]
+    resolved = resolve_member_emails(group_id, valid)
+
+    results = []
+    seen = set()
+    new_user_ids = []
+
+    for entry in emails:
+        if not isinstance(entry, str) or not entry.strip():
+            results.append({"email": entry, "status": "invalid", "user_id": None})
+            continue
+
+        email = entry.strip().lower()
+        if email in seen:
+            continue
+        seen.add(email)
+
+        if email not in resolved:
+            results.append({"email": email, "status": "not_found", "user_id": None})
+            continue
+
+        user_id, is_member = resolved[email]
+        if is_member:
+            status = "already_member"
+        else:
+            status = "added"
+            new_user_ids.append(user_id)
+        results.append({"email": email, "status": status, "user_id": user_id})
+
+    # Users a concurrent request added first were not inserted by us
+    inserted = _insert_members(group_id, new_user_ids)
+    for result in results:
+        if result["status"] == "added" and result["user_id"] not in inserted:
+            result["status"] = "already_member"
+
+    return results
+
+
+def _insert_members(group_id: int, user_ids: list[int]) -> set[int]:
+    """
+    Add users to the group and commit. Rows that already exist (added by
+    a concurrent request) are skipped rather than failing the insert;
+    member_count grows by the rows actually written, whose user ids are
+    returned.
+    """
+    if not user_ids:
+        return set()
+
+    inserted = set(
+        db.session.scalars(
+            dialect_insert(GroupMember)
+            .values([{"group_id": group_id, "user_id": uid} for uid in user_ids])
+            .on_conflict_do_nothing(index_elements=["group_id", "user_id"])
+            .returning(GroupMember.user_id)
         )
     )
+
+    if inserted:
+        apply_group_stats(group_id, members=len(inserted))
     db.session.commit()
-    return user
+    forget_group_members(group_id)
+    return inserted
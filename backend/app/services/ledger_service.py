@@ -0,0 +1,205 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, cast, func, or_, select, union_all
+
+from app.extensions import db
+from app.models.group import Group
+from app.models.group_balance import GroupBalance
+from app.models.expense import Expense
+from app.models.expense_split import ExpenseSplit
+from app.utils.money import to_cents, cents_to_decimal
+
+
+# =========================
+# Incremental updates
+# =========================
+
+def apply_ledger_deltas(group_id: int, deltas: dict[int, int]) -> None:
+    """
+    Add per-user deltas (integer cents) to the group's ledger rows.
+
+    Runs inside the caller's transaction (no commit). Existing rows are
+    updated with `net_amount = net_amount + delta` so concurrent writers
+    never overwrite each other's contribution.
+    """
+    deltas = {uid: d for uid, d in deltas.items() if d}
+    if not deltas:
+        return
+
+    rows = (
+        GroupBalance.query
+        .filter(GroupBalance.group_id == group_id)
+        .filter(GroupBalance.user_id.in_(list(deltas)))
+        .all()
+    )
+    existing = {r.user_id: r for r in rows}
+
+    for uid, delta in deltas.items():
+        row = existing.get(uid)
+        if row:
+            row.net_amount = GroupBalance.net_amount + cents_to_decimal(delta)
+        else:
+            db.session.add(
+                GroupBalance(
+                    group_id=group_id,
+                    user_id=uid,
+                    net_amount=cents_to_decimal(delta),
+                )
+            )
+
+
+def apply_expense_to_ledger(
+    group_id: int,
+    paid_by_user_id: int,
+    amount_cents: int,
+    split_rows: list[tuple[int, int]],
+) -> None:
+    """
+    Record one expense in the ledger: the payer is credited the full
+    amount and every split user is debited what they owe.
+    """
+    deltas = {paid_by_user_id: amount_cents}
+    for uid, owed in split_rows:
+        deltas[uid] = deltas.get(uid, 0) - owed
+
+    apply_ledger_deltas(group_id, deltas)
+
+
+# =========================
+# Full recomputation
+# =========================
+
+def cents_column(column):
+    """SQL expression converting a Numeric(12, 2) column to integer cents."""
+    return cast(func.round(column * 100), Integer)
+
+
+def _history_filter(
+    group_ids: list[int],
+    since: dict[int, datetime] | None,
+    until: datetime | None,
+):
+    since = since or {}
+    groups = [
+        (Expense.group_id == gid) & (Expense.created_at >= since[gid])
+        for gid in group_ids
+        if gid in since
+    ]
+    unbounded = [gid for gid in group_ids if gid not in since]
+    if unbounded:
+        groups.append(Expense.group_id.in_(unbounded))
+
+    condition = or_(*groups)
+    if until is not None:
+        condition = condition & (Expense.created_at < until)
+    return condition
+
+
+def aggregate_group_net_balances(
+    group_ids: list[int],
+    since: dict[int, datetime] | None = None,
+    until: datetime | None = None,
+) -> dict[int, dict[int, int]]:
+    """
+    Net balance per group and user (paid - owed, in cents) computed by the
+    database in one grouped statement. Only one row per (group, user)
+    comes back, so memory stays flat no matter how much history there is.
+
+    `since` optionally maps a group id to the first created_at to include
+    for that group; `until` is an exclusive upper bound for all groups.
+    """
+    condition = _history_filter(group_ids, since, until)
+
+    paid = (
+        select(
+            Expense.group_id.label("group_id"),
+            Expense.paid_by_user_id.label("user_id"),
+            func.sum(cents_column(Expense.amount)).label("net_cents"),
+        )
+        .where(condition)
+        .group_by(Expense.group_id, Expense.paid_by_user_id)
+    )
+    owed = (
+        select(
+            Expense.group_id.label("group_id"),
+            ExpenseSplit.user_id.label("user_id"),
+            (-func.sum(cents_column(ExpenseSplit.amount_owed))).label("net_cents"),
+        )
+        .join(Expense, Expense.id == ExpenseSplit.expense_id)
+        .where(condition)
+        .group_by(Expense.group_id, ExpenseSplit.user_id)
+    )
+    history = union_all(paid, owed).subquery()
+
+    rows = db.session.execute(
+        select(history.c.group_id, history.c.user_id, func.sum(history.c.net_cents))
+        .group_by(history.c.group_id, history.c.user_id)
+    ).all()
+
+    result: dict[int, dict[int, int]] = {gid: {} for gid in group_ids}
+    for gid, uid, cents in rows:
+        result[gid][uid] = int(cents)
+    return result
+
+
+def aggregate_net_balances(group_id: int) -> dict[int, int]:
+    return aggregate_group_net_balances([group_id])[group_id]
+
+
+def _group_ids(group_id: int | None) -> list[int]:
+    if group_id is not None:
+        return [group_id]
+    return [gid for (gid,) in db.session.query(Group.id).order_by(Group.id)]
+
+
+def rebuild_ledger(group_id: int | None = None) -> int:
+    """
+    Drop and recreate ledger rows from history.
+    Rebuilds a single group, or every group when group_id is None.
+    Returns the number of groups rebuilt.
+    """
+    group_ids = _group_ids(group_id)
+
+    for gid in group_ids:
+        GroupBalance.query.filter_by(group_id=gid).delete()
+        for uid, amount in aggregate_net_balances(gid).items():
+            db.session.add(
+                GroupBalance(
+                    group_id=gid,
+                    user_id=uid,
+                    net_amount=cents_to_decimal(amount),
+                )
+            )
+        db.session.commit()
+
+    return len(group_ids)
+
+
+def check_ledger(group_id: int | None = None) -> list[dict]:
+    """
+    Compare ledger rows against a full recomputation.
+    Returns one entry per (group, user) that disagrees.
+    """
+    mismatches = []
+
+    for gid in _group_ids(group_id):
+        expected = aggregate_net_balances(gid)
+        stored = {
+            r.user_id: to_cents(r.net_amount)
+            for r in GroupBalance.query.filter_by(group_id=gid).all()
+        }
+
+        for uid in sorted(set(expected) | set(stored)):
+            want = expected.get(uid, 0)
+            have = stored.get(uid, 0)
+            if want != have:
+                mismatches.append(
+                    {
+                        "group_id": gid,
+                        "user_id": uid,
+                        "ledger": cents_to_decimal(have),
+                        "expected": cents_to_decimal(want),
+                    }
+                )
+
+    return mismatches
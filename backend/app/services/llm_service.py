@@ -0,0 +1,210 @@
+"""
+LLM providers behind a small interface, so the AI features do not care
+which backend answers.
+
+- "openai": the OpenAI API. The openai package is imported and the client
+  built on first use, so workers that never serve AI never load it.
+- "fake": a deterministic local stand-in for development, offline runs
+  and load tests.
+
+Select with LLM_PROVIDER.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+from typing import Iterator
+
+from flask import current_app
+
+from app.utils.errors import AppError
+
+
+class LLMProvider:
+    name = "base"
+
+    def enabled(self) -> bool:
+        return True
+
+    def complete(self, messages: list[dict], model: str, temperature: float) -> str:
+        """Full response text for a chat completion."""
+        raise NotImplementedError
+
+    def stream(self, messages: list[dict], model: str, temperature: float) -> Iterator[str]:
+        """Response text fragments as they are generated."""
+        raise NotImplementedError
+
+
+def _with_retries(call, retryable: tuple, max_retries: int, base_ms: int):
+    """
+    Run `call`, retrying retryable errors up to max_retries times with
+    exponential backoff and full jitter.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return call()
+        except retryable:
+            if attempt == max_retries:
+                raise
+            delay_ms = random.uniform(0, base_ms * 2 ** attempt)
+            current_app.logger.warning(
+                "LLM call failed (attempt %d/%d), retrying in %.0f ms",
+                attempt + 1,
+                max_retries + 1,
+                delay_ms,
+            )
+            time.sleep(delay_ms / 1000)
+
+
+# =========================
+# OpenAI
+# =========================
+
+class OpenAIProvider(LLMProvider):
+    name = "openai"
+
+    def __init__(self, api_key: str | None, base_url: str | None, timeout: float,
+                 max_retries: int, retry_base_ms: int):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base_ms = retry_base_ms
+        self._client = None
+        self._lock = threading.Lock()
+
+    def enabled(self) -> bool:
+        return bool(self.api_key)
+
+    def _get_client(self):
+        with self._lock:
+            if self._client is None:
+                try:
+                    from openai import OpenAI
+                except ImportError:
+                    raise AppError("AI insights are disabled (openai is not installed)", 503)
+
+                # Retries are ours (with jitter), not the SDK's
+                self._client = OpenAI(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    timeout=self.timeout,
+                    max_retries=0,
+                )
+            return self._client
+
+    def _call(self, **kwargs):
+        # Client first: it turns a missing package into a 503
+        client = self._get_client()
+        import openai
+
+        try:
+            return _with_retries(
+                lambda: client.chat.completions.create(**kwargs),
+                (
+                    openai.APITimeoutError,
+                    openai.APIConnectionError,
+                    openai.RateLimitError,
+                    openai.InternalServerError,
+                ),
+                self.max_retries,
+                self.retry_base_ms,
+            )
+        except openai.OpenAIError:
+            current_app.logger.exception("OpenAI request failed")
+            raise AppError("AI provider is unavailable, try again later", 503, code="SERVICE_UNAVAILABLE")
+
+    def complete(self, messages, model, temperature):
+        response = self._call(model=model, messages=messages, temperature=temperature)
+        return response.choices[0].message.content
+
+    def stream(self, messages, model, temperature):
+        # Only opening the stream is retried; a stream cut off midway fails
+        response = self._call(model=model, messages=messages, temperature=temperature, stream=True)
+        return self._fragments(response)
+
+    @staticmethod
+    def _fragments(response) -> Iterator[str]:
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+# =========================
+# Fake
+# =========================
+
+class FakeProvider(LLMProvider):
+    """
+    Deterministic responses in the insight JSON shape: the same messages
+    always produce the same text. `latency_ms` is spent before the first
+    fragment, like a model's time to first token.
+    """
+    name = "fake"
+
+    def __init__(self, latency_ms: int = 0):
+        self.latency_ms = latency_ms
+
+    def _content(self, messages: list[dict]) -> str:
+        digest = hashlib.sha256(json.dumps(messages, sort_keys=True).encode()).hexdigest()[:8]
+        return json.dumps(
+            {
+                "alerts": [],
+                "good_news": [],
+                "suggestions": [],
+                "summary": f"Fake insights for request {digest}.",
+            }
+        )
+
+    def complete(self, messages, model, temperature):
+        time.sleep(self.latency_ms / 1000)
+        return self._content(messages)
+
+    def stream(self, messages, model, temperature):
+        content = self._content(messages)
+
+        def fragments():
+            time.sleep(self.latency_ms / 1000)
+            for i in range(0, len(content), 4):
+                yield content[i:i + 4]
+
+        return fragments()
+
+
+# =========================
+# Selection
+# =========================
+
+_providers: dict[tuple, LLMProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_provider() -> LLMProvider:
+    """The configured provider, built once per process and configuration."""
+    config = current_app.config
+    name = config["LLM_PROVIDER"]
+
+    if name == "openai":
+        key = (
+            name,
+            config["OPENAI_API_KEY"],
+            config["OPENAI_BASE_URL"],
+            config["LLM_TIMEOUT_SECONDS"],
+            config["LLM_MAX_RETRIES"],
+            config["LLM_RETRY_BASE_MS"],
+        )
+    elif name == "fake":
+        key = (name, config["LLM_FAKE_LATENCY_MS"])
+    else:
+        raise AppError("LLM_PROVIDER must be one of: openai, fake", 500, code="SERVER_ERROR")
+
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            if name == "openai":
+                provider = OpenAIProvider(*key[1:])
+            else:
+                provider = FakeProvider(*key[1:])
+            _providers[key] = provider
+        return provider
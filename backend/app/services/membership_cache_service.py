@@ -0,0 +1,44 @@
+"""
+Process-wide cache of known group member ids, so authorization checks on
+the hot path usually cost no database round trip.
+
+Members are only ever added, so a cached set can be missing a member but
+never holds a removed one. That needs no coordination between workers:
+a user not in the set is looked up with a point query (and added on
+success) before access is refused, and membership writes leave the
+cache alone.
+"""
+import threading
+
+from app.extensions import membership_cache
+from app.services.request_cache_service import is_member
+
+_stats_lock = threading.Lock()
+_stats = {"lookups": 0}
+
+
+def is_group_member(group_id: int, user_id: int) -> bool:
+    # A hit only when the cached set answers; otherwise it is a miss
+    # even if the group has an entry
+    member_ids = membership_cache.get(group_id, count=False)
+    if member_ids is not None and user_id in member_ids:
+        membership_cache.record(hit=True)
+        return True
+
+    membership_cache.record(hit=False)
+    with _stats_lock:
+        _stats["lookups"] += 1
+
+    if not is_member(group_id, user_id):
+        return False
+
+    membership_cache.set(group_id, (member_ids or frozenset()) | {user_id})
+    return True
+
+
+def membership_cache_stats() -> dict:
+    with _stats_lock:
+        return {
+            **membership_cache.stats(),
+            **_stats,
+        }
@@ -0,0 +1,177 @@
+"""
+Request-scoped cache for rows several services look up while handling
+one request: users by email, group members and memberships, and
+categories.
+
+Entries live on flask.g and are dropped when the request ends, so there
+is no cross-request staleness; services that write these rows update or
+forget the entries themselves. Outside a request (CLI commands,
+background jobs) every lookup goes to the database.
+"""
+from typing import Iterable
+
+from flask import g, has_request_context
+
+from app.extensions import db
+from app.models.category import Category
+from app.models.group_member import GroupMember
+from app.models.user import User
+
+# Keeps IN lists well under SQLite's bound-parameter limit
+EMAIL_BATCH_SIZE = 500
+
+
+def _bucket(name: str) -> dict | None:
+    if not has_request_context():
+        return None
+
+    cache = g.get("request_cache")
+    if cache is None:
+        cache = g.request_cache = {}
+    return cache.setdefault(name, {})
+
+
+def clear_request_cache(_exc=None) -> None:
+    """teardown_request hook; also safe to call mid-request."""
+    g.pop("request_cache", None)
+
+
+# =========================
+# Users
+# =========================
+
+def users_by_email(emails: Iterable[str]) -> dict[str, User]:
+    """
+    Users for normalized emails, one IN query (per 500) for those not
+    seen yet in this request. Unknown emails are absent from the result.
+    """
+    unique = list(dict.fromkeys(e for e in emails if e))
+    bucket = _bucket("users_by_email")
+    if bucket is None:
+        bucket = {}
+
+    missing = [e for e in unique if e not in bucket]
+    for start in range(0, len(missing), EMAIL_BATCH_SIZE):
+        batch = missing[start:start + EMAIL_BATCH_SIZE]
+        found = {u.email: u for u in User.query.filter(User.email.in_(batch))}
+        for email in batch:
+            bucket[email] = found.get(email)  # None: known not to exist
+
+    return {e: bucket[e] for e in unique if bucket[e] is not None}
+
+
+def user_by_email(email: str) -> User | None:
+    return users_by_email([email]).get(email)
+
+
+# =========================
+# Group members
+# =========================
+
+def group_members(group_id: int) -> list[tuple[int, str]]:
+    """(user_id, email) of every member of the group, in join order."""
+    bucket = _bucket("group_members")
+    if bucket is not None and group_id in bucket:
+        return bucket[group_id]
+
+    members = [
+        (user_id, email)
+        for user_id, email in (
+            db.session.query(GroupMember.user_id, User.email)
+            .join(User, User.id == GroupMember.user_id)
+            .filter(GroupMember.group_id == group_id)
+            .order_by(GroupMember.id)
+        )
+    ]
+    if bucket is not None:
+        bucket[group_id] = members
+    return members
+
+
+def cached_group_members(group_id: int) -> list[tuple[int, str]] | None:
+    """The member list if already loaded in this request, without querying."""
+    bucket = _bucket("group_members")
+    return bucket.get(group_id) if bucket is not None else None
+
+
+def remember_group_members(group_id: int, members: list[tuple[int, str]]) -> None:
+    """Seed the cache from a query that already loaded the full member list."""
+    bucket = _bucket("group_members")
+    if bucket is not None:
+        bucket[group_id] = members
+
+
+def forget_group_members(group_id: int) -> None:
+    bucket = _bucket("group_members")
+    if bucket is not None:
+        bucket.pop(group_id, None)
+
+    memberships = _bucket("memberships")
+    if memberships is not None:
+        for key in [k for k in memberships if k[0] == group_id]:
+            del memberships[key]
+
+
+def is_member(group_id: int, user_id: int) -> bool:
+    """
+    Whether the user belongs to the group: from the member list if this
+    request already loaded it, otherwise one point query.
+    """
+    members = cached_group_members(group_id)
+    if members is not None:
+        return any(uid == user_id for uid, _ in members)
+
+    bucket = _bucket("memberships")
+    key = (group_id, user_id)
+    if bucket is not None and key in bucket:
+        return bucket[key]
+
+    found = (
+        db.session.query(GroupMember.id)
+        .filter_by(group_id=group_id, user_id=user_id)
+        .first()
+    ) is not None
+    if bucket is not None:
+        bucket[key] = found
+    return found
+
+
+# =========================
+# Categories
+# =========================
+
+def category_by_id(user_id: int, category_id: int) -> Category | None:
+    """The user's category with this id, or None."""
+    bucket = _bucket("categories")
+    key = (user_id, category_id)
+    if bucket is not None and key in bucket:
+        return bucket[key]
+
+    category = Category.query.filter_by(id=category_id, user_id=user_id).first()
+    if bucket is not None:
+        bucket[key] = category
+    return category
+
+
+def category_by_name(user_id: int, name: str) -> Category | None:
+    """The user's category with this exact (normalized) name, or None."""
+    bucket = _bucket("category_names")
+    key = (user_id, name)
+    if bucket is not None and key in bucket:
+        return bucket[key]
+
+    category = Category.query.filter_by(user_id=user_id, name=name).first()
+    if bucket is not None:
+        bucket[key] = category
+    return category
+
+
+def remember_category(category: Category) -> None:
+    """Record a newly created category under its id and name."""
+    by_id = _bucket("categories")
+    if by_id is not None:
+        by_id[(category.user_id, category.id)] = category
+
+    by_name = _bucket("category_names")
+    if by_name is not None:
+        by_name[(category.user_id, category.name)] = category
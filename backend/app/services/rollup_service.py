@@ -0,0 +1,170 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import func
+
+from app.extensions import db
+from app.models.expense import Expense
+from app.models.monthly_spend_rollup import MonthlySpendRollup, ROLLUP_KEY
+from app.services.ledger_service import cents_column
+from app.utils.money import to_cents, cents_to_decimal
+from app.utils.upsert import dialect_insert
+
+# (user_id, category_id, month) -> (amount_cents, expense_count)
+RollupDeltas = dict[tuple[int, int | None, str], tuple[int, int]]
+
+
+# =========================
+# Incremental updates
+# =========================
+
+def apply_spend_deltas(deltas: RollupDeltas) -> None:
+    """
+    Add spend to the payers' monthly rollup rows.
+
+    Runs inside the caller's transaction (no commit). One
+    INSERT ... ON CONFLICT DO UPDATE for all keys: new rows are created
+    and existing ones get `total = total + delta`, so concurrent writers
+    never overwrite each other's contribution or race on the insert.
+    """
+    if not deltas:
+        return
+
+    stmt = dialect_insert(MonthlySpendRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(ROLLUP_KEY),
+        set_={
+            "total_amount": MonthlySpendRollup.total_amount + stmt.excluded.total_amount,
+            "expense_count": MonthlySpendRollup.expense_count + stmt.excluded.expense_count,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+    # Keys in a fixed order, so concurrent upserts lock rows in the same order
+    now = datetime.now(timezone.utc)
+    db.session.execute(
+        stmt,
+        [
+            {
+                "user_id": user_id,
+                "category_id": category_id,
+                "month": month,
+                "total_amount": cents_to_decimal(cents),
+                "expense_count": count,
+                "updated_at": now,
+            }
+            for (user_id, category_id, month), (cents, count) in sorted(
+                deltas.items(), key=lambda kv: (kv[0][0], kv[0][2], kv[0][1] or 0)
+            )
+        ],
+    )
+
+
+def apply_expense_to_rollups(expense: Expense, amount_cents: int) -> None:
+    """Record one flushed expense against its payer's month and category."""
+    key = (expense.paid_by_user_id, expense.category_id, expense.month_bucket)
+    apply_spend_deltas({key: (amount_cents, 1)})
+
+
+# =========================
+# Reads
+# =========================
+
+def monthly_spend(user_id: int, month: str) -> dict[int | None, Decimal]:
+    """Amount the user paid per category_id (None = uncategorized) in a month."""
+    rows = (
+        db.session.query(MonthlySpendRollup.category_id, MonthlySpendRollup.total_amount)
+        .filter(MonthlySpendRollup.user_id == user_id)
+        .filter(MonthlySpendRollup.month == month)
+        .all()
+    )
+    return {category_id: Decimal(str(total)) for category_id, total in rows}
+
+
+# =========================
+# Full recomputation
+# =========================
+
+def aggregate_monthly_spend(user_id: int | None = None) -> RollupDeltas:
+    """
+    Spend per (payer, category, month) recomputed from expenses in one
+    grouped statement.
+    """
+    query = (
+        db.session.query(
+            Expense.paid_by_user_id,
+            Expense.category_id,
+            Expense.month_bucket,
+            func.sum(cents_column(Expense.amount)),
+            func.count(Expense.id),
+        )
+        .group_by(Expense.paid_by_user_id, Expense.month_bucket, Expense.category_id)
+    )
+    if user_id is not None:
+        query = query.filter(Expense.paid_by_user_id == user_id)
+
+    return {
+        (uid, category_id, m): (int(cents), int(count))
+        for uid, category_id, m, cents, count in query
+    }
+
+
+def rebuild_rollups(user_id: int | None = None) -> int:
+    """
+    Drop and recreate rollup rows from expense history, for one payer or
+    for everyone when user_id is None. Returns the number of rows written.
+    """
+    stale = MonthlySpendRollup.query
+    if user_id is not None:
+        stale = stale.filter(MonthlySpendRollup.user_id == user_id)
+    stale.delete(synchronize_session=False)
+
+    expected = aggregate_monthly_spend(user_id)
+    db.session.add_all(
+        MonthlySpendRollup(
+            user_id=uid,
+            category_id=category_id,
+            month=month,
+            total_amount=cents_to_decimal(cents),
+            expense_count=count,
+        )
+        for (uid, category_id, month), (cents, count) in expected.items()
+    )
+    db.session.commit()
+    return len(expected)
+
+
+def verify_rollups(user_id: int | None = None) -> list[dict]:
+    """
+    Compare rollup rows against a full recomputation.
+    Returns one entry per (user, category, month) that disagrees.
+    """
+    expected = aggregate_monthly_spend(user_id)
+
+    query = MonthlySpendRollup.query
+    if user_id is not None:
+        query = query.filter(MonthlySpendRollup.user_id == user_id)
+    stored = {
+        (r.user_id, r.category_id, r.month): (to_cents(r.total_amount), r.expense_count)
+        for r in query
+    }
+
+    mismatches = []
+    for key in sorted(set(expected) | set(stored), key=lambda k: (k[0], k[2], k[1] or 0)):
+        want = expected.get(key, (0, 0))
+        have = stored.get(key, (0, 0))
+        if want != have:
+            uid, category_id, month = key
+            mismatches.append(
+                {
+                    "user_id": uid,
+                    "category_id": category_id,
+                    "month": month,
+                    "rollup": cents_to_decimal(have[0]),
+                    "rollup_count": have[1],
+                    "expected": cents_to_decimal(want[0]),
+                    "expected_count": want[1],
+                }
+            )
+
+    return mismatches
@@ -0,0 +1,182 @@
+import re
+
+from sqlalchemy import text
+
+from app.extensions import db
+from app.models.user import User
+from app.models.category import Category
+from app.models.expense import Expense
+from app.services.group_service import require_membership
+from app.utils.errors import AppError
+from app.utils.pagination import encode_cursor, decode_cursor
+
+# SQLite FTS5 index over expense descriptions and category names.
+# rowid is the expense id; group_key ("g<group_id>") is indexed so a
+# search only walks postings for one group.
+SEARCH_TABLE = "expense_search"
+
+# bm25 column weights: group_key, description, category_name
+_RANK = f"bm25({SEARCH_TABLE}, 0.0, 1.0, 0.5)"
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def search_enabled() -> bool:
+    return db.engine.dialect.name == "sqlite"
+
+
+def _group_key(group_id: int) -> str:
+    return f"g{group_id}"
+
+
+def ensure_search_index() -> None:
+    if not search_enabled():
+        return
+
+    db.session.execute(
+        text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+            "group_key, description, category_name, "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+    )
+
+
+# =========================
+# Indexing
+# =========================
+
+def index_expenses(rows: list[tuple[int, int, str | None, int | None]]) -> None:
+    """
+    Add (expense_id, group_id, description, category_id) rows to the
+    search index. Runs inside the caller's transaction (no commit).
+    """
+    if not search_enabled():
+        return
+
+    params = [
+        {
+            "id": expense_id,
+            "group_key": _group_key(group_id),
+            "description": description or "",
+            "category_id": category_id,
+        }
+        for expense_id, group_id, description, category_id in rows
+        if description or category_id
+    ]
+    if not params:
+        return
+
+    db.session.execute(
+        text(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, group_key, description, category_name) "
+            "VALUES (:id, :group_key, :description, "
+            "COALESCE((SELECT name FROM categories WHERE id = :category_id), ''))"
+        ),
+        params,
+    )
+
+
+def index_expense(expense: Expense) -> None:
+    index_expenses([(expense.id, expense.group_id, expense.description, expense.category_id)])
+
+
+def rebuild_search_index() -> int:
+    """
+    Recreate the index from the expenses table in one statement.
+    Returns the number of indexed expenses.
+    """
+    if not search_enabled():
+        raise AppError("Expense search requires SQLite FTS5", 501)
+
+    db.session.execute(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+    ensure_search_index()
+    db.session.execute(
+        text(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, group_key, description, category_name) "
+            "SELECT e.id, 'g' || e.group_id, COALESCE(e.description, ''), COALESCE(c.name, '') "
+            "FROM expenses e LEFT JOIN categories c ON c.id = e.category_id "
+            "WHERE e.description IS NOT NULL OR c.name IS NOT NULL"
+        )
+    )
+    count = db.session.execute(text(f"SELECT COUNT(*) FROM {SEARCH_TABLE}")).scalar()
+    db.session.commit()
+    return count
+
+
+# =========================
+# Search
+# =========================
+
+def _match_expression(group_id: int, query: str) -> str:
+    terms = _TERM.findall(query.lower())
+    if not terms:
+        raise AppError("q must contain at least one word", 400)
+
+    # Every term must match, as a prefix, in the description or category
+    words = " AND ".join(f'"{term}"*' for term in terms)
+    return (
+        f'group_key : "{_group_key(group_id)}" '
+        f"AND {{description category_name}} : ({words})"
+    )
+
+
+def search_group_expenses(
+    group_id: int,
+    requester_user_id: int,
+    query: str,
+    limit: int,
+    cursor: str | None = None,
+):
+    """
+    Rank a group's expenses by relevance (bm25) to the search words.
+
+    Returns:
+        ([(Expense, User, Category | None)], next_cursor | None)
+    """
+    require_membership(group_id, requester_user_id)
+
+    if not search_enabled():
+        raise AppError("Expense search requires SQLite FTS5", 501)
+
+    after = decode_cursor(cursor, 1)
+    offset = after[0] if after else 0
+    if not isinstance(offset, int) or offset < 0:
+        raise AppError("Invalid cursor", 400)
+
+    ids = [
+        expense_id
+        for (expense_id,) in db.session.execute(
+            text(
+                f"SELECT rowid FROM {SEARCH_TABLE} "
+                f"WHERE {SEARCH_TABLE} MATCH :match "
+                f"ORDER BY {_RANK}, rowid DESC "
+                "LIMIT :limit OFFSET :offset"
+            ),
+            {
+                "match": _match_expression(group_id, query),
+                "limit": limit + 1,
+                "offset": offset,
+            },
+        )
+    ]
+
+    next_cursor = None
+    if len(ids) > limit:
+        ids = ids[:limit]
+        next_cursor = encode_cursor([offset + limit])
+
+    if not ids:
+        return [], None
+
+    rows = (
+        db.session.query(Expense, User, Category)
+        .join(User, User.id == Expense.paid_by_user_id)
+        .outerjoin(Category, Category.id == Expense.category_id)
+        .filter(Expense.id.in_(ids))
+        .all()
+    )
+    position = {expense_id: idx for idx, expense_id in enumerate(ids)}
+    rows.sort(key=lambda row: position[row[0].id])
+
+    return rows, next_cursor
@@ -0,0 +1,230 @@
+import time
+
+from flask import current_app
+
+from app.utils.errors import AppError
+from app.utils.money import cents_to_float
+
+
+# =========================
+# Greedy
+# =========================
+
+def settle_greedy(net: dict[int, int]) -> list[dict]:
+    """
+    Largest debtor pays largest creditor until everyone is even.
+    `net` maps user id to balance in cents.
+    Fast and never more than (participants - 1) transfers.
+    """
+    # Separate creditors (positive) and debtors (negative)
+    creditors = [(uid, amt) for uid, amt in net.items() if amt > 0]
+    debtors = [(uid, -amt) for uid, amt in net.items() if amt < 0]  # store positive debt
+
+    creditors.sort(key=lambda x: x[1], reverse=True)
+    debtors.sort(key=lambda x: x[1], reverse=True)
+
+    settlements = []
+    i = j = 0
+
+    while i < len(debtors) and j < len(creditors):
+        debtor_id, debt_amt = debtors[i]
+        creditor_id, credit_amt = creditors[j]
+
+        pay = min(debt_amt, credit_amt)
+
+        if pay > 0:
+            settlements.append(
+                {
+                    "from_user_id": debtor_id,
+                    "to_user_id": creditor_id,
+                    "amount": cents_to_float(pay),
+                }
+            )
+
+        debt_amt -= pay
+        credit_amt -= pay
+
+        debtors[i] = (debtor_id, debt_amt)
+        creditors[j] = (creditor_id, credit_amt)
+
+        if debtors[i][1] == 0:
+            i += 1
+        if creditors[j][1] == 0:
+            j += 1
+
+    return settlements
+
+
+# =========================
+# Minimum transfers
+# =========================
+
+def _zero_sum_partition(
+    amounts: list[int],
+    deadline: float,
+    max_iterations: int,
+) -> list[list[int]] | None:
+    """
+    Split indexes of `amounts` (summing to zero) into the
+    largest number of disjoint zero-sum subsets. Settling each subset
+    separately needs (size - 1) transfers, so more subsets means fewer
+    transfers overall.
+
+    Bitmask DP over all 2^n subsets (about n * 2^n steps). Returns None
+    when that exceeds max_iterations or the wall-clock deadline passes.
+    """
+    n = len(amounts)
+    size = 1 << n
+
+    if size * n > max_iterations:
+        return None
+
+    sums = [0] * size
+    best = bytearray(size)
+
+    for mask in range(1, size):
+        low = mask & -mask
+        sums[mask] = sums[mask ^ low] + amounts[low.bit_length() - 1]
+
+        top = 0
+        rest = mask
+        while rest:
+            bit = rest & -rest
+            rest ^= bit
+            if best[mask ^ bit] > top:
+                top = best[mask ^ bit]
+
+        best[mask] = top + (1 if sums[mask] == 0 else 0)
+
+        if not mask & 0xFFF and time.perf_counter() > deadline:
+            return None
+
+    # Walk back from the full set, peeling one member at a time along an
+    # optimal chain; every zero-sum prefix closes one subset.
+    order = []
+    mask = size - 1
+    while mask:
+        gain = 1 if sums[mask] == 0 else 0
+        rest = mask
+        while rest:
+            bit = rest & -rest
+            rest ^= bit
+            if best[mask ^ bit] + gain == best[mask]:
+                order.append(bit.bit_length() - 1)
+                mask ^= bit
+                break
+
+    groups = []
+    current = []
+    running = 0
+    for idx in reversed(order):
+        current.append(idx)
+        running += amounts[idx]
+        if running == 0:
+            groups.append(current)
+            current = []
+
+    return groups
+
+
+def solve_min_transfers(
+    net: dict[int, int],
+    time_budget_ms: int,
+    max_iterations: int,
+) -> list[dict] | None:
+    """
+    Exact minimum-transfer settlement, or None if the budget runs out.
+    """
+    deadline = time.perf_counter() + time_budget_ms / 1000
+
+    balances = [(uid, cents) for uid, cents in net.items() if cents]
+
+    # Exact opposites always settle together in some optimal solution,
+    # so pair them off before the exponential search.
+    settlements = []
+    open_credits: dict[int, list[int]] = {}
+    for uid, cents in balances:
+        if cents > 0:
+            open_credits.setdefault(cents, []).append(uid)
+
+    remaining = []
+    for uid, cents in balances:
+        if cents < 0 and open_credits.get(-cents):
+            creditor_id = open_credits[-cents].pop(0)
+            settlements.append(
+                {
+                    "from_user_id": uid,
+                    "to_user_id": creditor_id,
+                    "amount": cents_to_float(-cents),
+                }
+            )
+        elif cents < 0:
+            remaining.append((uid, cents))
+
+    for cents, uids in open_credits.items():
+        remaining.extend((uid, cents) for uid in uids)
+
+    if not remaining:
+        return settlements
+
+    if sum(cents for _, cents in remaining) != 0:
+        # Only closed (zero-sum) systems can be partitioned
+        return None
+
+    groups = _zero_sum_partition(
+        [cents for _, cents in remaining],
+        deadline,
+        max_iterations,
+    )
+    if groups is None:
+        return None
+
+    for group in groups:
+        settlements.extend(
+            settle_greedy(
+                {remaining[idx][0]: remaining[idx][1] for idx in group}
+            )
+        )
+
+    return settlements
+
+
+def settle_optimal(
+    net: dict[int, int],
+    time_budget_ms: int,
+    max_iterations: int,
+) -> list[dict]:
+    """
+    Minimum number of transfers when it can be found within budget,
+    otherwise the greedy result.
+    """
+    settlements = solve_min_transfers(net, time_budget_ms, max_iterations)
+    if settlements is None:
+        return settle_greedy(net)
+    return settlements
+
+
+# =========================
+# Strategy selection
+# =========================
+
+SETTLEMENT_STRATEGIES = ("greedy", "optimal")
+
+
+def compute_settlements(net: dict[int, int], strategy: str) -> list[dict]:
+    config = current_app.config
+
+    if strategy == "greedy":
+        return settle_greedy(net)
+
+    if strategy == "optimal":
+        return settle_optimal(
+            net,
+            time_budget_ms=config["SETTLEMENT_TIME_BUDGET_MS"],
+            max_iterations=config["SETTLEMENT_MAX_ITERATIONS"],
+        )
+
+    raise AppError(
+        f"strategy must be one of: {', '.join(SETTLEMENT_STRATEGIES)}",
+        400,
+    )
@@ -0,0 +1,86 @@
+"""
+In-process caches.
+
+Entries are mostly not invalidated in place: callers put a version in
+the key (see users.data_version), so a write simply makes old keys
+unreachable and LRU eviction reclaims them. Group membership is the
+exception: members are only ever added, so a cached set may be missing
+a member but is never wrong, and entries are only ever extended.
+"""
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe, size-bounded mapping with least-recently-used eviction."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, maxsize: int) -> None:
+        """Resize the cache (0 disables it) and drop current entries."""
+        with self._lock:
+            self.maxsize = maxsize
+            self._data.clear()
+
+    def get(self, key, default=None, count: bool = True):
+        """
+        The value for `key`, or `default`. With count=False the lookup is
+        left out of the hit/miss counts, for callers that decide whether
+        the value answered their question and call record() themselves.
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                if count:
+                    self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            if count:
+                self.hits += 1
+            return value
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def set(self, key, value) -> None:
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
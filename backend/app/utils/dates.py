@@ -0,0 +1,75 @@
+from datetime import date, datetime, timedelta, timezone
+
+from app.utils.errors import AppError
+
+
+def default_month() -> str:
+    now = datetime.now(timezone.utc)
+    return f"{now.year:04d}-{now.month:02d}"
+
+
+def month_of(value: datetime | date) -> str:
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+def month_bounds(month: str):
+    """
+    month format: YYYY-MM
+    returns [start, end)
+    """
+    try:
+        year, mon = int(month[:4]), int(month[5:7])
+        if month[4] != "-" or mon < 1 or mon > 12:
+            raise ValueError()
+    except Exception:
+        raise AppError("month must be in YYYY-MM format", 400)
+
+    start = datetime(year, mon, 1, tzinfo=timezone.utc)
+    if mon == 12:
+        end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    else:
+        end = datetime(year, mon + 1, 1, tzinfo=timezone.utc)
+
+    return start, end
+
+
+def next_month(month: str) -> str:
+    return month_of(month_bounds(month)[1])
+
+
+def shift_month(month: str, months: int) -> str:
+    start = month_bounds(month)[0]
+    index = start.year * 12 + start.month - 1 + months
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def month_range(first: str, last: str) -> list[str]:
+    """Every "YYYY-MM" from first to last, inclusive."""
+    months = []
+    month = month_of(month_bounds(first)[0])
+    last = month_of(month_bounds(last)[0])
+    while month <= last:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+
+def start_of_day(value: str, field: str = "date") -> datetime:
+    """
+    value format: YYYY-MM-DD
+    returns midnight UTC at the start of that day
+    """
+    try:
+        day = date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise AppError(f"{field} must be in YYYY-MM-DD format", 400)
+
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def end_of_day(value: str, field: str = "date") -> datetime:
+    """
+    value format: YYYY-MM-DD
+    returns the first instant after that day (UTC), i.e. an exclusive cutoff
+    """
+    return start_of_day(value, field) + timedelta(days=1)
@@ -0,0 +1,143 @@
+"""
+Incremental parsing of a JSON object that arrives in pieces (e.g. LLM
+tokens), emitting values as soon as they are complete.
+"""
+import json
+
+
+class JsonObjectStream:
+    """
+    Feed text chunks of one top-level JSON object; `feed` returns the
+    (key, value) pairs completed by that chunk.
+
+    Scalar and object values of top-level keys are emitted whole. Values
+    that are arrays are emitted element by element, each paired with the
+    array's key, so callers can forward list items before the list closes.
+    Text before the opening brace or after the closing one (such as a
+    ```json fence) is ignored.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.done = False
+
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+
+        self._expect_key = False
+        self._expect_value = False
+        self._key_start: int | None = None
+        self._key: str | None = None
+
+        self._value_start: int | None = None
+        self._value_kind: str | None = None  # "string" | "container" | "primitive"
+        self._value_depth = 0
+
+    def feed(self, chunk: str) -> list[tuple[str, object]]:
+        items: list[tuple[str, object]] = []
+        offset = len(self.text)
+        self.text += chunk
+
+        for i in range(offset, len(self.text)):
+            self._step(i, self.text[i], items)
+
+        return items
+
+    def _capturing(self) -> bool:
+        # A value of a top-level key, or an element of a top-level array
+        if self._value_start is not None:
+            return False
+        if len(self._stack) == 1:
+            return self._expect_value
+        return len(self._stack) == 2 and self._stack[1] == "["
+
+    def _start(self, i: int, kind: str) -> None:
+        self._value_start = i
+        self._value_kind = kind
+        self._value_depth = len(self._stack)
+        self._expect_value = False
+
+    def _emit(self, end: int, items: list) -> None:
+        raw = self.text[self._value_start:end]
+        self._value_start = None
+        self._value_kind = None
+        try:
+            items.append((self._key, json.loads(raw)))
+        except ValueError:
+            pass
+
+    def _step(self, i: int, c: str, items: list) -> None:
+        if self.done:
+            return
+
+        if not self._stack:
+            if c == "{":
+                self._stack.append("{")
+                self._expect_key = True
+            return
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif c == "\\":
+                self._escape = True
+            elif c == '"':
+                self._in_string = False
+                if self._key_start is not None:
+                    self._key = json.loads(self.text[self._key_start:i + 1])
+                    self._key_start = None
+                elif (
+                    self._value_kind == "string"
+                    and len(self._stack) == self._value_depth
+                ):
+                    self._emit(i + 1, items)
+            return
+
+        if (
+            self._value_kind == "primitive"
+            and len(self._stack) == self._value_depth
+            and (c in ",]}" or c.isspace())
+        ):
+            self._emit(i, items)
+
+        if c == '"':
+            self._in_string = True
+            if len(self._stack) == 1 and self._expect_key:
+                self._key_start = i
+                self._expect_key = False
+            elif self._capturing():
+                self._start(i, "string")
+        elif c in "{[":
+            if len(self._stack) == 1 and c == "[":
+                # Top-level array: its elements are emitted one by one
+                self._expect_value = False
+            elif self._capturing():
+                self._start(i, "container")
+            self._stack.append(c)
+        elif c in "}]":
+            self._stack.pop()
+            if (
+                self._value_kind == "container"
+                and len(self._stack) == self._value_depth
+            ):
+                self._emit(i + 1, items)
+            if not self._stack:
+                self.done = True
+        elif c == ",":
+            if len(self._stack) == 1:
+                self._expect_key = True
+        elif c == ":":
+            if len(self._stack) == 1:
+                self._expect_value = True
+        elif not c.isspace():
+            if self._capturing():
+                self._start(i, "primitive")
+
+    def result(self):
+        """Parse the complete object (raises ValueError if incomplete)."""
+        start = self.text.find("{")
+        end = self.text.rfind("}")
+        if start < 0 or end < start:
+            raise ValueError("No JSON object in stream")
+        return json.loads(self.text[start:end + 1])
@@ -0,0 +1,50 @@
+"""
+Money helpers.
+
+Amounts are parsed once at the boundary into integer cents; all split,
+validation and balance arithmetic then runs on plain ints. Conversions
+back to Decimal/float happen only when writing rows or responses.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+
+from app.utils.errors import AppError
+
+TWOPLACES = Decimal("0.01")
+
+
+def to_cents(value) -> int:
+    """
+    Parse a user- or DB-supplied amount into integer cents,
+    rounding half up to two places.
+    """
+    try:
+        dec = Decimal(str(value)).quantize(TWOPLACES, rounding=ROUND_HALF_UP)
+        return int(dec.scaleb(2))
+    except Exception:
+        raise AppError("Invalid amount", 400)
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def cents_to_float(cents: int) -> float:
+    return cents / 100
+
+
+def _div_half_up(cents: int, n: int) -> int:
+    q, r = divmod(abs(cents), n)
+    if 2 * r >= n:
+        q += 1
+    return q if cents >= 0 else -q
+
+
+def split_equal(total_cents: int, n: int) -> list[int]:
+    """
+    Split an amount into n shares of base = round_half_up(total / n).
+    Leftover pennies go one each to the first shares; when base was
+    rounded up there is nothing left over and shares are not reduced.
+    """
+    base = _div_half_up(total_cents, n)
+    pennies = max(total_cents - base * n, 0)
+    return [base + 1 if idx < pennies else base for idx in range(n)]
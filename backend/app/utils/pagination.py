@@ -0,0 +1,46 @@
+import base64
+import json
+
+from flask import current_app
+
+from app.utils.errors import AppError
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, size: int) -> list | None:
+    """
+    Decode an opaque cursor produced by encode_cursor.
+    `size` is the number of keyset values the caller expects.
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError()
+        return values
+    except Exception:
+        raise AppError("Invalid cursor", 400)
+
+
+def page_limit(value) -> int:
+    default = current_app.config["DEFAULT_PAGE_SIZE"]
+    maximum = current_app.config["MAX_PAGE_SIZE"]
+
+    if value in (None, ""):
+        return default
+
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise AppError("limit must be an integer", 400)
+
+    if limit < 1:
+        raise AppError("limit must be >= 1", 400)
+    return min(limit, maximum)
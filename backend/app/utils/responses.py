@@ -1,3 +1,5 @@
+import json
+
 from flask import jsonify
 
 
@@ -22,3 +24,8 @@ def error_response(message, status=400, code="BAD_REQUEST"):
             },
         }
     ), status
+
+
+def sse_event(event: str, data) -> str:
+    """One server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
@@ -0,0 +1,13 @@
+from app.extensions import db
+
+
+def dialect_insert(model):
+    """
+    INSERT for `model` in the bound database's dialect, which adds
+    on_conflict_do_update / on_conflict_do_nothing (SQLite and PostgreSQL).
+    """
+    if db.engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
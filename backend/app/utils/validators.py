@@ -22,3 +22,17 @@ def require_json(body, fields):
             code="VALIDATION_ERROR",
             details={"missing": missing},
         )
+
+
+def optional_int(value, field):
+    if value in (None, ""):
+        return None
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise AppError(
+            f"{field} must be an integer",
+            400,
+            code="VALIDATION_ERROR",
+        )
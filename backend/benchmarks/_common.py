@@ -0,0 +1,90 @@
+"""
+Shared setup for the benchmark scripts.
+
+Run benchmarks from the backend directory, e.g.:
+    python -m benchmarks.bench_balances
+Each run uses a throwaway SQLite database unless DATABASE_URL is set.
+"""
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+
+def create_bench_app():
+    os.environ.setdefault(
+        "DATABASE_URL",
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}",
+    )
+
+    from app import create_app
+    from app.extensions import db
+    from app.services.search_service import ensure_search_index
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        # Created by migration in real deployments
+        ensure_search_index()
+        db.session.commit()
+    return app
+
+
+def create_users(count: int, prefix: str = "user") -> list[int]:
+    from app.extensions import db
+    from app.models.user import User
+
+    db.session.execute(
+        User.__table__.insert(),
+        [{"email": f"{prefix}{i}@bench.local", "name": f"{prefix} {i}"} for i in range(count)],
+    )
+    db.session.commit()
+    return [
+        uid
+        for (uid,) in db.session.query(User.id)
+        .filter(User.email.like(f"{prefix}%@bench.local"))
+        .order_by(User.id)
+    ]
+
+
+def create_group(owner_id: int, member_ids: list[int], name: str = "bench") -> int:
+    from app.extensions import db
+    from app.models.group import Group
+    from app.models.group_member import GroupMember
+
+    group = Group(name=name, created_by_user_id=owner_id, member_count=len(member_ids))
+    db.session.add(group)
+    db.session.flush()
+    db.session.execute(
+        GroupMember.__table__.insert(),
+        [{"group_id": group.id, "user_id": uid} for uid in member_ids],
+    )
+    db.session.commit()
+    return group.id
+
+
+def auth_header(app, user_id: int) -> dict:
+    from flask_jwt_extended import create_access_token
+
+    with app.app_context():
+        token = create_access_token(identity=str(user_id))
+    return {"Authorization": f"Bearer {token}"}
+
+
+@contextmanager
+def timed(results: dict, key: str):
+    start = time.perf_counter()
+    yield
+    results[key] = time.perf_counter() - start
+
+
+def print_table(headers: list[str], rows: list[list]):
+    widths = [
+        max(len(str(h)), *(len(str(r[i])) for r in rows)) if rows else len(str(h))
+        for i, h in enumerate(headers)
+    ]
+    line = "  ".join(str(h).ljust(w) for h, w in zip(headers, widths))
+    print(line)
+    print("-" * len(line))
+    for r in rows:
+        print("  ".join(str(v).ljust(w) for v, w in zip(r, widths)))
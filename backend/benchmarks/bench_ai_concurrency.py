@@ -0,0 +1,111 @@
+"""
+Concurrent POST /ai/insights against the local fake LLM provider, to
+measure the app's own overhead (context building, prompt encoding,
+response cache) separately from model latency.
+
+    python -m benchmarks.bench_ai_concurrency [--requests 200] [--latency-ms 0,200] [--threads 1,8,32]
+"""
+import argparse
+import os
+import statistics
+import threading
+import time
+
+from benchmarks._common import create_bench_app, create_users, create_group, auth_header, print_table
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", default="0,200")
+    parser.add_argument("--threads", default="1,8,32")
+    parser.add_argument("--users", type=int, default=32)
+    args = parser.parse_args()
+
+    os.environ["LLM_PROVIDER"] = "fake"
+    app = create_bench_app()
+
+    with app.app_context():
+        from app.extensions import db
+        from app.models.category import Category
+        from app.models.monthly_budget import MonthlyBudget
+        from app.services.expense_service import create_expense_equal_split
+        from app.utils.dates import default_month
+
+        month = default_month()
+        user_ids = create_users(args.users)
+        group_id = create_group(user_ids[0], user_ids)
+        for i, uid in enumerate(user_ids):
+            category = Category(user_id=uid, name="Dining")
+            db.session.add(category)
+            db.session.flush()
+            db.session.add(
+                MonthlyBudget(user_id=uid, category_id=category.id, month=month, limit_amount=100)
+            )
+            db.session.commit()
+            create_expense_equal_split(
+                group_id, uid, f"user{i}@bench.local", f"{50 + i}.00", "dinner", category.id
+            )
+
+    headers = [auth_header(app, uid) for uid in user_ids]
+
+    rows = []
+    for latency_ms in [int(v) for v in args.latency_ms.split(",")]:
+        app.config["LLM_FAKE_LATENCY_MS"] = latency_ms
+
+        for threads in [int(v) for v in args.threads.split(",")]:
+            latencies: list[float] = []
+            lock = threading.Lock()
+            counter = iter(range(args.requests))
+
+            def worker():
+                client = app.test_client()
+                while True:
+                    with lock:
+                        i = next(counter, None)
+                    if i is None:
+                        return
+                    start = time.perf_counter()
+                    resp = client.post(
+                        "/ai/insights?refresh=true",
+                        json={"month": month},
+                        headers=headers[i % len(headers)],
+                    )
+                    elapsed = (time.perf_counter() - start) * 1000
+                    assert resp.status_code == 200, resp.get_json()
+                    with lock:
+                        latencies.append(elapsed)
+
+            start = time.perf_counter()
+            pool = [threading.Thread(target=worker) for _ in range(threads)]
+            for t in pool:
+                t.start()
+            for t in pool:
+                t.join()
+            wall = time.perf_counter() - start
+
+            p50 = statistics.median(latencies)
+            rows.append(
+                [
+                    latency_ms,
+                    threads,
+                    f"{args.requests / wall:,.0f}",
+                    f"{p50:.1f}",
+                    f"{_percentile(latencies, 0.95):.1f}",
+                    f"{p50 - latency_ms:.1f}",
+                ]
+            )
+
+    print_table(
+        ["model ms", "threads", "req/s", "p50 ms", "p95 ms", "app overhead p50 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Time to first byte of POST /ai/insights/stream versus the blocking
+POST /ai/insights, against a local fake of the OpenAI chat completions
+API that emits tokens at a fixed rate.
+
+    python -m benchmarks.bench_ai_stream [--first-token-ms 400] [--token-ms 15] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks._common import create_bench_app, create_users, create_group, auth_header, print_table
+
+INSIGHTS = {
+    "alerts": [
+        "Dining is 38% over its 250.00 budget",
+        "Transport spending doubled compared with groceries",
+    ],
+    "good_news": ["Groceries stayed 42.10 under budget"],
+    "suggestions": [
+        "Cap dining at 60.00 a week to get back under budget",
+        "Settle the 85.00 you owe in Flatmates",
+    ],
+    "summary": "Overspent on dining, otherwise on track.",
+}
+
+
+def make_fake_openai(first_token_ms: int, token_ms: int):
+    content = json.dumps(INSIGHTS)
+    # Roughly 4 characters per token
+    tokens = [content[i:i + 4] for i in range(0, len(content), 4)]
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send_json(self, payload: dict):
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(first_token_ms / 1000)
+
+            if not request.get("stream"):
+                time.sleep(token_ms * len(tokens) / 1000)
+                self._send_json(
+                    {
+                        "id": "fake",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": request["model"],
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": content},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    }
+                )
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for token in tokens:
+                chunk = {
+                    "id": "fake",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": request["model"],
+                    "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+                time.sleep(token_ms / 1000)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+            self.close_connection = True
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--first-token-ms", type=int, default=400)
+    parser.add_argument("--token-ms", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    server = make_fake_openai(args.first_token_ms, args.token_ms)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+    os.environ["OPENAI_API_KEY"] = "bench-fake"
+
+    app = create_bench_app()
+    client = app.test_client()
+
+    with app.app_context():
+        from app.extensions import db
+        from app.models.category import Category
+        from app.models.monthly_budget import MonthlyBudget
+        from app.services.expense_service import create_expense_equal_split
+        from app.utils.dates import default_month
+
+        member_ids = create_users(2)
+        group_id = create_group(member_ids[0], member_ids)
+        category = Category(user_id=member_ids[0], name="Dining")
+        db.session.add(category)
+        db.session.flush()
+        db.session.add(
+            MonthlyBudget(
+                user_id=member_ids[0],
+                category_id=category.id,
+                month=default_month(),
+                limit_amount=250,
+            )
+        )
+        db.session.commit()
+        create_expense_equal_split(
+            group_id, member_ids[0], "user0@bench.local", "345.00", "dinner", category.id
+        )
+        month = default_month()
+
+    headers = auth_header(app, member_ids[0])
+    body = {"month": month}
+
+    blocking = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        resp = client.post("/ai/insights?refresh=true", json=body, headers=headers)
+        assert resp.status_code == 200, resp.get_json()
+        blocking.append((time.perf_counter() - start) * 1000)
+
+    first_byte, first_item, total = [], [], []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        resp = client.post(
+            "/ai/insights/stream?refresh=true",
+            json=body,
+            headers=headers,
+            buffered=False,
+        )
+        assert resp.status_code == 200
+        seen_byte = seen_item = None
+        for chunk in resp.response:
+            now = (time.perf_counter() - start) * 1000
+            seen_byte = seen_byte or now
+            if seen_item is None and b"event: item" in chunk:
+                seen_item = now
+        total.append((time.perf_counter() - start) * 1000)
+        first_byte.append(seen_byte)
+        first_item.append(seen_item)
+        resp.close()
+
+    server.shutdown()
+
+    def ms(values):
+        return f"{statistics.median(values):.0f}"
+
+    print(
+        f"fake model: {args.first_token_ms} ms to first token, "
+        f"{args.token_ms} ms per token; median of {args.repeat}\n"
+    )
+    print_table(
+        ["endpoint", "first byte ms", "first item ms", "complete ms"],
+        [
+            ["POST /ai/insights", ms(blocking), ms(blocking), ms(blocking)],
+            ["POST /ai/insights/stream", ms(first_byte), ms(first_item), ms(total)],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
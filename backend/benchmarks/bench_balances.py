@@ -0,0 +1,127 @@
+"""
+Group net balance computation at increasing history sizes.
+
+Compares the ORM replay loop the balances endpoint used to run with the
+database-side aggregate and the maintained ledger, and checks that all
+three agree to the cent.
+
+    python -m benchmarks.bench_balances [--splits 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from benchmarks._common import create_bench_app, create_users, create_group, print_table
+
+MEMBERS = 10
+
+
+def orm_replay(group_id: int) -> dict[int, Decimal]:
+    """The pre-aggregation implementation: load every row, sum in Python."""
+    from app.models.expense import Expense
+    from app.models.expense_split import ExpenseSplit
+
+    net: dict[int, Decimal] = {}
+    for e in Expense.query.filter_by(group_id=group_id).all():
+        net[e.paid_by_user_id] = net.get(e.paid_by_user_id, Decimal("0.00")) + Decimal(str(e.amount))
+
+    splits = (
+        ExpenseSplit.query
+        .join(Expense, Expense.id == ExpenseSplit.expense_id)
+        .filter(Expense.group_id == group_id)
+        .all()
+    )
+    for s in splits:
+        net[s.user_id] = net.get(s.user_id, Decimal("0.00")) - Decimal(str(s.amount_owed))
+    return net
+
+
+def seed_history(group_id: int, member_ids: list[int], split_count: int, rng: random.Random):
+    from sqlalchemy import func
+    from app.extensions import db
+    from app.models.expense import Expense
+    from app.models.expense_split import ExpenseSplit
+
+    next_id = (db.session.query(func.max(Expense.id)).scalar() or 0) + 1
+    expense_count = split_count // len(member_ids)
+    now = datetime.now(timezone.utc)
+    chunk = 5000
+
+    for start in range(0, expense_count, chunk):
+        expenses, splits = [], []
+        for eid in range(next_id + start, next_id + min(start + chunk, expense_count)):
+            cents = [rng.randint(1, 20000) for _ in member_ids]
+            expenses.append(
+                {
+                    "id": eid,
+                    "group_id": group_id,
+                    "paid_by_user_id": rng.choice(member_ids),
+                    "amount": Decimal(sum(cents)).scaleb(-2),
+                    "created_at": now,
+                }
+            )
+            splits.extend(
+                {"expense_id": eid, "user_id": uid, "amount_owed": Decimal(c).scaleb(-2)}
+                for uid, c in zip(member_ids, cents)
+            )
+        db.session.execute(Expense.__table__.insert(), expenses)
+        db.session.execute(ExpenseSplit.__table__.insert(), splits)
+        db.session.commit()
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--splits", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    rng = random.Random(42)
+
+    from app.services.ledger_service import aggregate_net_balances, rebuild_ledger
+    from app.services.balance_service import _member_balances
+    from app.utils.money import to_cents
+
+    rows = []
+    with app.app_context():
+        member_ids = create_users(MEMBERS)
+
+        for size in args.splits:
+            group_id = create_group(member_ids[0], member_ids, name=f"bench-{size}")
+            seed_history(group_id, member_ids, size, rng)
+            rebuild_ledger(group_id)
+
+            replay, t_replay, m_replay = measure(orm_replay, group_id)
+            agg, t_agg, m_agg = measure(aggregate_net_balances, group_id)
+            (ledger, _), t_ledger, m_ledger = measure(_member_balances, [group_id], "ledger")
+            ledger = ledger[group_id]
+
+            for uid in member_ids:
+                assert to_cents(replay[uid]) == agg[uid] == ledger[uid], uid
+
+            rows.append(
+                [
+                    f"{size:,}",
+                    f"{t_replay * 1000:.1f} ms / {m_replay / 2**20:.1f} MiB",
+                    f"{t_agg * 1000:.1f} ms / {m_agg / 2**20:.2f} MiB",
+                    f"{t_ledger * 1000:.2f} ms / {m_ledger / 2**20:.2f} MiB",
+                ]
+            )
+
+    print_table(["splits", "ORM replay", "SQL aggregate", "ledger"], rows)
+
+
+if __name__ == "__main__":
+    main()
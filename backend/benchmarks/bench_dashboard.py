@@ -0,0 +1,92 @@
+"""
+GET /groups/<id>/dashboard vs the separate calls a group page made
+before (group list, balances, newest expenses).
+
+    python -m benchmarks.bench_dashboard [--members 20] [--expenses 5000] [--groups 50] [--runs 50]
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks._common import create_bench_app, create_users, create_group, auth_header, print_table
+
+
+def _median_ms(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--expenses", type=int, default=5000)
+    parser.add_argument("--groups", type=int, default=50, help="other groups the user is in")
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    random.seed(7)
+
+    with app.app_context():
+        from sqlalchemy import event
+
+        from app.extensions import db
+        from app.services.expense_import_service import import_expenses
+
+        user_ids = create_users(args.members)
+        for i in range(args.groups):
+            create_group(user_ids[0], user_ids[:2], name=f"other {i}")
+        group_id = create_group(user_ids[0], user_ids)
+
+        start = datetime.now(timezone.utc) - timedelta(days=365)
+        rows = (
+            (
+                n,
+                {
+                    "paid_by_email": f"user{random.randrange(args.members)}@bench.local",
+                    "amount": f"{random.randint(100, 20000) / 100:.2f}",
+                    "description": "bench",
+                    "date": (start + timedelta(minutes=n)).date().isoformat(),
+                },
+                None,
+            )
+            for n in range(args.expenses)
+        )
+        import_expenses(group_id, user_ids[0], rows)
+
+        queries = []
+        event.listen(db.engine, "before_cursor_execute", lambda *a: queries.append(1))
+
+    headers = auth_header(app, user_ids[0])
+    client = app.test_client()
+
+    def separate():
+        for path in ("/groups", f"/groups/{group_id}/balances", f"/groups/{group_id}/expenses?limit=10"):
+            assert client.get(path, headers=headers).status_code == 200
+
+    def dashboard():
+        assert client.get(f"/groups/{group_id}/dashboard?expenses=10", headers=headers).status_code == 200
+
+    rows = []
+    for label, fn, requests in (("separate calls", separate, 3), ("dashboard", dashboard, 1)):
+        fn()  # warm caches
+        queries.clear()
+        fn()
+        count = len(queries)
+        rows.append([label, requests, count, f"{_median_ms(fn, args.runs):.2f}"])
+
+    print(
+        f"{args.members} members, {args.expenses} expenses, "
+        f"user in {args.groups + 1} groups; median of {args.runs}\n"
+    )
+    print_table(["path", "requests", "queries", "median ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
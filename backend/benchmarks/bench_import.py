@@ -0,0 +1,75 @@
+"""
+Expense import throughput: one POST /groups/<id>/expenses per row versus
+a single streamed POST /groups/<id>/expenses/import.
+
+    python -m benchmarks.bench_import [--rows 2000] [--members 8]
+"""
+import argparse
+import random
+import time
+
+from benchmarks._common import (
+    create_bench_app,
+    create_users,
+    create_group,
+    auth_header,
+    print_table,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--members", type=int, default=8)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    client = app.test_client()
+    rng = random.Random(11)
+
+    with app.app_context():
+        member_ids = create_users(args.members)
+        per_request_group = create_group(member_ids[0], member_ids, name="per-request")
+        import_group = create_group(member_ids[0], member_ids, name="import")
+
+    headers = auth_header(app, member_ids[0])
+    emails = [f"user{i}@bench.local" for i in range(args.members)]
+    rows = [
+        (rng.choice(emails), f"{rng.randint(100, 50000) / 100:.2f}", f"row {i}")
+        for i in range(args.rows)
+    ]
+
+    start = time.perf_counter()
+    for email, amount, description in rows:
+        resp = client.post(
+            f"/groups/{per_request_group}/expenses",
+            json={"paid_by_email": email, "amount": amount, "description": description},
+            headers=headers,
+        )
+        assert resp.status_code == 201, resp.get_json()
+    per_request = time.perf_counter() - start
+
+    body = "paid_by_email,amount,description\n" + "".join(
+        f"{email},{amount},{description}\n" for email, amount, description in rows
+    )
+    start = time.perf_counter()
+    resp = client.post(
+        f"/groups/{import_group}/expenses/import",
+        data=body.encode(),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    bulk = time.perf_counter() - start
+    result = resp.get_json()["data"]
+    assert result["imported"] == args.rows, result
+
+    print_table(
+        ["path", "rows", "seconds", "rows/second"],
+        [
+            ["POST /expenses per row", args.rows, f"{per_request:.2f}", f"{args.rows / per_request:,.0f}"],
+            ["POST /expenses/import", args.rows, f"{bulk:.2f}", f"{args.rows / bulk:,.0f}"],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
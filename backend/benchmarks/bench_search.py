@@ -0,0 +1,108 @@
+"""
+Expense search latency: the FTS5 index behind
+GET /groups/<id>/expenses/search versus a LIKE '%term%' scan.
+
+    python -m benchmarks.bench_search [--rows 1000000] [--groups 10] [--repeat 20]
+"""
+import argparse
+import random
+import time
+
+from sqlalchemy import or_
+
+from benchmarks._common import create_bench_app, create_users, create_group, print_table
+
+# Small fixed vocabulary for the common words, plus a long tail of rare ones
+COMMON = ["dinner", "taxi", "groceries", "coffee", "rent", "fuel", "tickets", "hotel"]
+
+
+def _description(rng: random.Random) -> str:
+    words = [rng.choice(COMMON), f"w{int(rng.paretovariate(1.2)) % 50000}"]
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    rng = random.Random(5)
+
+    with app.app_context():
+        from app.extensions import db
+        from app.models.user import User
+        from app.models.category import Category
+        from app.models.expense import Expense
+        from app.services.search_service import rebuild_search_index, search_group_expenses
+
+        member_ids = create_users(4)
+        group_ids = [
+            create_group(member_ids[0], member_ids, name=f"search-{i}")
+            for i in range(args.groups)
+        ]
+
+        start = time.perf_counter()
+        batch = []
+        for i in range(args.rows):
+            batch.append(
+                {
+                    "group_id": group_ids[i % args.groups],
+                    "paid_by_user_id": rng.choice(member_ids),
+                    "amount": 1,
+                    "description": _description(rng),
+                }
+            )
+            if len(batch) == 50_000:
+                db.session.execute(Expense.__table__.insert(), batch)
+                batch.clear()
+        if batch:
+            db.session.execute(Expense.__table__.insert(), batch)
+        db.session.commit()
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rebuild_search_index()
+        index = time.perf_counter() - start
+        print(f"loaded {args.rows:,} expenses in {load:.1f}s, indexed in {index:.1f}s\n")
+
+        group_id = group_ids[0]
+
+        def like_search(term: str):
+            pattern = f"%{term}%"
+            return (
+                db.session.query(Expense, User, Category)
+                .join(User, User.id == Expense.paid_by_user_id)
+                .outerjoin(Category, Category.id == Expense.category_id)
+                .filter(Expense.group_id == group_id)
+                .filter(or_(Expense.description.ilike(pattern), Category.name.ilike(pattern)))
+                .order_by(Expense.created_at.desc(), Expense.id.desc())
+                .limit(50)
+                .all()
+            )
+
+        def fts_search(term: str):
+            rows, _ = search_group_expenses(group_id, member_ids[0], term, limit=50)
+            return rows
+
+        methods = [("LIKE '%term%'", like_search), ("FTS5 MATCH", fts_search)]
+        rows = []
+        for label, term in [("common word", "coffee"), ("rare word", "w40"), ("no match", "zzzz")]:
+            timings = []
+            for name, fn in methods:
+                fn(term)
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    hits = len(fn(term))
+                timings.append((time.perf_counter() - start) / args.repeat * 1000)
+                rows.append([label, name, hits, f"{timings[-1]:.2f}"])
+            rows.append(["", "speedup", "", f"{timings[0] / timings[1]:.1f}x"])
+
+        print_table(["query", "method", "hits", "ms/query"], rows)
+
+
+if __name__ == "__main__":
+    main()
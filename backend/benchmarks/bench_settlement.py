@@ -0,0 +1,99 @@
+"""
+Transfer count and solve time of the settlement strategies.
+
+Balances are generated from random whole-dollar expenses so that
+zero-sum subgroups occur the way they do in real groups.
+
+    python -m benchmarks.bench_settlement [--sizes 3 5 ... 60] [--trials 20]
+"""
+import argparse
+import random
+import time
+
+from benchmarks._common import create_bench_app, print_table
+
+
+def random_net(size: int, rng: random.Random) -> dict[int, int]:
+    net = {uid: 0 for uid in range(1, size + 1)}
+    members = list(net)
+
+    for _ in range(size * 3):
+        payer = rng.choice(members)
+        sharers = rng.sample(members, rng.randint(2, min(size, 4)))
+        share = rng.choice([5, 10, 15, 20, 25, 40, 60]) * 100
+        net[payer] += share * len(sharers)
+        for uid in sharers:
+            net[uid] -= share
+
+    return net
+
+
+def check_settles(net: dict[int, int], settlements: list[dict]):
+    left = dict(net)
+    for s in settlements:
+        amount = round(s["amount"] * 100)
+        left[s["from_user_id"]] += amount
+        left[s["to_user_id"]] -= amount
+    assert all(v == 0 for v in left.values()), left
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 5, 8, 10, 12, 15, 20, 30, 45, 60])
+    parser.add_argument("--trials", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    rng = random.Random(7)
+
+    from app.services.settlement_service import settle_greedy, settle_optimal, solve_min_transfers
+
+    rows = []
+    with app.app_context():
+        budget_ms = app.config["SETTLEMENT_TIME_BUDGET_MS"]
+        max_iterations = app.config["SETTLEMENT_MAX_ITERATIONS"]
+
+        for size in args.sizes:
+            greedy_count = optimal_count = solved = 0
+            greedy_time = optimal_time = 0.0
+
+            for _ in range(args.trials):
+                net = random_net(size, rng)
+
+                start = time.perf_counter()
+                greedy = settle_greedy(net)
+                greedy_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                optimal = settle_optimal(net, budget_ms, max_iterations)
+                optimal_time += time.perf_counter() - start
+
+                check_settles(net, greedy)
+                check_settles(net, optimal)
+                assert len(optimal) <= len(greedy)
+
+                greedy_count += len(greedy)
+                optimal_count += len(optimal)
+                if solve_min_transfers(net, budget_ms, max_iterations) is not None:
+                    solved += 1
+
+            rows.append(
+                [
+                    size,
+                    f"{greedy_count / args.trials:.2f}",
+                    f"{optimal_count / args.trials:.2f}",
+                    f"{greedy_time / args.trials * 1000:.3f} ms",
+                    f"{optimal_time / args.trials * 1000:.2f} ms",
+                    f"{solved}/{args.trials}",
+                ]
+            )
+
+    print(f"budget: {budget_ms} ms, {max_iterations:,} iterations")
+    print_table(
+        ["members", "greedy transfers", "optimal transfers", "greedy time", "optimal time", "solved exactly"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""add ai_insight_cache
+
+Revision ID: 022ff1c5adb9
+Revises: 5e0b7d1a9c42
+Create Date: 2026-10-18 18:02:37.615094
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '022ff1c5adb9'
+down_revision = '5e0b7d1a9c42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ai_insight_cache',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('context_hash', sa.String(length=64), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ai_insight_cache', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_ai_insight_cache_context_hash'), ['context_hash'], unique=True)
+        batch_op.create_index(batch_op.f('ix_ai_insight_cache_last_used_at'), ['last_used_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ai_insight_cache', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_ai_insight_cache_last_used_at'))
+        batch_op.drop_index(batch_op.f('ix_ai_insight_cache_context_hash'))
+
+    op.drop_table('ai_insight_cache')
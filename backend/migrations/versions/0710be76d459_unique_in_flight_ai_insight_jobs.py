@@ -0,0 +1,52 @@
+"""allow one in-flight ai_insight_job per user, month and refresh flag
+
+Revision ID: 0710be76d459
+Revises: 980f9d9e7a8b
+Create Date: 2026-10-18 21:40:53.117204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0710be76d459'
+down_revision = '980f9d9e7a8b'
+branch_labels = None
+depends_on = None
+
+IN_FLIGHT = "status IN ('queued', 'running')"
+
+
+def upgrade():
+    # Keep the newest in-flight job of each kind; older duplicates were
+    # started by other processes and are superseded
+    op.execute(
+        f"""
+        UPDATE ai_insight_jobs SET status = 'failed', error = 'Superseded by a newer job'
+        WHERE {IN_FLIGHT}
+          AND EXISTS (
+              SELECT 1 FROM ai_insight_jobs newer
+              WHERE newer.user_id = ai_insight_jobs.user_id
+                AND newer.month = ai_insight_jobs.month
+                AND newer.refresh = ai_insight_jobs.refresh
+                AND newer.status IN ('queued', 'running')
+                AND (newer.created_at > ai_insight_jobs.created_at
+                     OR (newer.created_at = ai_insight_jobs.created_at
+                         AND newer.id > ai_insight_jobs.id))
+          )
+        """
+    )
+
+    op.create_index(
+        'uq_ai_insight_jobs_in_flight',
+        'ai_insight_jobs',
+        ['user_id', 'month', 'refresh'],
+        unique=True,
+        sqlite_where=sa.text(IN_FLIGHT),
+        postgresql_where=sa.text(IN_FLIGHT),
+    )
+
+
+def downgrade():
+    op.drop_index('uq_ai_insight_jobs_in_flight', table_name='ai_insight_jobs')
@@ -0,0 +1,34 @@
+"""add cache_versions
+
+Revision ID: 1b002ec3efa1
+Revises: fe6fc134f7b9
+Create Date: 2026-10-18 19:52:07.114362
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b002ec3efa1'
+down_revision = 'fe6fc134f7b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    op.execute(
+        "INSERT INTO cache_versions (name, version, updated_at) "
+        "VALUES ('group_members', 0, CURRENT_TIMESTAMP)"
+    )
+
+
+def downgrade():
+    op.drop_table('cache_versions')
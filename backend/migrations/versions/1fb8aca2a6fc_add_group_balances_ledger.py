@@ -0,0 +1,58 @@
+"""add group_balances ledger
+
+Revision ID: 1fb8aca2a6fc
+Revises: 7bcaadebdded
+Create Date: 2026-10-18 09:12:04.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1fb8aca2a6fc'
+down_revision = '7bcaadebdded'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('group_balances',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('group_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('net_amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('group_id', 'user_id', name='uq_group_balances_group_user')
+    )
+    with op.batch_alter_table('group_balances', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_group_balances_group_id'), ['group_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_group_balances_user_id'), ['user_id'], unique=False)
+
+    # Backfill from existing history (paid - owed per group member)
+    op.execute(
+        """
+        INSERT INTO group_balances (group_id, user_id, net_amount, updated_at)
+        SELECT group_id, user_id, SUM(amount), CURRENT_TIMESTAMP
+        FROM (
+            SELECT group_id, paid_by_user_id AS user_id, amount
+            FROM expenses
+            UNION ALL
+            SELECT e.group_id, s.user_id, -s.amount_owed
+            FROM expense_splits s
+            JOIN expenses e ON e.id = s.expense_id
+        ) AS history
+        GROUP BY group_id, user_id
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('group_balances', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_group_balances_user_id'))
+        batch_op.drop_index(batch_op.f('ix_group_balances_group_id'))
+
+    op.drop_table('group_balances')
@@ -0,0 +1,26 @@
+"""add users.data_version
+
+Revision ID: 5e0b7d1a9c42
+Revises: a6c44b4d3644
+Create Date: 2026-10-18 17:34:50.208113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b7d1a9c42'
+down_revision = 'a6c44b4d3644'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
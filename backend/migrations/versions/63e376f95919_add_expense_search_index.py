@@ -0,0 +1,43 @@
+"""add expense_search full-text index
+
+Revision ID: 63e376f95919
+Revises: 9c88532a2dc8
+Create Date: 2026-10-18 15:41:08.392211
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '63e376f95919'
+down_revision = '9c88532a2dc8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # FTS5 virtual table; search is SQLite-only
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS expense_search USING fts5("
+        "group_key, description, category_name, "
+        "tokenize='unicode61 remove_diacritics 2')"
+    )
+
+    # Index existing expenses
+    op.execute(
+        "INSERT INTO expense_search (rowid, group_key, description, category_name) "
+        "SELECT e.id, 'g' || e.group_id, COALESCE(e.description, ''), COALESCE(c.name, '') "
+        "FROM expenses e LEFT JOIN categories c ON c.id = e.category_id "
+        "WHERE e.description IS NOT NULL OR c.name IS NOT NULL"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("DROP TABLE IF EXISTS expense_search")
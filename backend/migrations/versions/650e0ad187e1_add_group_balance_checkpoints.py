@@ -0,0 +1,40 @@
+"""add group_balance_checkpoints
+
+Revision ID: 650e0ad187e1
+Revises: 1fb8aca2a6fc
+Create Date: 2026-10-18 13:41:27.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '650e0ad187e1'
+down_revision = '1fb8aca2a6fc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('group_balance_checkpoints',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('group_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('net_amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('group_id', 'month', 'user_id', name='uq_group_balance_checkpoints_group_month_user')
+    )
+    with op.batch_alter_table('group_balance_checkpoints', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_group_balance_checkpoints_user_id'), ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('group_balance_checkpoints', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_group_balance_checkpoints_user_id'))
+
+    op.drop_table('group_balance_checkpoints')
@@ -0,0 +1,69 @@
+"""key monthly_spend_rollups uniqueness on COALESCE(category_id, 0)
+
+Revision ID: 980f9d9e7a8b
+Revises: f8e136f0f7c1
+Create Date: 2026-10-18 21:05:12.402318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '980f9d9e7a8b'
+down_revision = 'f8e136f0f7c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('monthly_spend_rollups', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_monthly_spend_rollups_user_month_category', type_='unique')
+
+    # The old constraint let uncategorized rows repeat; fold duplicates
+    # into the lowest id before the new index rejects them
+    op.execute(
+        """
+        UPDATE monthly_spend_rollups SET
+            total_amount = (
+                SELECT SUM(other.total_amount) FROM monthly_spend_rollups other
+                WHERE other.user_id = monthly_spend_rollups.user_id
+                  AND other.month = monthly_spend_rollups.month
+                  AND other.category_id IS NULL
+            ),
+            expense_count = (
+                SELECT SUM(other.expense_count) FROM monthly_spend_rollups other
+                WHERE other.user_id = monthly_spend_rollups.user_id
+                  AND other.month = monthly_spend_rollups.month
+                  AND other.category_id IS NULL
+            )
+        WHERE category_id IS NULL
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM monthly_spend_rollups
+        WHERE category_id IS NULL
+          AND id NOT IN (
+              SELECT keep_id FROM (
+                  SELECT MIN(id) AS keep_id FROM monthly_spend_rollups
+                  WHERE category_id IS NULL
+                  GROUP BY user_id, month
+              ) keepers
+          )
+        """
+    )
+
+    op.create_index(
+        'uq_monthly_spend_rollups_user_month_category',
+        'monthly_spend_rollups',
+        ['user_id', 'month', sa.text('coalesce(category_id, 0)')],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index('uq_monthly_spend_rollups_user_month_category', table_name='monthly_spend_rollups')
+
+    with op.batch_alter_table('monthly_spend_rollups', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_monthly_spend_rollups_user_month_category', ['user_id', 'month', 'category_id'])
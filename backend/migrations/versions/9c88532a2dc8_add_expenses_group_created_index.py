@@ -0,0 +1,26 @@
+"""add expenses (group_id, created_at, id) index
+
+Revision ID: 9c88532a2dc8
+Revises: 650e0ad187e1
+Create Date: 2026-10-18 15:06:52.117480
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c88532a2dc8'
+down_revision = '650e0ad187e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.create_index('ix_expenses_group_created_id', ['group_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.drop_index('ix_expenses_group_created_id')
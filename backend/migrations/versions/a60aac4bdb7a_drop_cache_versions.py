@@ -0,0 +1,35 @@
+"""drop cache_versions
+
+Revision ID: a60aac4bdb7a
+Revises: 0710be76d459
+Create Date: 2026-10-18 22:10:37.581946
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a60aac4bdb7a'
+down_revision = '0710be76d459'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The membership cache no longer coordinates workers through a shared row
+    op.drop_table('cache_versions')
+
+
+def downgrade():
+    op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    op.execute(
+        "INSERT INTO cache_versions (name, version, updated_at) "
+        "VALUES ('group_members', 0, CURRENT_TIMESTAMP)"
+    )
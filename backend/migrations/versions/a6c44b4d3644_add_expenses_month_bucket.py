@@ -0,0 +1,37 @@
+"""add expenses.month_bucket and payer/month/category index
+
+Revision ID: a6c44b4d3644
+Revises: cc75d34c5844
+Create Date: 2026-10-18 16:58:12.540318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c44b4d3644'
+down_revision = 'cc75d34c5844'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('month_bucket', sa.String(length=7), nullable=True))
+
+    # Backfill from created_at
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("UPDATE expenses SET month_bucket = strftime('%Y-%m', created_at)")
+    else:
+        op.execute("UPDATE expenses SET month_bucket = to_char(created_at, 'YYYY-MM')")
+
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.alter_column('month_bucket', existing_type=sa.String(length=7), nullable=False)
+        batch_op.create_index('ix_expenses_payer_month_category', ['paid_by_user_id', 'month_bucket', 'category_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('expenses', schema=None) as batch_op:
+        batch_op.drop_index('ix_expenses_payer_month_category')
+        batch_op.drop_column('month_bucket')
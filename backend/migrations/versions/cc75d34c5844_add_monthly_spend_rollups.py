@@ -0,0 +1,52 @@
+"""add monthly_spend_rollups
+
+Revision ID: cc75d34c5844
+Revises: 63e376f95919
+Create Date: 2026-10-18 16:20:45.771903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cc75d34c5844'
+down_revision = '63e376f95919'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('monthly_spend_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('expense_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'month', 'category_id', name='uq_monthly_spend_rollups_user_month_category')
+    )
+
+    # Backfill from existing expenses (spend per payer, category and month)
+    if op.get_bind().dialect.name == 'sqlite':
+        month = "strftime('%Y-%m', created_at)"
+    else:
+        month = "to_char(created_at, 'YYYY-MM')"
+
+    op.execute(
+        f"""
+        INSERT INTO monthly_spend_rollups
+            (user_id, category_id, month, total_amount, expense_count, updated_at)
+        SELECT paid_by_user_id, category_id, {month}, SUM(amount), COUNT(*), CURRENT_TIMESTAMP
+        FROM expenses
+        GROUP BY paid_by_user_id, category_id, {month}
+        """
+    )
+
+
+def downgrade():
+    op.drop_table('monthly_spend_rollups')
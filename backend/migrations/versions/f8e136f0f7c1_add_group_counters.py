@@ -0,0 +1,55 @@
+"""add groups member/expense counters and group_members user/group index
+
+Revision ID: f8e136f0f7c1
+Revises: 1b002ec3efa1
+Create Date: 2026-10-18 20:21:40.588129
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f8e136f0f7c1'
+down_revision = '1b002ec3efa1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('groups', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('member_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('expense_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('expense_total', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False))
+
+    # Backfill from existing members and expenses
+    op.execute(
+        """
+        UPDATE groups SET
+            member_count = (
+                SELECT COUNT(*) FROM group_members
+                WHERE group_members.group_id = groups.id
+            ),
+            expense_count = (
+                SELECT COUNT(*) FROM expenses
+                WHERE expenses.group_id = groups.id
+            ),
+            expense_total = COALESCE((
+                SELECT ROUND(SUM(amount), 2) FROM expenses
+                WHERE expenses.group_id = groups.id
+            ), 0)
+        """
+    )
+
+    with op.batch_alter_table('group_members', schema=None) as batch_op:
+        batch_op.create_index('ix_group_members_user_group', ['user_id', 'group_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('group_members', schema=None) as batch_op:
+        batch_op.drop_index('ix_group_members_user_group')
+
+    with op.batch_alter_table('groups', schema=None) as batch_op:
+        batch_op.drop_column('expense_total')
+        batch_op.drop_column('expense_count')
+        batch_op.drop_column('member_count')
@@ -0,0 +1,41 @@
+"""add ai_insight_jobs
+
+Revision ID: fe6fc134f7b9
+Revises: 022ff1c5adb9
+Create Date: 2026-10-18 18:40:16.903527
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'fe6fc134f7b9'
+down_revision = '022ff1c5adb9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ai_insight_jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('refresh', sa.Boolean(), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('result', sa.Text(), nullable=True),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ai_insight_jobs', schema=None) as batch_op:
+        batch_op.create_index('ix_ai_insight_jobs_user_month_status', ['user_id', 'month', 'status'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ai_insight_jobs', schema=None) as batch_op:
+        batch_op.drop_index('ix_ai_insight_jobs_user_month_status')
+
+    op.drop_table('ai_insight_jobs')
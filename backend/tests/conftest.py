@@ -0,0 +1,96 @@
+"""
+Shared fixtures. Every test gets an empty SQLite database, fresh
+process caches and the app config as it was at startup.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+# Config reads the environment at import time
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+os.environ.pop("OPENAI_API_KEY", None)
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-that-is-long-enough-for-hs256")
+
+from sqlalchemy import event, text  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.extensions import db as _db, summary_cache, membership_cache  # noqa: E402
+from app.services.search_service import SEARCH_TABLE, ensure_search_index  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app():
+    app = create_app()
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def db(app):
+    config = dict(app.config)
+
+    with app.app_context():
+        _db.drop_all()
+        _db.session.execute(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+        _db.create_all()
+        ensure_search_index()
+        _db.session.commit()
+        summary_cache.clear()
+        membership_cache.clear()
+
+        yield _db
+
+        _db.session.remove()
+
+    app.config.clear()
+    app.config.update(config)
+
+
+@pytest.fixture
+def client(app, db):
+    return app.test_client()
+
+
+@pytest.fixture
+def register(client):
+    """register(email) -> auth headers for a new user."""
+    def _register(email: str) -> dict:
+        resp = client.post("/auth/register", json={"email": email, "password": "secret"})
+        assert resp.status_code == 201, resp.get_json()
+        token = resp.get_json()["data"]["access_token"]
+        return {"Authorization": f"Bearer {token}"}
+
+    return _register
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements: list[str] = []
+
+    @property
+    def selects(self) -> int:
+        return sum(1 for s in self.statements if s.lstrip().upper().startswith("SELECT"))
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def count_queries(db):
+    """`with count_queries() as q:` records every statement run inside."""
+    @contextmanager
+    def _count():
+        counter = QueryCounter()
+
+        def record(conn, cursor, statement, params, context, executemany):
+            counter.statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            yield counter
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+    return _count
@@ -0,0 +1,187 @@
+from datetime import timedelta
+
+import pytest
+
+from app.models.ai_insight_cache import AiInsightCache
+from app.services.ai_cache_service import get_cached_insights, store_insights
+from app.services.llm_service import FakeProvider
+from app.utils.dates import default_month
+
+
+@pytest.fixture
+def completions(app, db, monkeypatch):
+    """Use the fake provider and record the messages of every completion."""
+    app.config["LLM_PROVIDER"] = "fake"
+    app.config["AI_INSIGHTS_MODE"] = "llm"
+
+    calls = []
+    complete = FakeProvider.complete
+
+    def counting(self, messages, model, temperature):
+        calls.append(messages)
+        return complete(self, messages, model, temperature)
+
+    monkeypatch.setattr(FakeProvider, "complete", counting)
+    return calls
+
+
+@pytest.fixture
+def spender(client, register):
+    """
+    (headers, spend) for a user with a budgeted category and one expense
+    this month; spend(amount) adds another expense.
+    """
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+    category_id = client.post("/categories", json={"name": "Food"}, headers=headers).get_json()["data"]["category"]["id"]
+    client.post("/budgets", json={"category_id": category_id, "limit_amount": "100"}, headers=headers)
+
+    def spend(amount: str):
+        resp = client.post(
+            f"/groups/{group_id}/expenses",
+            json={"paid_by_email": "a@x.com", "amount": amount, "category_id": category_id},
+            headers=headers,
+        )
+        assert resp.status_code == 201, resp.get_json()
+
+    spend("40.00")
+    return headers, spend
+
+
+def _insights(client, headers, refresh=False):
+    url = "/ai/insights?refresh=true" if refresh else "/ai/insights"
+    resp = client.post(url, json={"month": default_month()}, headers=headers)
+    assert resp.status_code == 200, resp.get_json()
+    return resp.get_json()["data"]
+
+
+def test_repeat_request_is_a_cache_hit(client, spender, completions):
+    headers, _ = spender
+    first = _insights(client, headers)
+    second = _insights(client, headers)
+
+    assert second == first
+    assert len(completions) == 1
+
+
+def test_refresh_calls_the_model_again(client, spender, completions):
+    headers, _ = spender
+    _insights(client, headers)
+    _insights(client, headers, refresh=True)
+    _insights(client, headers)
+
+    assert len(completions) == 2
+    assert AiInsightCache.query.count() == 1
+
+
+def test_changed_data_gets_a_new_key(client, spender, completions):
+    headers, spend = spender
+    first = _insights(client, headers)
+    spend("25.00")
+    second = _insights(client, headers)
+
+    assert len(completions) == 2
+    assert completions[0] != completions[1]
+    assert second["summary"] != first["summary"]
+    assert AiInsightCache.query.count() == 2
+
+
+def test_expired_entries_are_recomputed(app, client, spender, completions, db):
+    headers, _ = spender
+    _insights(client, headers)
+
+    ttl = app.config["AI_INSIGHT_CACHE_TTL_SECONDS"]
+    entry = AiInsightCache.query.one()
+    entry.created_at -= timedelta(seconds=ttl + 1)
+    db.session.commit()
+
+    _insights(client, headers)
+
+    assert len(completions) == 2
+    assert AiInsightCache.query.count() == 1
+
+
+def test_size_cap_evicts_least_recently_used(app, db):
+    app.config["AI_INSIGHT_CACHE_MAX_ENTRIES"] = 2
+
+    store_insights("a", {"summary": "a"})
+    store_insights("b", {"summary": "b"})
+    assert get_cached_insights("a") == {"summary": "a"}  # b is now least recent
+    store_insights("c", {"summary": "c"})
+
+    assert sorted(e.context_hash for e in AiInsightCache.query) == ["a", "c"]
+    assert get_cached_insights("b") is None
+
+
+def test_store_replaces_an_existing_entry(app, db):
+    store_insights("a", {"summary": "old"})
+    store_insights("a", {"summary": "new"})
+
+    assert AiInsightCache.query.count() == 1
+    assert get_cached_insights("a") == {"summary": "new"}
+
+
+def test_response_without_summary_is_not_cached(app, client, spender, completions, monkeypatch):
+    app.config["AI_INSIGHTS_MODE"] = "hybrid"
+    headers, _ = spender
+    content = FakeProvider._content
+    monkeypatch.setattr(FakeProvider, "_content", lambda self, messages: '{"alerts": []}')
+
+    resp = client.post("/ai/insights", json={"month": default_month()}, headers=headers)
+    assert resp.status_code == 500
+    assert AiInsightCache.query.count() == 0
+
+    monkeypatch.setattr(FakeProvider, "_content", content)
+    assert isinstance(_insights(client, headers)["summary"], str)
+    assert len(completions) == 2
+
+
+@pytest.mark.parametrize("payload", ['{"alerts": []}', '["summary"]', '{"summary": 1}', "not json"])
+def test_unusable_entry_is_a_miss(client, spender, completions, db, payload):
+    headers, _ = spender
+    first = _insights(client, headers)
+
+    AiInsightCache.query.update({"payload": payload})
+    db.session.commit()
+
+    assert _insights(client, headers) == first
+    assert len(completions) == 2
+    assert get_cached_insights(AiInsightCache.query.one().context_hash) == first
+
+
+def _stream_events(client, headers) -> list[str]:
+    resp = client.post("/ai/insights/stream", json={"month": default_month()}, headers=headers)
+    assert resp.status_code == 200
+    return [line[len("event: "):] for line in resp.get_data(as_text=True).splitlines() if line.startswith("event: ")]
+
+
+@pytest.mark.parametrize("mode", ["llm", "hybrid"])
+def test_stream_asks_the_model_instead_of_replaying_an_unusable_entry(app, client, spender, completions, db, mode):
+    app.config["AI_INSIGHTS_MODE"] = mode
+    headers, _ = spender
+    _insights(client, headers)
+
+    AiInsightCache.query.update({"payload": '["summary"]'})
+    db.session.commit()
+
+    events = _stream_events(client, headers)
+    assert "token" in events
+    assert events[-1] == "done"
+    assert get_cached_insights(AiInsightCache.query.one().context_hash) != ["summary"]
+
+    # The fresh entry is replayed without another request to the model
+    assert "token" not in _stream_events(client, headers)
+
+
+@pytest.mark.parametrize("url", ["/ai/insights", "/ai/insights?async=true", "/ai/insights/stream"])
+@pytest.mark.parametrize("month", ["2026-13", 202601, "Jan"])
+def test_malformed_month_is_rejected_before_any_work(client, spender, completions, url, month):
+    headers, _ = spender
+
+    resp = client.post(url, json={"month": month}, headers=headers)
+
+    assert resp.status_code == 400
+    assert AiInsightCache.query.count() == 0
+    assert completions == []
@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.ai_insight_job import AiInsightJob
+from app.services import ai_job_service
+from app.services.ai_job_service import submit_insight_job
+
+MONTH = "2026-01"
+
+
+@pytest.fixture
+def user_id(register, monkeypatch):
+    """A user, with jobs left queued instead of handed to the executor."""
+    monkeypatch.setattr(ai_job_service, "_enqueue", lambda job_id: None)
+    register("a@x.com")
+    return 1
+
+
+def _start(job: AiInsightJob, db) -> None:
+    job.status = AiInsightJob.STATUS_RUNNING
+    db.session.commit()
+
+
+def test_plain_requests_share_a_job(user_id, db):
+    first = submit_insight_job(user_id, MONTH)
+    second = submit_insight_job(user_id, MONTH)
+
+    assert second.id == first.id
+    assert AiInsightJob.query.count() == 1
+
+
+def test_refresh_upgrades_a_queued_job(user_id, db):
+    plain = submit_insight_job(user_id, MONTH)
+    refreshed = submit_insight_job(user_id, MONTH, refresh=True)
+
+    assert refreshed.id == plain.id
+    assert db.session.get(AiInsightJob, plain.id).refresh is True
+
+
+def test_refresh_behind_a_running_job_gets_its_own(user_id, db):
+    plain = submit_insight_job(user_id, MONTH)
+    _start(plain, db)
+
+    refreshed = submit_insight_job(user_id, MONTH, refresh=True)
+    assert refreshed.id != plain.id
+    assert refreshed.refresh is True
+    assert db.session.get(AiInsightJob, plain.id).refresh is False
+
+    # Later requests of either kind join the refresh job
+    assert submit_insight_job(user_id, MONTH, refresh=True).id == refreshed.id
+    assert submit_insight_job(user_id, MONTH).id == refreshed.id
+
+
+def test_database_rejects_a_second_in_flight_job(user_id, db):
+    submit_insight_job(user_id, MONTH)
+
+    db.session.add(AiInsightJob(user_id=user_id, month=MONTH))
+    with pytest.raises(IntegrityError):
+        db.session.commit()
+    db.session.rollback()
+
+    # Finished jobs do not count
+    AiInsightJob.query.update({"status": AiInsightJob.STATUS_SUCCEEDED})
+    db.session.add(AiInsightJob(user_id=user_id, month=MONTH))
+    db.session.commit()
+
+
+def test_losing_a_cross_process_race_joins_the_winner(user_id, db, monkeypatch):
+    winner = submit_insight_job(user_id, MONTH)
+
+    # The first lookup misses, as if the winner committed just after it
+    join = ai_job_service._join_in_flight
+    calls = []
+
+    def late_join(*args):
+        calls.append(args)
+        return join(*args) if len(calls) > 1 else None
+
+    monkeypatch.setattr(ai_job_service, "_join_in_flight", late_join)
+
+    assert submit_insight_job(user_id, MONTH).id == winner.id
+    assert len(calls) == 2
+    assert AiInsightJob.query.count() == 1
@@ -0,0 +1,113 @@
+"""
+Rule-based insights must agree with the budget summary the app shows.
+"""
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.services.ai_data_service import get_monthly_ai_context
+from app.services.ai_rules_service import NEAR_LIMIT_RATIO, local_insights
+from app.services.budget_service import monthly_summary
+from app.utils.dates import default_month
+
+
+def _spend_for(rng: random.Random, limit_cents: int) -> int:
+    """Spend around the interesting thresholds of a budget."""
+    near = -(-limit_cents * 9 // 10)  # smallest amount at 90%
+    return rng.choice(
+        [
+            0,
+            rng.randint(0, max(near - 1, 0)),
+            near,
+            rng.randint(near, limit_cents),
+            limit_cents,
+            limit_cents + 1,
+            limit_cents + rng.randint(1, 50_000),
+        ]
+    )
+
+
+def _named(items: list[str], names: list[str], phrase: str) -> set[str]:
+    return {name for name in names for item in items if item.startswith(f"{name} {phrase}")}
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_over_and_near_limit_match_the_budget_summary(client, register, db, seed):
+    rng = random.Random(seed)
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+
+    names = [f"cat{i}" for i in range(rng.randint(3, 8))]
+    for name in names:
+        category_id = client.post("/categories", json={"name": name}, headers=headers).get_json()["data"]["category"]["id"]
+
+        if rng.random() < 0.8:
+            limit_cents = rng.choice([0, rng.randint(1, 100), rng.randint(100, 100_000)])
+            resp = client.post(
+                "/budgets",
+                json={"category_id": category_id, "limit_amount": str(Decimal(limit_cents) / 100)},
+                headers=headers,
+            )
+            assert resp.status_code == 200, resp.get_json()
+        else:
+            limit_cents = rng.randint(1, 100_000)  # unbudgeted; spend anyway
+
+        # Reach the spend in one to three expenses
+        remaining = _spend_for(rng, limit_cents)
+        while remaining > 0:
+            part = remaining if rng.random() < 0.5 else rng.randint(1, remaining)
+            resp = client.post(
+                f"/groups/{group_id}/expenses",
+                json={
+                    "paid_by_email": "a@x.com",
+                    "amount": str(Decimal(part) / 100),
+                    "category_id": category_id,
+                },
+                headers=headers,
+            )
+            assert resp.status_code == 201, resp.get_json()
+            remaining -= part
+
+    month = default_month()
+    summary = monthly_summary(1, month)
+    insights = local_insights(get_monthly_ai_context(1, month), 1)
+
+    overspent = {row["category_name"] for row in summary["by_category"] if row["overspent"]}
+    near_limit = {
+        row["category_name"]
+        for row in summary["by_category"]
+        if row["overspent"] is False
+        and row["limit"] > 0
+        and Decimal(str(row["spent"])) >= Decimal(str(row["limit"])) * Decimal(str(NEAR_LIMIT_RATIO))
+    }
+
+    assert _named(insights["alerts"], names, "is over budget") == overspent
+    assert {s.split()[1] for s in insights["suggestions"] if s.startswith("Cut ")} == overspent
+    assert _named(insights["alerts"], names, "is at") == near_limit
+    assert not _named(insights["good_news"], names, "is within budget") & (overspent | near_limit)
+
+
+@pytest.mark.parametrize(
+    "spent, alert",
+    [
+        (89.99, None),
+        (90.00, "food is at 90% of its budget: 10.00 left of 100.00"),
+        (100.00, "food is at 100% of its budget: 0.00 left of 100.00"),
+        (100.01, "food is over budget: spent 100.01 of 100.00 (0.01 over)"),
+    ],
+)
+def test_near_limit_boundaries(spent, alert):
+    data = {
+        "month": "2026-01",
+        "total_spent": spent,
+        "categories": [{"category": "food", "limit": 100.0, "spent": spent}],
+        "group_balances": [],
+    }
+
+    insights = local_insights(data, 1)
+
+    assert insights["alerts"] == ([alert] if alert else [])
+    assert bool(insights["alerts"]) != any(n.startswith("food is within") for n in insights["good_news"])
@@ -0,0 +1,189 @@
+"""
+Group net balances from the grouped SQL aggregate, the ledger and the
+month-end checkpoints must all equal a replay of the stored expenses,
+to the cent.
+"""
+import json
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.models.expense import Expense
+from app.models.expense_split import ExpenseSplit
+from app.models.group_balance import GroupBalance
+from app.models.group_balance_checkpoint import GroupBalanceCheckpoint
+from app.services.balance_service import group_member_balances
+from app.services.checkpoint_service import build_checkpoints, checkpointed_net_balances
+from app.services.ledger_service import aggregate_group_net_balances, check_ledger
+from app.services.settlement_service import settle_greedy
+from app.utils.dates import end_of_day
+from app.utils.money import to_cents
+
+EMAILS = ["a@x.com", "b@x.com", "c@x.com", "d@x.com"]
+
+
+def _cents(rng: random.Random) -> int:
+    # Odd amounts so equal splits leave pennies over
+    return rng.choice([1, 2, rng.randint(3, 999), rng.randint(1_000, 500_000)])
+
+
+def _amount(cents: int) -> str:
+    return str(Decimal(cents) / 100)
+
+
+@pytest.fixture
+def history(client, register):
+    """
+    history(seed) -> (group_id, headers) of a group with random equal,
+    custom and imported expenses, the imported ones backdated into 2025.
+    A fifth member joins last and has no expenses.
+    """
+    def _history(seed: int) -> tuple[int, dict]:
+        rng = random.Random(seed)
+        headers = register(EMAILS[0])
+        for email in EMAILS[1:] + ["late@x.com"]:
+            register(email)
+        group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+        for email in EMAILS[1:]:
+            client.post(f"/groups/{group_id}/members", json={"email": email}, headers=headers)
+
+        for _ in range(rng.randint(10, 25)):
+            cents = _cents(rng)
+            payer = rng.choice(EMAILS)
+
+            if rng.random() < 0.5:
+                resp = client.post(
+                    f"/groups/{group_id}/expenses",
+                    json={"paid_by_email": payer, "amount": _amount(cents)},
+                    headers=headers,
+                )
+            else:
+                owers = rng.sample(EMAILS, rng.randint(1, len(EMAILS)))
+                cuts = sorted(rng.randint(0, cents) for _ in owers[1:])
+                shares = [b - a for a, b in zip([0, *cuts], [*cuts, cents])]
+                resp = client.post(
+                    f"/groups/{group_id}/expenses/custom",
+                    json={
+                        "paid_by_email": payer,
+                        "amount": _amount(cents),
+                        "splits": [
+                            {"email": email, "amount": _amount(share)}
+                            for email, share in zip(owers, shares)
+                        ],
+                    },
+                    headers=headers,
+                )
+            assert resp.status_code == 201, resp.get_json()
+
+        rows = [
+            {
+                "paid_by_email": rng.choice(EMAILS),
+                "amount": _amount(_cents(rng)),
+                "date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            }
+            for _ in range(rng.randint(5, 15))
+        ]
+        resp = client.post(
+            f"/groups/{group_id}/expenses/import",
+            data="".join(json.dumps(row) + "\n" for row in rows),
+            headers={**headers, "Content-Type": "application/x-ndjson"},
+        )
+        assert resp.get_json()["data"]["failed"] == 0
+
+        client.post(f"/groups/{group_id}/members", json={"email": "late@x.com"}, headers=headers)
+        return group_id, headers
+
+    return _history
+
+
+def _replay(group_id: int, until=None) -> dict[int, int]:
+    """
+    Net cents per user from every stored expense and split (created
+    before `until`, if given), in Python.
+    """
+    net: dict[int, int] = {}
+
+    for expense in Expense.query.filter_by(group_id=group_id):
+        if until is not None and expense.created_at >= until.replace(tzinfo=None):
+            continue
+        net[expense.paid_by_user_id] = net.get(expense.paid_by_user_id, 0) + to_cents(expense.amount)
+        for split in ExpenseSplit.query.filter_by(expense_id=expense.id):
+            net[split.user_id] = net.get(split.user_id, 0) - to_cents(split.amount_owed)
+
+    return net
+
+
+def _nonzero(net: dict[int, int]) -> dict[int, int]:
+    return {uid: cents for uid, cents in net.items() if cents}
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_aggregate_and_ledger_match_a_replay(history, db, seed):
+    group_id, _ = history(seed)
+    expected = _nonzero(_replay(group_id))
+
+    assert _nonzero(aggregate_group_net_balances([group_id])[group_id]) == expected
+
+    ledger = {r.user_id: to_cents(r.net_amount) for r in GroupBalance.query.filter_by(group_id=group_id)}
+    assert _nonzero(ledger) == expected
+    assert check_ledger(group_id) == []
+
+    from_ledger = group_member_balances(group_id, source="ledger")
+    from_aggregate = group_member_balances(group_id, source="aggregate")
+    assert from_aggregate == from_ledger
+    assert [m["net"] for m in from_ledger[0]] == [expected.get(uid, 0) / 100 for uid in range(1, 6)]
+
+
+AS_OF = ["2024-12-31", "2025-01-01", "2025-03-15", "2025-06-30", "2025-12-31", "2026-01-01"]
+
+
+def _as_of(client, headers, group_id: int, day: str) -> list[dict]:
+    resp = client.get(f"/groups/{group_id}/balances?as_of={day}&strategy=greedy", headers=headers)
+    assert resp.status_code == 200, resp.get_json()
+    return resp.get_json()["data"]["settlements"]
+
+
+def _check_as_of(client, headers, group_id: int) -> None:
+    for day in AS_OF:
+        until = end_of_day(day)
+        expected = _nonzero(_replay(group_id, until))
+
+        assert _nonzero(checkpointed_net_balances([group_id], until)[group_id]) == expected, day
+
+        members = {uid: expected.get(uid, 0) for uid in range(1, 6)}
+        want = [{k: s[k] for k in ("from_user_id", "to_user_id", "amount")} for s in settle_greedy(members)]
+        have = [{k: s[k] for k in ("from_user_id", "to_user_id", "amount")} for s in _as_of(client, headers, group_id, day)]
+        assert have == want, day
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_as_of_balances_match_a_replay(client, history, db, seed):
+    group_id, headers = history(seed)
+
+    _check_as_of(client, headers, group_id)  # no checkpoints yet
+    assert build_checkpoints(group_id) > 0
+    _check_as_of(client, headers, group_id)
+
+
+def test_backdated_expense_invalidates_later_checkpoints(client, history, db):
+    group_id, headers = history(0)
+    build_checkpoints(group_id)
+    months = sorted({c.month for c in GroupBalanceCheckpoint.query.filter_by(group_id=group_id)})
+    assert "2025-01" in months and "2025-06" in months
+
+    resp = client.post(
+        f"/groups/{group_id}/expenses/import",
+        data='{"paid_by_email": "b@x.com", "amount": "123.45", "date": "2025-03-10"}\n',
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert resp.get_json()["data"]["imported"] == 1
+
+    left = sorted({c.month for c in GroupBalanceCheckpoint.query.filter_by(group_id=group_id)})
+    assert left == [m for m in months if m < "2025-03"]
+    _check_as_of(client, headers, group_id)
+
+    # Rebuilt checkpoints include the backdated expense
+    build_checkpoints(group_id)
+    assert sorted({c.month for c in GroupBalanceCheckpoint.query.filter_by(group_id=group_id)}) == months
+    _check_as_of(client, headers, group_id)
@@ -0,0 +1,131 @@
+"""
+Budget summaries are cached per (user, month, data_version). Every write
+to a user's expenses, budgets or categories bumps the version, so the
+next summary is recomputed instead of served from the cache.
+"""
+import pytest
+
+from app.extensions import summary_cache
+from app.models.user import User
+
+
+@pytest.fixture
+def user(client, register):
+    """(headers, group_id, category_id) for a@x.com in a group with b."""
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+    category_id = client.post("/categories", json={"name": "Food"}, headers=headers).get_json()["data"]["category"]["id"]
+    return headers, group_id, category_id
+
+
+def _summary(client, headers) -> tuple[dict, str]:
+    """(summary, "hit" or "miss")."""
+    before = summary_cache.stats()
+    resp = client.get("/budgets/summary", headers=headers)
+    assert resp.status_code == 200, resp.get_json()
+    after = summary_cache.stats()
+
+    outcome = "hit" if after["hits"] > before["hits"] else "miss"
+    return resp.get_json()["data"], outcome
+
+
+def _version(db) -> int:
+    return db.session.get(User, 1).data_version
+
+
+def _expense(client, headers, group_id, category_id):
+    resp = client.post(
+        f"/groups/{group_id}/expenses",
+        json={"paid_by_email": "a@x.com", "amount": "12.50", "category_id": category_id},
+        headers=headers,
+    )
+    assert resp.status_code == 201
+
+
+def _expense_paid_by_other(client, headers, group_id, category_id):
+    # a only owes a share; the summary counts what a paid, but the
+    # version still moves
+    resp = client.post(
+        f"/groups/{group_id}/expenses",
+        json={"paid_by_email": "b@x.com", "amount": "12.50"},
+        headers=headers,
+    )
+    assert resp.status_code == 201
+
+
+def _custom_expense(client, headers, group_id, category_id):
+    resp = client.post(
+        f"/groups/{group_id}/expenses/custom",
+        json={
+            "paid_by_email": "a@x.com",
+            "amount": "12.50",
+            "category_id": category_id,
+            "splits": [{"email": "b@x.com", "amount": "12.50"}],
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 201
+
+
+def _imported_expense(client, headers, group_id, category_id):
+    resp = client.post(
+        f"/groups/{group_id}/expenses/import",
+        data=f"paid_by_email,amount,category_id\na@x.com,12.50,{category_id}\n",
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert resp.get_json()["data"]["imported"] == 1
+
+
+def _budget(client, headers, group_id, category_id):
+    resp = client.post("/budgets", json={"category_id": category_id, "limit_amount": "80"}, headers=headers)
+    assert resp.status_code == 200
+
+
+def _category(client, headers, group_id, category_id):
+    resp = client.post("/categories", json={"name": "Travel"}, headers=headers)
+    assert resp.status_code == 201
+
+
+@pytest.mark.parametrize(
+    "write",
+    [_expense, _expense_paid_by_other, _custom_expense, _imported_expense, _budget, _category],
+)
+def test_write_bumps_the_version_and_misses_the_cache(client, user, db, write):
+    headers, group_id, category_id = user
+    _summary(client, headers)
+    before, outcome = _summary(client, headers)
+    assert outcome == "hit"
+    version = _version(db)
+
+    write(client, headers, group_id, category_id)
+
+    assert _version(db) > version
+    after, outcome = _summary(client, headers)
+    assert outcome == "miss"
+    assert after == _summary(client, headers)[0]
+    if write is not _expense_paid_by_other:
+        assert after != before
+
+
+def test_budget_update_misses_the_cache(client, user, db):
+    headers, _, category_id = user
+    client.post("/budgets", json={"category_id": category_id, "limit_amount": "80"}, headers=headers)
+    _summary(client, headers)
+
+    client.post("/budgets", json={"category_id": category_id, "limit_amount": "90"}, headers=headers)
+
+    summary, outcome = _summary(client, headers)
+    assert outcome == "miss"
+    assert summary["by_category"][0]["limit"] == 90
+
+
+def test_other_users_writes_keep_the_cache(client, user, register, db):
+    headers, _, _ = user
+    _summary(client, headers)
+
+    other = register("c@x.com")
+    client.post("/categories", json={"name": "Travel"}, headers=other)
+
+    assert _summary(client, headers)[1] == "hit"
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+from app.models.expense import Expense
+
+
+def _group_with_member(client, register):
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+    return group_id, headers
+
+
+def _import_csv(client, group_id, headers, body):
+    resp = client.post(
+        f"/groups/{group_id}/expenses/import",
+        data=body,
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert resp.status_code == 200, resp.get_json()
+    return resp.get_json()["data"]
+
+
+def test_offset_dates_are_stored_in_utc(client, register, db):
+    group_id, headers = _group_with_member(client, register)
+
+    result = _import_csv(
+        client,
+        group_id,
+        headers,
+        "paid_by_email,amount,description,date\n"
+        "a@x.com,10,late new york,2026-01-31T23:30:00-05:00\n"
+        "a@x.com,10,early utc,2026-02-01T01:00:00Z\n"
+        "a@x.com,10,naive,2026-01-15T12:00:00\n",
+    )
+    assert result["imported"] == 3
+
+    rows = {e.description: e for e in Expense.query.all()}
+
+    assert rows["late new york"].created_at.replace(tzinfo=None) == datetime(2026, 2, 1, 4, 30)
+    assert rows["late new york"].month_bucket == "2026-02"
+    assert rows["early utc"].created_at.replace(tzinfo=None) == datetime(2026, 2, 1, 1, 0)
+    assert rows["naive"].created_at.replace(tzinfo=None) == datetime(2026, 1, 15, 12, 0)
+    assert rows["naive"].month_bucket == "2026-01"
+
+    listed = client.get(f"/groups/{group_id}/expenses", headers=headers).get_json()["data"]["expenses"]
+    assert [e["description"] for e in listed] == ["late new york", "early utc", "naive"]
+
+
+def test_invalid_dates_are_reported_per_row(client, register):
+    group_id, headers = _group_with_member(client, register)
+
+    result = _import_csv(
+        client,
+        group_id,
+        headers,
+        "paid_by_email,amount,date\na@x.com,10,2026-13-01\na@x.com,10,2026-01-02\n",
+    )
+
+    assert result["imported"] == 1
+    assert result["errors"] == [{"row": 1, "message": "date must be an ISO 8601 date or datetime"}]
+
+
+def test_unreadable_csv_rows_are_reported_per_row(client, register, db):
+    group_id, headers = _group_with_member(client, register)
+
+    body = (
+        b"paid_by_email,amount,description\n"
+        b"a@x.com,10,first\n"
+        b"a@x.com,10,caf\xe9\n"
+        b"a@x.com,10," + b"x" * 200_000 + b"\n"
+        b"a@x.com,10,last\n"
+    )
+    result = _import_csv(client, group_id, headers, body)
+
+    assert result["imported"] == 2
+    assert [e["row"] for e in result["errors"]] == [2, 3]
+    assert result["errors"][0]["message"] == "Row is not valid UTF-8"
+    assert result["errors"][1]["message"].startswith("Invalid CSV: field larger than field limit")
+    assert sorted(e.description for e in Expense.query) == ["first", "last"]
+
+
+def test_undecodable_ndjson_lines_are_reported_per_row(client, register, db):
+    group_id, headers = _group_with_member(client, register)
+
+    resp = client.post(
+        f"/groups/{group_id}/expenses/import",
+        data=(
+            b'{"paid_by_email": "a@x.com", "amount": "10", "description": "caf\xe9"}\n'
+            b'{"paid_by_email": "a@x.com", "amount": "10", "description": "ok"}\n'
+        ),
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert resp.status_code == 200, resp.get_json()
+    result = resp.get_json()["data"]
+    assert result["imported"] == 1
+    assert result["errors"] == [{"row": 1, "message": "Row is not valid UTF-8"}]
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from app.models.expense import Expense
+
+
+def _group_with_expenses(client, register, db, created_ats):
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+
+    payer_id = client.get("/auth/me", headers=headers).get_json()["data"]["user"]["id"]
+    expenses = [
+        Expense(
+            group_id=group_id,
+            paid_by_user_id=payer_id,
+            amount=1,
+            description=f"e{i}",
+            created_at=created_at,
+        )
+        for i, created_at in enumerate(created_ats)
+    ]
+    db.session.add_all(expenses)
+    db.session.commit()
+    return group_id, headers
+
+
+def test_pages_walk_ties_in_order(client, register, db):
+    base = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    # Several expenses share a timestamp, so the id tiebreak matters
+    created_ats = [base + timedelta(minutes=i // 3) for i in range(10)]
+    group_id, headers = _group_with_expenses(client, register, db, created_ats)
+
+    seen = []
+    cursor = None
+    while True:
+        url = f"/groups/{group_id}/expenses?limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url, headers=headers).get_json()["data"]
+        seen.extend((e["created_at"], e["id"]) for e in data["expenses"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == 10
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_next_page_seeks_on_group_and_created_at(client, register, db):
+    base = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    group_id, headers = _group_with_expenses(
+        client, register, db, [base + timedelta(minutes=i) for i in range(5)]
+    )
+    cursor = client.get(f"/groups/{group_id}/expenses?limit=2", headers=headers).get_json()["data"]["next_cursor"]
+
+    captured = []
+
+    def record(conn, cursor_, statement, params, context, executemany):
+        if "FROM expenses" in statement and "ORDER BY" in statement:
+            captured.append((statement, params))
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        resp = client.get(f"/groups/{group_id}/expenses?limit=2&cursor={cursor}", headers=headers)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    assert resp.status_code == 200
+
+    (statement, params), = captured
+    with db.engine.connect() as conn:
+        plan = [row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", params)]
+
+    assert any(
+        "ix_expenses_group_created_id (group_id=? AND created_at<?)" in step for step in plan
+    ), plan
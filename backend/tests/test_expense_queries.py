@@ -0,0 +1,62 @@
+"""
+Creating an expense must not issue more SELECTs as the group grows.
+"""
+import pytest
+
+from app.models.user import User
+
+GROUP_SIZES = (2, 10, 100)
+
+
+def _group_of(client, register, db, size: int):
+    owner = f"owner{size}@x.com"
+    headers = register(owner)
+    group_id = client.post("/groups", json={"name": f"g{size}"}, headers=headers).get_json()["data"]["group"]["id"]
+
+    emails = [f"m{size}-{i}@x.com" for i in range(size - 1)]
+    db.session.add_all(User(email=email) for email in emails)
+    db.session.commit()
+
+    resp = client.post(f"/groups/{group_id}/members/bulk", json={"emails": emails}, headers=headers)
+    assert resp.status_code == 200, resp.get_json()
+    return group_id, headers, [owner] + emails
+
+
+def _create_equal(client, group_id, headers, emails):
+    return client.post(
+        f"/groups/{group_id}/expenses",
+        json={"paid_by_email": emails[-1], "amount": "100.00", "description": "dinner"},
+        headers=headers,
+    )
+
+
+def _create_custom(client, group_id, headers, emails):
+    # 1.00 each, the remainder on the payer
+    amount_cents = 100 * len(emails) + 37
+    splits = [{"email": email, "amount": "1.00"} for email in emails]
+    splits[0]["amount"] = "1.37"
+    return client.post(
+        f"/groups/{group_id}/expenses/custom",
+        json={
+            "paid_by_email": emails[0],
+            "amount": f"{amount_cents / 100:.2f}",
+            "splits": splits,
+            "description": "groceries",
+        },
+        headers=headers,
+    )
+
+
+@pytest.mark.parametrize("create", [_create_equal, _create_custom], ids=["equal", "custom"])
+def test_select_count_does_not_grow_with_members(client, register, db, count_queries, create):
+    selects = {}
+
+    for size in GROUP_SIZES:
+        group_id, headers, emails = _group_of(client, register, db, size)
+
+        with count_queries() as queries:
+            resp = create(client, group_id, headers, emails)
+        assert resp.status_code == 201, resp.get_json()
+        selects[size] = queries.selects
+
+    assert len(set(selects.values())) == 1, selects
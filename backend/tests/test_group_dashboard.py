@@ -0,0 +1,23 @@
+def test_dashboard_expenses_match_the_expense_endpoints(client, register, db):
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+    category_id = client.post("/categories", json={"name": "Food"}, headers=headers).get_json()["data"]["category"]["id"]
+
+    created = [
+        client.post(
+            f"/groups/{group_id}/expenses",
+            json={"paid_by_email": payer, "amount": "12.50", "category_id": category},
+            headers=headers,
+        ).get_json()["data"]["expense"]
+        for payer, category in [("a@x.com", category_id), ("b@x.com", None), ("a@x.com", None)]
+    ]
+
+    listed = client.get(f"/groups/{group_id}/expenses", headers=headers).get_json()["data"]["expenses"]
+    dashboard = client.get(f"/groups/{group_id}/dashboard?expenses=2", headers=headers).get_json()["data"]
+
+    assert listed == created[::-1]
+    assert dashboard["expenses"] == listed[:2]
+    assert created[0]["category"] == {"id": category_id, "name": "Food"}
+    assert created[1]["paid_by"]["email"] == "b@x.com"
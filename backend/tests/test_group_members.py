@@ -0,0 +1,76 @@
+"""
+Adding members while another request adds the same users.
+
+The concurrent request is simulated by committing the membership row
+between our membership check and our insert.
+"""
+from app.models.group import Group
+from app.models.group_member import GroupMember
+from app.services import group_service
+
+
+def _group(client, register):
+    headers = register("a@x.com")
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    return group_id, headers
+
+
+def _added_concurrently(db, group_id, user_ids):
+    db.session.add_all(GroupMember(group_id=group_id, user_id=uid) for uid in user_ids)
+    db.session.commit()
+
+
+def test_single_add_racing_another_add(client, register, db, monkeypatch):
+    group_id, headers = _group(client, register)
+    register("b@x.com")
+
+    check = group_service.is_member
+
+    def racing_check(gid, user_id):
+        found = check(gid, user_id)
+        if user_id == 2:
+            _added_concurrently(db, gid, [2])
+        return found
+
+    monkeypatch.setattr(group_service, "is_member", racing_check)
+
+    resp = client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+
+    assert resp.status_code == 201, resp.get_json()
+    assert resp.get_json()["data"]["member"]["email"] == "b@x.com"
+    assert GroupMember.query.filter_by(group_id=group_id).count() == 2
+    # Counted by the request that inserted it, not by this one
+    assert db.session.get(Group, group_id).member_count == 1
+
+
+def test_bulk_add_racing_another_add(client, register, db, monkeypatch):
+    group_id, headers = _group(client, register)
+    for email in ("b@x.com", "c@x.com", "d@x.com"):
+        register(email)
+
+    resolve = group_service.resolve_member_emails
+
+    def racing_resolve(gid, emails):
+        resolved = resolve(gid, emails)
+        _added_concurrently(db, gid, [2, 4])  # b and d
+        return resolved
+
+    monkeypatch.setattr(group_service, "resolve_member_emails", racing_resolve)
+
+    resp = client.post(
+        f"/groups/{group_id}/members/bulk",
+        json={"emails": ["b@x.com", "c@x.com", "d@x.com"]},
+        headers=headers,
+    )
+
+    assert resp.status_code == 200, resp.get_json()
+    data = resp.get_json()["data"]
+    assert [(r["email"], r["status"]) for r in data["results"]] == [
+        ("b@x.com", "already_member"),
+        ("c@x.com", "added"),
+        ("d@x.com", "already_member"),
+    ]
+    assert (data["added"], data["already_member"]) == (1, 2)
+    assert GroupMember.query.filter_by(group_id=group_id).count() == 4
+    # The racing rows were inserted without going through the counters
+    assert db.session.get(Group, group_id).member_count == 2
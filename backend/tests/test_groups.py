@@ -0,0 +1,124 @@
+"""
+Counters kept on the group row, and keyset pagination of /groups.
+"""
+from decimal import Decimal
+
+from sqlalchemy import func
+
+from app.models.expense import Expense
+from app.models.group import Group
+from app.models.group_member import GroupMember
+from app.services import expense_import_service
+
+
+def _counted(db, group_id: int) -> tuple[int, int, Decimal]:
+    """(member_count, expense_count, expense_total) on the group row."""
+    db.session.expire_all()
+    group = db.session.get(Group, group_id)
+    return group.member_count, group.expense_count, group.expense_total
+
+
+def _recounted(db, group_id: int) -> tuple[int, int, Decimal]:
+    """The same three values from the member and expense rows."""
+    members = GroupMember.query.filter_by(group_id=group_id).count()
+    expenses, total = (
+        db.session.query(func.count(Expense.id), func.coalesce(func.sum(Expense.amount), 0))
+        .filter(Expense.group_id == group_id)
+        .one()
+    )
+    return members, expenses, Decimal(str(total)).quantize(Decimal("0.01"))
+
+
+def _create(client, headers, name="g") -> int:
+    resp = client.post("/groups", json={"name": name}, headers=headers)
+    assert resp.status_code == 201, resp.get_json()
+    return resp.get_json()["data"]["group"]["id"]
+
+
+def test_counters_follow_every_write(client, register, db, monkeypatch):
+    headers = register("a@x.com")
+    for email in ("b@x.com", "c@x.com", "d@x.com", "e@x.com"):
+        register(email)
+    group_id = _create(client, headers)
+
+    def check(expected):
+        assert _counted(db, group_id) == _recounted(db, group_id) == expected
+
+    check((1, 0, Decimal("0.00")))
+
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)  # re-add
+    check((2, 0, Decimal("0.00")))
+
+    resp = client.post(
+        f"/groups/{group_id}/members/bulk",
+        json={"emails": ["b@x.com", "c@x.com", "c@x.com", "d@x.com", "nobody@x.com"]},
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.get_json()
+    check((4, 0, Decimal("0.00")))
+
+    client.post(f"/groups/{group_id}/expenses", json={"paid_by_email": "a@x.com", "amount": "10.01"}, headers=headers)
+    client.post(
+        f"/groups/{group_id}/expenses/custom",
+        json={
+            "paid_by_email": "b@x.com",
+            "amount": "5.50",
+            "splits": [{"email": "a@x.com", "amount": "5.50"}],
+        },
+        headers=headers,
+    )
+    client.post(
+        f"/groups/{group_id}/expenses/import",
+        data="paid_by_email,amount\nc@x.com,1.25\nd@x.com,2\nnobody@x.com,3\n",
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    check((4, 4, Decimal("18.76")))
+
+    # Rejected and rolled-back writes leave the counters alone. There is
+    # no delete endpoint for groups, members or expenses.
+    resp = client.post(f"/groups/{group_id}/expenses", json={"paid_by_email": "e@x.com", "amount": "9"}, headers=headers)
+    assert resp.status_code == 400
+
+    def failing_index(rows):
+        raise RuntimeError("index unavailable")
+
+    monkeypatch.setattr(expense_import_service, "index_expenses", failing_index)
+    resp = client.post(
+        f"/groups/{group_id}/expenses/import",
+        data="paid_by_email,amount\na@x.com,7\n",
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert resp.get_json()["data"]["failed"] == 1
+    check((4, 4, Decimal("18.76")))
+
+
+def test_group_pages_are_stable_and_disjoint(client, register, db):
+    headers = register("a@x.com")
+    other = register("b@x.com")
+
+    mine = []
+    for idx in range(7):
+        mine.append(_create(client, headers, f"mine{idx}"))
+        _create(client, other, f"theirs{idx}")
+
+    def page(cursor=None):
+        url = "/groups?limit=3" + (f"&cursor={cursor}" if cursor else "")
+        resp = client.get(url, headers=headers)
+        assert resp.status_code == 200, resp.get_json()
+        data = resp.get_json()["data"]
+        return [g["id"] for g in data["groups"]], data["next_cursor"]
+
+    first, cursor = page()
+    # A group created mid-walk does not shift later pages
+    newest = _create(client, headers, "late")
+    second, cursor = page(cursor)
+    third, cursor = page(cursor)
+
+    assert cursor is None
+    assert [len(p) for p in (first, second, third)] == [3, 3, 1]
+    assert first + second + third == sorted(mine, reverse=True)
+    assert page(None)[0][0] == newest
+
+    listed = client.get("/groups?limit=3", headers=headers).get_json()["data"]["groups"][1]
+    assert (listed["member_count"], listed["expense_count"], listed["expense_total"]) == (1, 0, 0.0)
@@ -0,0 +1,17 @@
+import sys
+
+import pytest
+
+from app.services.llm_service import OpenAIProvider
+from app.utils.errors import AppError
+
+
+def test_missing_openai_package_is_a_503(app, monkeypatch):
+    monkeypatch.setitem(sys.modules, "openai", None)  # import raises ImportError
+    provider = OpenAIProvider("key", None, timeout=1, max_retries=0, retry_base_ms=0)
+
+    with app.app_context(), pytest.raises(AppError) as err:
+        provider.complete([{"role": "user", "content": "hi"}], "model", 0)
+
+    assert err.value.status == 503
+    assert "openai is not installed" in err.value.message
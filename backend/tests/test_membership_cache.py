@@ -0,0 +1,71 @@
+from app.extensions import membership_cache
+from app.models.group_member import GroupMember
+from app.services.membership_cache_service import is_group_member
+
+
+def _group(client, headers, name="g"):
+    return client.post("/groups", json={"name": name}, headers=headers).get_json()["data"]["group"]["id"]
+
+
+def test_member_added_elsewhere_is_found_without_a_reset(client, register, db, count_queries):
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = _group(client, headers)
+    assert is_group_member(group_id, 1)
+
+    # Another worker adds b; this worker's cached set does not know yet
+    db.session.add(GroupMember(group_id=group_id, user_id=2))
+    db.session.commit()
+
+    with count_queries() as queries:
+        assert is_group_member(group_id, 2)
+    assert queries.selects == 1
+    assert membership_cache.get(group_id) == {1, 2}
+
+    with count_queries() as queries:
+        assert is_group_member(group_id, 1)
+        assert is_group_member(group_id, 2)
+    assert len(queries) == 0
+
+
+def test_non_members_are_refused_every_time(client, register, db):
+    headers = register("a@x.com")
+    other = register("b@x.com")
+    group_id = _group(client, headers)
+
+    for _ in range(2):
+        resp = client.get(f"/groups/{group_id}/expenses", headers=other)
+        assert resp.status_code == 403
+    assert not is_group_member(group_id, 2)
+
+
+def test_adding_members_keeps_the_cache(client, register, db):
+    headers = register("a@x.com")
+    register("b@x.com")
+    first, second = _group(client, headers, "first"), _group(client, headers, "second")
+    assert is_group_member(first, 1) and is_group_member(second, 1)
+
+    resp = client.post(f"/groups/{first}/members", json={"email": "b@x.com"}, headers=headers)
+    assert resp.status_code == 201
+
+    # No entry is cleared; b is found by a point query on first access
+    assert membership_cache.get(first) == {1}
+    assert membership_cache.get(second) == {1}
+    assert is_group_member(first, 2)
+    assert client.get(f"/groups/{first}/expenses", headers=register("c@x.com")).status_code == 403
+
+
+def test_hits_count_only_answers_from_the_cached_set(client, register, db):
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = _group(client, headers)
+    assert is_group_member(group_id, 1)
+    db.session.add(GroupMember(group_id=group_id, user_id=2))
+    db.session.commit()
+
+    before = membership_cache.stats()
+    assert is_group_member(group_id, 2)  # entry exists but lacks b
+    assert is_group_member(group_id, 2)
+    after = membership_cache.stats()
+
+    assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (1, 1)
@@ -0,0 +1,75 @@
+"""
+The integer-cents helpers must reproduce the Decimal arithmetic they
+replaced exactly; the reference functions below are that old code.
+"""
+import random
+from decimal import Decimal, ROUND_HALF_UP
+
+import pytest
+
+from app.utils.errors import AppError
+from app.utils.money import cents_to_decimal, split_equal, to_cents
+
+TWOPLACES = Decimal("0.01")
+
+
+def reference_amount(value) -> Decimal:
+    return Decimal(str(value)).quantize(TWOPLACES, rounding=ROUND_HALF_UP)
+
+
+def reference_split(amount: Decimal, n: int) -> list[Decimal]:
+    count = Decimal(n)
+    base = (amount / count).quantize(TWOPLACES, rounding=ROUND_HALF_UP)
+
+    remainder = (amount - base * count).quantize(TWOPLACES)
+    pennies = int(remainder / TWOPLACES) if remainder > 0 else 0
+
+    return [base + (TWOPLACES if idx < pennies else Decimal("0.00")) for idx in range(n)]
+
+
+def random_amount(rng: random.Random):
+    kind = rng.randrange(5)
+    if kind == 0:
+        return rng.randint(-10_000, 1_000_000)
+    if kind == 1:
+        return round(rng.uniform(-1_000, 100_000), rng.randint(0, 4))
+    if kind == 2:
+        return f"{rng.randint(0, 999_999)}.{rng.randint(0, 9999):0{rng.randint(1, 4)}d}"
+    if kind == 3:
+        # Exact half-cent values, where rounding direction matters
+        return f"{rng.randint(0, 99_999)}.{rng.randint(0, 99):02d}5"
+    return str(rng.randint(1, 10 ** 9) / 100)
+
+
+def test_parsing_matches_decimal_reference():
+    rng = random.Random(4)
+
+    for _ in range(20_000):
+        value = random_amount(rng)
+        expected = reference_amount(value)
+
+        cents = to_cents(value)
+        assert cents == int(expected * 100), value
+        assert cents_to_decimal(cents) == expected, value
+
+
+def test_equal_split_matches_decimal_reference():
+    rng = random.Random(40)
+
+    for _ in range(20_000):
+        amount = reference_amount(random_amount(rng))
+        if amount <= 0:
+            continue
+        n = rng.randint(1, 60)
+
+        shares = split_equal(to_cents(amount), n)
+        expected = reference_split(amount, n)
+
+        assert [cents_to_decimal(s) for s in shares] == expected, (amount, n)
+
+
+@pytest.mark.parametrize("value", ["abc", "", None, "1.2.3", [], "NaN"])
+def test_invalid_amounts_are_rejected(value):
+    with pytest.raises(AppError) as err:
+        to_cents(value)
+    assert err.value.status == 400
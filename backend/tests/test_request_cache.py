@@ -0,0 +1,112 @@
+"""
+SELECTs per request for endpoints that share lookups through the
+request cache. Process-wide caches are cleared before each measured
+request unless noted, so the counts only reflect sharing within the
+request.
+"""
+import pytest
+
+from app.extensions import membership_cache, summary_cache
+from app.utils.dates import default_month
+
+
+@pytest.fixture
+def group(client, register):
+    """(group_id, headers, category_id) with members a, b and c."""
+    headers = register("a@x.com")
+    for email in ("b@x.com", "c@x.com", "d@x.com"):
+        register(email)
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    for email in ("b@x.com", "c@x.com"):
+        client.post(f"/groups/{group_id}/members", json={"email": email}, headers=headers)
+    category_id = client.post("/categories", json={"name": "Food"}, headers=headers).get_json()["data"]["category"]["id"]
+    return group_id, headers, category_id
+
+
+@pytest.fixture
+def selects(client, count_queries):
+    """selects(method, url, warm=False, **kwargs) -> (response, SELECT count)."""
+    def _selects(method: str, url: str, warm: bool = False, **kwargs):
+        if not warm:
+            membership_cache.clear()
+            summary_cache.clear()
+        with count_queries() as queries:
+            resp = client.open(url, method=method, **kwargs)
+        assert resp.status_code < 300, resp.get_json()
+        return resp, queries.selects
+
+    return _selects
+
+
+def test_create_expense_with_category(group, selects):
+    group_id, headers, category_id = group
+    _, count = selects(
+        "POST",
+        f"/groups/{group_id}/expenses",
+        json={"paid_by_email": "b@x.com", "amount": "30.00", "category_id": category_id},
+        headers=headers,
+    )
+    assert count == 7
+
+
+def test_membership_check_is_free_once_cached(group, selects):
+    group_id, headers, category_id = group
+    body = {"paid_by_email": "b@x.com", "amount": "30.00", "category_id": category_id}
+
+    _, cold = selects("POST", f"/groups/{group_id}/expenses", json=body, headers=headers)
+    _, warm = selects("POST", f"/groups/{group_id}/expenses", warm=True, json=body, headers=headers)
+    assert warm == cold - 1
+
+
+def test_create_custom_expense(group, selects):
+    group_id, headers, _ = group
+    _, count = selects(
+        "POST",
+        f"/groups/{group_id}/expenses/custom",
+        json={
+            "paid_by_email": "b@x.com",
+            "amount": "30.00",
+            "splits": [
+                {"email": "a@x.com", "amount": "10.00"},
+                {"email": "b@x.com", "amount": "10.00"},
+                {"email": "c@x.com", "amount": "10.00"},
+            ],
+        },
+        headers=headers,
+    )
+    assert count == 5
+
+
+def test_add_member(group, selects):
+    group_id, headers, _ = group
+    _, count = selects("POST", f"/groups/{group_id}/members", json={"email": "d@x.com"}, headers=headers)
+    assert count == 4
+
+
+def test_add_existing_member(group, selects):
+    group_id, headers, _ = group
+    _, count = selects("POST", f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+    assert count == 3
+
+
+def test_balances_as_of(group, selects, client):
+    group_id, headers, _ = group
+    client.post(
+        f"/groups/{group_id}/expenses",
+        json={"paid_by_email": "b@x.com", "amount": "30.00"},
+        headers=headers,
+    )
+    _, count = selects("GET", f"/groups/{group_id}/balances?as_of={default_month()}-28", headers=headers)
+    assert count == 4
+
+
+def test_create_category(group, selects):
+    _, headers, _ = group
+    _, count = selects("POST", "/categories", json={"name": "Travel"}, headers=headers)
+    assert count == 2
+
+
+def test_create_existing_category(group, selects):
+    _, headers, _ = group
+    _, count = selects("POST", "/categories", json={"name": "Food"}, headers=headers)
+    assert count == 1
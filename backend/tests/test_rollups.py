@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.monthly_spend_rollup import MonthlySpendRollup
+from app.services.rollup_service import apply_spend_deltas, verify_rollups
+
+
+def test_uncategorized_spend_shares_one_row(client, register, db):
+    headers = register("a@x.com")
+    register("b@x.com")
+    group_id = client.post("/groups", json={"name": "g"}, headers=headers).get_json()["data"]["group"]["id"]
+    client.post(f"/groups/{group_id}/members", json={"email": "b@x.com"}, headers=headers)
+    category_id = client.post("/categories", json={"name": "Food"}, headers=headers).get_json()["data"]["category"]["id"]
+
+    for amount, category in [("10.00", None), ("2.50", None), ("4.00", category_id), ("1.25", None)]:
+        resp = client.post(
+            f"/groups/{group_id}/expenses",
+            json={"paid_by_email": "a@x.com", "amount": amount, "category_id": category},
+            headers=headers,
+        )
+        assert resp.status_code == 201, resp.get_json()
+
+    rows = {
+        r.category_id: (Decimal(str(r.total_amount)), r.expense_count)
+        for r in MonthlySpendRollup.query
+    }
+    assert rows == {None: (Decimal("13.75"), 3), category_id: (Decimal("4.00"), 1)}
+    assert verify_rollups() == []
+
+
+def test_upsert_accumulates_on_conflict(client, register, db):
+    register("a@x.com")
+
+    apply_spend_deltas({(1, None, "2026-01"): (500, 1)})
+    apply_spend_deltas({(1, None, "2026-01"): (250, 2), (1, None, "2026-02"): (100, 1)})
+    db.session.commit()
+
+    rows = sorted((r.month, Decimal(str(r.total_amount)), r.expense_count) for r in MonthlySpendRollup.query)
+    assert rows == [("2026-01", Decimal("7.50"), 3), ("2026-02", Decimal("1.00"), 1)]
+
+
+def test_duplicate_uncategorized_rows_are_rejected(client, register, db):
+    register("a@x.com")
+
+    for _ in range(2):
+        db.session.add(
+            MonthlySpendRollup(user_id=1, category_id=None, month="2026-01", total_amount=1, expense_count=1)
+        )
+    with pytest.raises(IntegrityError):
+        db.session.commit()
+    db.session.rollback()
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from app.services.settlement_service import settle_greedy, settle_optimal, solve_min_transfers
+from app.utils.money import to_cents
+
+BUDGET_MS = 5_000
+MAX_ITERATIONS = 2_000_000
+
+
+def _random_net(rng: random.Random, n: int) -> dict[int, int]:
+    """Zero-sum balances in cents, some of them exact opposites."""
+    amounts = [rng.randint(-50_000, 50_000) for _ in range(n - 1)]
+    if amounts and rng.random() < 0.5:
+        amounts[-1] = -amounts[0]
+    amounts.append(-sum(amounts))
+    return {uid: cents for uid, cents in enumerate(amounts, start=1)}
+
+
+def _settled(net: dict[int, int], settlements: list[dict]) -> dict[int, int]:
+    left = dict(net)
+    for s in settlements:
+        cents = to_cents(s["amount"])
+        assert cents > 0
+        left[s["from_user_id"]] += cents
+        left[s["to_user_id"]] -= cents
+    return {uid: cents for uid, cents in left.items() if cents}
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_min_transfers_settle_everyone_in_no_more_than_greedy(seed):
+    rng = random.Random(seed)
+    net = _random_net(rng, rng.randint(2, 12))
+
+    settlements = solve_min_transfers(net, BUDGET_MS, MAX_ITERATIONS)
+
+    assert settlements is not None
+    assert _settled(net, settlements) == {}
+    assert len(settlements) <= len(settle_greedy(net))
+
+
+def test_min_transfers_beat_greedy_when_subsets_cancel():
+    # {4, 3, -7} twice: four transfers, where greedy needs five
+    net = {1: 400, 2: 400, 3: 300, 4: 300, 5: -700, 6: -700}
+
+    assert len(settle_greedy(net)) == 5
+    assert len(solve_min_transfers(net, BUDGET_MS, MAX_ITERATIONS)) == 4
+
+
+def test_falls_back_to_greedy_past_the_iteration_budget():
+    net = _random_net(random.Random(1), 12)
+
+    assert solve_min_transfers(net, BUDGET_MS, max_iterations=1_000) is None
+    assert settle_optimal(net, BUDGET_MS, max_iterations=1_000) == settle_greedy(net)
+
+
+def test_falls_back_to_greedy_past_the_time_budget():
+    # 2^16 subsets fit the iteration cap, but not a zero time budget
+    rng = random.Random(2)
+    amounts = [rng.randint(1, 50_000) for _ in range(8)] + [-rng.randint(1, 50_000) for _ in range(7)]
+    net = {uid: cents for uid, cents in enumerate(amounts + [-sum(amounts)], start=1)}
+
+    assert solve_min_transfers(net, 0, MAX_ITERATIONS) is None
+    assert settle_optimal(net, 0, MAX_ITERATIONS) == settle_greedy(net)
+    assert _settled(net, settle_optimal(net, 0, MAX_ITERATIONS)) == {}